@@ -1,11 +1,17 @@
+"""
+The paths and links used throughout Foundry.
+
+This package is imported by every module of Foundry, including the ones parsing the ROM, which should work without Qt,
+so Qt is only imported by the functions, which need it.
+"""
+
 import json
-import urllib.error
-import urllib.request
 from pathlib import Path
-from typing import Union
+from typing import TYPE_CHECKING, Union
 
-from PySide6.QtCore import QUrl
-from PySide6.QtGui import QDesktopServices, QIcon
+if TYPE_CHECKING:
+    from PySide6.QtCore import QUrl
+    from PySide6.QtGui import QIcon
 
 root_dir = Path(__file__).parent
 
@@ -21,6 +27,9 @@ auto_save_rom_path = auto_save_path / "auto_save.nes"
 auto_save_m3l_path = auto_save_path / "auto_save.m3l"
 auto_save_level_data_path = auto_save_path / "level_data.json"
 
+definition_cache_path = home_dir / "definition_cache"
+definition_cache_path.mkdir(parents=True, exist_ok=True)
+
 data_dir = root_dir / "data"
 main_window_flags_path = data_dir / "main_window_flags.json"
 jump_creator_flags_path = data_dir / "jump_creator_flags.json"
@@ -38,10 +47,20 @@ github_link = "https://github.com/TheJoeSmo/Foundry"
 github_issue_link = "https://github.com/TheJoeSmo/Foundry/issues"
 discord_link = "https://discord.gg/pm87gm7"
 
-enemy_compat_link = QUrl.fromLocalFile(str(doc_dir.joinpath("SMB3 enemy compatibility.html")))
 
+def __getattr__(name: str):
+    if name == "enemy_compat_link":
+        from PySide6.QtCore import QUrl
+
+        return QUrl.fromLocalFile(str(doc_dir.joinpath("SMB3 enemy compatibility.html")))
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def open_url(url: Union[str, "QUrl"]):
+    from PySide6.QtCore import QUrl
+    from PySide6.QtGui import QDesktopServices
 
-def open_url(url: Union[str, QUrl]):
     QDesktopServices.openUrl(QUrl(url))
 
 
@@ -52,6 +71,9 @@ def get_current_version_name() -> str:
 
 
 def get_latest_version_name(timeout: int = 10) -> str:
+    import urllib.error
+    import urllib.request
+
     owner = "TheJoeSmo"
     repo = "Foundry"
 
@@ -70,7 +92,9 @@ def get_latest_version_name(timeout: int = 10) -> str:
         raise ValueError("Parsing the received information failed.")
 
 
-def icon(icon_name: str):
+def icon(icon_name: str) -> "QIcon":
+    from PySide6.QtGui import QIcon
+
     icon_path = icon_dir / icon_name
     data_path = data_dir / icon_name
 
@@ -0,0 +1,29 @@
+"""
+The entry point of the ``foundry`` command, which either starts the editor or runs one of the commands, which work
+without it.
+
+The commands are looked up before anything of the editor is imported, so running them does not load the widgets and
+windows of the editor.
+"""
+
+import sys
+
+
+def start():
+    if sys.argv[1:2] == ["render-all"]:
+        from foundry.render_all import start as render_all
+
+        sys.exit(render_all(sys.argv[2:]))
+
+    if sys.argv[1:2] == ["validate"]:
+        from foundry.validate import start as validate
+
+        sys.exit(validate(sys.argv[2:]))
+
+    from foundry.main import start as start_editor
+
+    start_editor()
+
+
+if __name__ == "__main__":
+    start()
@@ -0,0 +1,247 @@
+from collections import OrderedDict, defaultdict
+from typing import Callable, Generic, Hashable, Iterable, Optional, TypeVar
+from weakref import WeakSet
+
+from attr import attrs
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+_caches: "WeakSet[LRUCache]" = WeakSet()
+
+
+@attrs(slots=True, frozen=True, auto_attribs=True)
+class CacheStatistics:
+    """
+    A snapshot of how well a cache is doing.
+
+    Attributes
+    ----------
+    hits: int
+        How often a value was found in the cache.
+    misses: int
+        How often a value was not in the cache.
+    evictions: int
+        How many values were removed, to stay inside the budget of the cache.
+    invalidations: int
+        How many values were removed, because something they were made from changed.
+    entries: int
+        The amount of values inside the cache.
+    size: int
+        The approximate amount of bytes the values of the cache take up.
+    max_size: int
+        The budget of the cache in bytes.
+    """
+
+    hits: int
+    misses: int
+    evictions: int
+    invalidations: int
+    entries: int
+    size: int
+    max_size: int
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+
+        return self.hits / lookups if lookups else 0.0
+
+
+class LRUCache(Generic[K, V]):
+    """
+    A cache, which removes the least recently used values, once its values take up more bytes than its budget.
+
+    Values can be tagged with the things they were made from, like a palette group or a graphics set, so all values
+    made from something, which changed, can be removed at once by :meth:`invalidate`, instead of clearing the whole
+    cache.
+
+    Every cache is registered, so :func:`invalidate_caches` and :func:`get_cache_statistics` reach all of them.
+
+    Attributes
+    ----------
+    name: str
+        The name of the cache, to tell it apart in the statistics.
+    max_size: int
+        The budget of the cache in bytes.
+    size_of: Callable[[V], int]
+        Approximates the amount of bytes a value takes up, when it is added to the cache.
+    hits: int
+        How often a value was found in the cache.
+    misses: int
+        How often a value was not in the cache.
+    evictions: int
+        How many values were removed, to stay inside the budget of the cache.
+    invalidations: int
+        How many values were removed by :meth:`invalidate`.
+    """
+
+    def __init__(self, name: str, max_size: int, size_of: Callable[[V], int] = lambda _: 1):
+        self.name = name
+        self.max_size = max_size
+        self.size_of = size_of
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+        self._entries: OrderedDict[K, tuple[V, int, tuple[Hashable, ...]]] = OrderedDict()
+        self._tagged: defaultdict[Hashable, set[K]] = defaultdict(set)
+        self._size = 0
+
+        _caches.add(self)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.name!r}, {self.max_size})"
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: K) -> bool:
+        return key in self._entries
+
+    @property
+    def size(self) -> int:
+        """
+        The approximate amount of bytes the values of the cache take up.
+        """
+        return self._size
+
+    def get(self, key: K, default: Optional[V] = None) -> Optional[V]:
+        """
+        Provides the value of a key and marks it as the most recently used value.
+
+        Parameters
+        ----------
+        key : K
+            The key of the value.
+        default : Optional[V], optional
+            What to return, if the key is not in the cache, by default None.
+
+        Returns
+        -------
+        Optional[V]
+            The value of the key or the default, if it is not in the cache.
+        """
+        entry = self._entries.get(key)
+
+        if entry is None:
+            self.misses += 1
+            return default
+
+        self.hits += 1
+        self._entries.move_to_end(key)
+
+        return entry[0]
+
+    def put(self, key: K, value: V, tags: Iterable[Hashable] = ()):
+        """
+        Adds a value to the cache and removes the least recently used values, if the cache went over its budget.
+
+        Parameters
+        ----------
+        key : K
+            The key of the value.
+        value : V
+            The value to add.
+        tags : Iterable[Hashable], optional
+            What the value was made from, to remove it with :meth:`invalidate`, by default nothing.
+        """
+        if key in self._entries:
+            self._remove(key)
+
+        size = self.size_of(value)
+        tags = tuple(tags)
+
+        self._entries[key] = value, size, tags
+        self._size += size
+
+        for tag in tags:
+            self._tagged[tag].add(key)
+
+        # the value just added is always kept, even if it is larger than the budget on its own
+        while self._size > self.max_size and len(self._entries) > 1:
+            self._remove(next(iter(self._entries)))
+            self.evictions += 1
+
+    def _remove(self, key: K):
+        _, size, tags = self._entries.pop(key)
+        self._size -= size
+
+        for tag in tags:
+            keys = self._tagged[tag]
+            keys.discard(key)
+
+            if not keys:
+                del self._tagged[tag]
+
+    def invalidate(self, tag: Hashable) -> int:
+        """
+        Removes every value, which was tagged with a tag.
+
+        Parameters
+        ----------
+        tag : Hashable
+            What the values, which should be removed, were made from.
+
+        Returns
+        -------
+        int
+            The amount of values removed.
+        """
+        keys = self._tagged.pop(tag, set())
+
+        for key in keys:
+            if key in self._entries:
+                self._remove(key)
+
+        self.invalidations += len(keys)
+
+        return len(keys)
+
+    def clear(self):
+        """
+        Removes every value of the cache, without touching the statistics.
+        """
+        self._entries.clear()
+        self._tagged.clear()
+        self._size = 0
+
+    @property
+    def statistics(self) -> CacheStatistics:
+        """
+        A snapshot of how well the cache is doing.
+        """
+        return CacheStatistics(
+            self.hits, self.misses, self.evictions, self.invalidations, len(self._entries), self._size, self.max_size
+        )
+
+
+def invalidate_caches(tag: Hashable) -> int:
+    """
+    Removes every value, which was tagged with a tag, from every cache.
+
+    Parameters
+    ----------
+    tag : Hashable
+        What the values, which should be removed, were made from.
+
+    Returns
+    -------
+    int
+        The amount of values removed.
+    """
+    return sum(cache.invalidate(tag) for cache in list(_caches))
+
+
+def get_cache_statistics() -> dict[str, CacheStatistics]:
+    """
+    Provides a snapshot of how well every cache is doing.
+
+    Returns
+    -------
+    dict[str, CacheStatistics]
+        The statistics of every cache by its name.
+    """
+    return {cache.name: cache.statistics for cache in list(_caches)}
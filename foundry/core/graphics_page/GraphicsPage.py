@@ -1,3 +1,4 @@
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Protocol
 
@@ -5,6 +6,7 @@ from attr import attrs
 from pydantic import BaseModel, FilePath
 
 from foundry.core.graphics_page import CHR_ROM_SEGMENT_SIZE
+from foundry.core.LRUCache import invalidate_caches
 from foundry.game.File import ROM, INESHeader
 
 
@@ -45,11 +47,70 @@ class GraphicsPage:
     def offset(self) -> int:
         return ROM().header.program_size + self.index * CHR_ROM_SEGMENT_SIZE + INESHeader.INES_HEADER_SIZE
 
+    @property
+    def buffer(self) -> memoryview:
+        """
+        Provides a read-only view of the bytes of the page, which is only read again once the
+        graphical data of the ROM is changed.
+
+        Returns
+        -------
+        memoryview
+            The bytes of the graphics page.
+        """
+        return memoryview(bytes(self))
+
     def __bytes__(self) -> bytes:
-        if self.path is None:
-            return bytes(ROM().bulk_read(CHR_ROM_SEGMENT_SIZE, self.offset, is_graphics=True))
-        with open(self.path, "rb") as f:
-            return f.read()[CHR_ROM_SEGMENT_SIZE * self.offset : CHR_ROM_SEGMENT_SIZE * (self.offset + 1)]
+        return _load_graphics_page(self, ROM.changes.version_of(self.offset, CHR_ROM_SEGMENT_SIZE))
+
+
+@lru_cache(2**8)
+def _load_graphics_page(page: GraphicsPage, version: int) -> bytes:
+    """
+    Reads the bytes of a graphics page, either from the ROM or from its file.
+
+    Parameters
+    ----------
+    page : GraphicsPage
+        The page to read.
+    version : int
+        The version of the bytes of the page in the ROM, so pages read before a write to them are not reused.
+
+    Returns
+    -------
+    bytes
+        The bytes of the graphics page.
+    """
+    if page.path is None:
+        return bytes(ROM().bulk_read(CHR_ROM_SEGMENT_SIZE, page.offset, is_graphics=True))
+    with open(page.path, "rb") as f:
+        return f.read()[CHR_ROM_SEGMENT_SIZE * page.offset : CHR_ROM_SEGMENT_SIZE * (page.offset + 1)]
+
+
+def _invalidate_written_pages(position: int, count: int):
+    """
+    Removes the values made from graphics pages of the ROM, which were written to, from every cache.
+
+    Parameters
+    ----------
+    position : int
+        The position of the first byte written.
+    count : int
+        The amount of bytes written.
+    """
+    graphics_start, _ = ROM.graphics_range()
+
+    if position + count <= graphics_start:
+        return
+
+    first_page = max(position - graphics_start, 0) // CHR_ROM_SEGMENT_SIZE
+    last_page = (position + count - 1 - graphics_start) // CHR_ROM_SEGMENT_SIZE
+
+    for index in range(first_page, last_page + 1):
+        invalidate_caches(GraphicsPage(index))
+
+
+ROM.changes.subscribe(_invalidate_written_pages)
 
 
 class PydanticGraphicsPage(BaseModel):
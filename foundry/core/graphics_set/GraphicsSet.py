@@ -1,6 +1,7 @@
-from itertools import chain
+from functools import lru_cache
 from typing import Protocol
 
+import numpy as np
 from attr import attrs
 from pydantic import BaseModel
 
@@ -41,8 +42,21 @@ class GraphicsSet:
 
     pages: tuple[GraphicsPageProtocol, ...]
 
+    @property
+    def buffer(self) -> memoryview:
+        """
+        Provides a read-only view of the bytes of every page, which are only joined again once the
+        graphical data of the ROM is changed.
+
+        Returns
+        -------
+        memoryview
+            The bytes of the graphics set.
+        """
+        return memoryview(bytes(self))
+
     def __bytes__(self) -> bytes:
-        return bytes(chain.from_iterable([bytes(page) for page in self.pages]))
+        return _join_graphics_pages(tuple(bytes(page) for page in self.pages))
 
     @classmethod
     def from_tileset(cls, index: int):
@@ -50,6 +64,177 @@ class GraphicsSet:
         return cls(get_graphics_pages_from_tileset(index))
 
 
+@lru_cache(2**6)
+def _join_graphics_pages(pages: tuple[bytes, ...]) -> bytes:
+    """
+    Joins the bytes of the pages of a graphics set into a single copy.
+
+    The pages keep their bytes until they are written to, so the same pages are found by identity, without comparing
+    their bytes, and a write to any of them makes them join again.
+
+    Parameters
+    ----------
+    pages : tuple[bytes, ...]
+        The bytes of every page of the graphics set.
+
+    Returns
+    -------
+    bytes
+        The bytes of every page of the graphics set.
+    """
+    return b"".join(pages)
+
+
+PATTERN_SIZE = 0x10  # bytes, two bit planes of 8 bytes each
+PATTERN_PLANE_SIZE = 8  # bytes
+PATTERN_WIDTH = 8  # pixels
+PATTERN_PIXEL_COUNT = PATTERN_WIDTH * PATTERN_WIDTH
+BLOCK_COUNT = 0x100
+
+
+def _spread_bits(byte: int) -> int:
+    """
+    Spreads each bit of a byte into its own byte, starting with the most significant bit.
+
+    Parameters
+    ----------
+    byte : int
+        The byte to spread.
+
+    Returns
+    -------
+    int
+        An eight byte integer, where each byte is either zero or one.
+    """
+    return int.from_bytes(bytes((byte >> (7 - bit)) & 1 for bit in range(8)), "big")
+
+
+LOW_PLANE_TABLE: tuple[int, ...] = tuple(_spread_bits(byte) for byte in range(0x100))
+HIGH_PLANE_TABLE: tuple[int, ...] = tuple(row << 1 for row in LOW_PLANE_TABLE)
+
+
+def decode_graphics_set(graphics_set: GraphicsSetProtocol) -> bytes:
+    """
+    Decodes every 2bpp planar pattern of a graphics set into color indexes in a single pass.
+
+    Each row of a pattern is resolved with two table lookups, one for each bit plane, instead of
+    testing every pixel individually.
+
+    Parameters
+    ----------
+    graphics_set : GraphicsSetProtocol
+        The graphics set to decode.
+
+    Returns
+    -------
+    bytes
+        A color index from 0 to 3 for every pixel, pattern after pattern, with each pattern
+        being stored row by row.
+    """
+    return _decode_patterns(bytes(graphics_set))
+
+
+@lru_cache(2**6)
+def _decode_patterns(data: bytes) -> bytes:
+    """
+    Decodes the patterns of :func:`decode_graphics_set`, keyed by the bytes themselves so a change
+    to the graphical data is never served from a stale decode.
+
+    Parameters
+    ----------
+    data : bytes
+        The 2bpp planar patterns to decode.
+
+    Returns
+    -------
+    bytes
+        A color index from 0 to 3 for every pixel of the patterns.
+    """
+    pattern_count = len(data) // PATTERN_SIZE
+
+    indexes = bytearray(pattern_count * PATTERN_PIXEL_COUNT)
+
+    for pattern in range(pattern_count):
+        low_plane = pattern * PATTERN_SIZE
+        high_plane = low_plane + PATTERN_PLANE_SIZE
+        start = pattern * PATTERN_PIXEL_COUNT
+
+        for row in range(PATTERN_WIDTH):
+            row_indexes = LOW_PLANE_TABLE[data[low_plane + row]] | HIGH_PLANE_TABLE[data[high_plane + row]]
+            row_start = start + row * PATTERN_WIDTH
+            indexes[row_start : row_start + PATTERN_WIDTH] = row_indexes.to_bytes(PATTERN_WIDTH, "big")
+
+    return bytes(indexes)
+
+
+def mirror_pattern(pattern: bytes) -> bytes:
+    """
+    Horizontally mirrors a decoded pattern.
+
+    Parameters
+    ----------
+    pattern : bytes
+        The color indexes of the pattern, as provided by :func:`decode_graphics_set`.
+
+    Returns
+    -------
+    bytes
+        The color indexes with every row reversed.
+    """
+    return b"".join(pattern[start : start + PATTERN_WIDTH][::-1] for start in range(0, len(pattern), PATTERN_WIDTH))
+
+
+def decode_blocks(graphics_set: GraphicsSetProtocol, tsa_data: bytes) -> np.ndarray:
+    """
+    Decodes every block of a tileset into the color indexes of its pixels, independent of any palette.
+
+    Parameters
+    ----------
+    graphics_set : GraphicsSetProtocol
+        The graphics set the tiles of the blocks are taken from.
+    tsa_data : bytes
+        The TSA table of the object set, which defines the tiles of each block.
+
+    Returns
+    -------
+    np.ndarray
+        A color index from 0 to 3 for every pixel of every block, with the shape ``(256, 16, 16)``. It must not be
+        changed, since it is shared.
+    """
+    return _decode_blocks(decode_graphics_set(graphics_set), tsa_data)
+
+
+@lru_cache(2**4)
+def _decode_blocks(patterns: bytes, tsa_data: bytes) -> np.ndarray:
+    """
+    Decodes the blocks of :func:`decode_blocks`, keyed by the decoded patterns, so a change to the graphical data is
+    never served from stale blocks.
+
+    Parameters
+    ----------
+    patterns : bytes
+        The color indexes of every pattern of the graphics set, as provided by :func:`decode_graphics_set`.
+    tsa_data : bytes
+        The TSA table of the object set, which defines the tiles of each block.
+
+    Returns
+    -------
+    np.ndarray
+        A color index from 0 to 3 for every pixel of every block.
+    """
+    tiles = np.frombuffer(patterns, dtype=np.uint8).reshape(-1, PATTERN_WIDTH, PATTERN_WIDTH)
+
+    # the four banks of the TSA table hold the upper left, lower left, upper right and lower right tiles
+    upper_left, lower_left, upper_right, lower_right = tiles[
+        np.frombuffer(tsa_data, dtype=np.uint8, count=4 * BLOCK_COUNT).reshape(4, BLOCK_COUNT)
+    ]
+
+    color_indexes = np.block([[upper_left, upper_right], [lower_left, lower_right]])
+    color_indexes.setflags(write=False)
+
+    return color_indexes
+
+
 class PydanticGraphicsPage(BaseModel):
     """
     A JSON model of a generic GraphicsSet through Pydantic.
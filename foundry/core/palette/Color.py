@@ -1,9 +1,11 @@
 from functools import cached_property
-from typing import Protocol
+from typing import TYPE_CHECKING, Protocol
 
 from attr import attrs, field, validators
 from pydantic import BaseModel, validator
-from PySide6.QtGui import QColor
+
+if TYPE_CHECKING:
+    from PySide6.QtGui import QColor
 
 
 class ColorProtocol(Protocol):
@@ -13,7 +15,9 @@ class ColorProtocol(Protocol):
     alpha: int
 
     @property
-    def qcolor(self) -> QColor:
+    def qcolor(self) -> "QColor":
+        from PySide6.QtGui import QColor
+
         return QColor(self.red, self.green, self.blue, self.alpha)
 
 
@@ -31,7 +35,9 @@ class Color:
     alpha: int = field(default=255, validator=[validators.instance_of(int), _check_in_color_range])
 
     @property
-    def qcolor(self) -> QColor:
+    def qcolor(self) -> "QColor":
+        from PySide6.QtGui import QColor
+
         return QColor(self.red, self.green, self.blue, self.alpha)
 
 
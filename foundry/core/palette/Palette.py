@@ -1,11 +1,10 @@
 from abc import ABC, abstractmethod
 from enum import Enum
 from functools import cached_property
-from typing import Optional, Protocol, Sequence, Type, TypeVar
+from typing import TYPE_CHECKING, Optional, Protocol, Sequence, Type, TypeVar
 
 from attr import attrs
 from pydantic import BaseModel
-from PySide6.QtGui import QColor
 
 from foundry.core.palette import COLORS_PER_PALETTE
 from foundry.core.palette.ColorPalette import (
@@ -15,6 +14,9 @@ from foundry.core.palette.ColorPalette import (
 )
 from foundry.game.File import ROM
 
+if TYPE_CHECKING:
+    from PySide6.QtGui import QColor
+
 
 class PaletteProtocol(Protocol):
     color_indexes: Sequence[int]
@@ -27,7 +29,7 @@ class PaletteProtocol(Protocol):
         ...
 
     @property
-    def colors(self) -> Sequence[QColor]:
+    def colors(self) -> Sequence["QColor"]:
         ...
 
 
@@ -59,7 +61,7 @@ class AbstractPalette(ABC):
         return self.color_indexes[item]
 
     @property
-    def colors(self) -> Sequence[QColor]:
+    def colors(self) -> Sequence["QColor"]:
         return [
             self.color_palette.colors[index % len(self.color_palette.colors)].qcolor for index in self.color_indexes
         ]
@@ -1,8 +1,8 @@
 from abc import ABC, abstractmethod
-from typing import ClassVar, Protocol, Sequence, Type, TypeVar
+from functools import lru_cache
+from typing import TYPE_CHECKING, ClassVar, Protocol, Sequence, Type, TypeVar
 
 from attr import attrs
-from PySide6.QtGui import QColor
 
 from foundry.core.palette import COLORS_PER_PALETTE, PALETTES_PER_PALETTES_GROUP
 from foundry.core.palette.Palette import (
@@ -14,6 +14,10 @@ from foundry.core.palette.Palette import (
     PaletteProtocol,
 )
 from foundry.core.palette.util import get_internal_palette_offset
+from foundry.game.File import ROM
+
+if TYPE_CHECKING:
+    from PySide6.QtGui import QColor
 
 
 class PaletteGroupProtocol(Protocol):
@@ -30,7 +34,7 @@ class PaletteGroupProtocol(Protocol):
         ...
 
     @property
-    def background_color(self) -> QColor:
+    def background_color(self) -> "QColor":
         ...
 
 
@@ -75,7 +79,7 @@ class AbstractPaletteGroup(ABC):
         return self.palettes[item]
 
     @property
-    def background_color(self) -> QColor:
+    def background_color(self) -> "QColor":
         return self.palettes[0].colors[0]
 
     @classmethod
@@ -200,3 +204,54 @@ class PaletteGroup(AbstractPaletteGroup):
     @classmethod
     def from_values(cls: Type[_PT], *values: PaletteProtocol) -> _PT:
         return cls(tuple(cls.PALETTE_TYPE.from_palette(palette) for palette in values))
+
+
+def get_palette_group_colors(tileset: int, index: int) -> tuple[tuple[int, ...], ...]:
+    """
+    Provides the color indexes of a palette group of a tileset, without reading the ROM again, unless the palette
+    group was written to since.
+
+    Unlike :meth:`AbstractPaletteGroup.from_tileset` this is cheap enough to be called every time something is drawn.
+
+    Parameters
+    ----------
+    tileset : int
+        The index of the tileset.
+    index : int
+        The index of the palette group inside the tileset.
+
+    Returns
+    -------
+    tuple[tuple[int, ...], ...]
+        The indexes into the NES colors of every color of every palette of the palette group.
+    """
+    offset = get_internal_palette_offset(tileset) + index * PALETTES_PER_PALETTES_GROUP * COLORS_PER_PALETTE
+
+    return _read_palette_group_colors(
+        offset, ROM.changes.version_of(offset, PALETTES_PER_PALETTES_GROUP * COLORS_PER_PALETTE)
+    )
+
+
+@lru_cache(2**6)
+def _read_palette_group_colors(offset: int, version: int) -> tuple[tuple[int, ...], ...]:
+    """
+    Reads the color indexes of a palette group from the ROM.
+
+    Parameters
+    ----------
+    offset : int
+        The absolute address of the palette group in the ROM.
+    version : int
+        The version of the palette group inside the ROM, so palette groups read before a write are not reused.
+
+    Returns
+    -------
+    tuple[tuple[int, ...], ...]
+        The indexes into the NES colors of every color of every palette of the palette group.
+    """
+    data = ROM().read(offset, PALETTES_PER_PALETTES_GROUP * COLORS_PER_PALETTE)
+
+    return tuple(
+        tuple(data[start : start + COLORS_PER_PALETTE])
+        for start in range(0, PALETTES_PER_PALETTES_GROUP * COLORS_PER_PALETTE, COLORS_PER_PALETTE)
+    )
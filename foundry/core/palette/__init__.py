@@ -1,8 +1,12 @@
-from PySide6.QtGui import QColor
+from functools import cache
+from typing import TYPE_CHECKING
 
 from foundry import data_dir, root_dir
 from foundry.smb3parse.constants import BASE_OFFSET, Palette_By_Tileset, PalSet_Maps
 
+if TYPE_CHECKING:
+    from PySide6.QtGui import QColor
+
 MAP_PALETTE_ADDRESS = PalSet_Maps
 PRG_SIZE = 0x2000
 PALETTE_PRG_NO = 22
@@ -25,12 +29,36 @@ PALETTE_FILE_PATH = data_dir / "palette.json"
 palette_file = root_dir.joinpath("data", "Default.pal")
 
 PALETTE_FILE_COLOR_OFFSET = 0x18
-offset = 0x18  # first color point
-NESPalette: list[QColor] = []
-with open(palette_file, "rb") as f:
-    color_data = f.read()
 
-for i in range(COLOR_COUNT):
-    NESPalette.append(QColor(color_data[offset], color_data[offset + 1], color_data[offset + 2]))
 
-    offset += BYTES_IN_COLOR
+@cache
+def get_nes_colors() -> tuple[tuple[int, int, int], ...]:
+    """
+    Reads the colors the NES can display from the palette file.
+
+    Returns
+    -------
+    tuple[tuple[int, int, int], ...]
+        The red, green and blue values of every color.
+    """
+    with open(palette_file, "rb") as f:
+        color_data = f.read()
+
+    offsets = range(PALETTE_FILE_COLOR_OFFSET, PALETTE_FILE_COLOR_OFFSET + COLOR_COUNT * BYTES_IN_COLOR, BYTES_IN_COLOR)
+
+    return tuple((color_data[offset], color_data[offset + 1], color_data[offset + 2]) for offset in offsets)
+
+
+@cache
+def _nes_palette() -> list["QColor"]:
+    from PySide6.QtGui import QColor
+
+    return [QColor(*color) for color in get_nes_colors()]
+
+
+def __getattr__(name: str):
+    # the QColors are only created, once something drawing with Qt asks for them
+    if name == "NESPalette":
+        return _nes_palette()
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,4 +1,4 @@
-from functools import cache
+from functools import lru_cache
 
 from foundry.core.palette import (
     PALETTE_BASE_ADDRESS,
@@ -8,7 +8,6 @@ from foundry.core.palette import (
 from foundry.game.File import ROM
 
 
-@cache
 def get_internal_palette_offset(tileset: int) -> int:
     """
     Provides the absolute internal point of the palette group offset from ROM.
@@ -23,4 +22,26 @@ def get_internal_palette_offset(tileset: int) -> int:
     int
         The absolute internal point of the tileset's palette group.
     """
-    return PALETTE_BASE_ADDRESS + ROM().little_endian(PALETTE_OFFSET_LIST + (tileset * PALETTE_OFFSET_SIZE))
+    position = PALETTE_OFFSET_LIST + (tileset * PALETTE_OFFSET_SIZE)
+
+    return _read_internal_palette_offset(position, ROM.changes.version_of(position, PALETTE_OFFSET_SIZE))
+
+
+@lru_cache(2**6)
+def _read_internal_palette_offset(position: int, version: int) -> int:
+    """
+    Reads the offset of a palette group from the ROM.
+
+    Parameters
+    ----------
+    position : int
+        The position of the offset inside the ROM.
+    version : int
+        The version of the offset inside the ROM, so offsets read before a write are not reused.
+
+    Returns
+    -------
+    int
+        The absolute internal point of the palette group.
+    """
+    return PALETTE_BASE_ADDRESS + ROM().little_endian(position)
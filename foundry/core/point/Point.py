@@ -1,7 +1,9 @@
-from typing import Protocol
+from typing import TYPE_CHECKING, Protocol
 
 from attr import attrs
-from PySide6.QtCore import QPoint
+
+if TYPE_CHECKING:
+    from PySide6.QtCore import QPoint
 
 
 class PointProtocol(Protocol):
@@ -38,5 +40,5 @@ class Point:
     y: int
 
     @classmethod
-    def from_qpoint(cls, point: QPoint):
+    def from_qpoint(cls, point: "QPoint"):
         return cls(point.x(), point.y())
@@ -1,9 +1,13 @@
+from typing import TYPE_CHECKING
+
 from foundry.core.warnings.Warning import PydanticWarning, Warning
-from foundry.game.gfx.objects.EnemyItem import EnemyObject
-from foundry.game.gfx.objects.ObjectLike import ObjectLike
+
+if TYPE_CHECKING:
+    from foundry.game.gfx.objects.EnemyItem import EnemyObject
+    from foundry.game.gfx.objects.ObjectLike import ObjectLike
 
 
-def find_incompatibilities(enemies: list[EnemyObject]) -> tuple[bool, bool]:
+def find_incompatibilities(enemies: "list[EnemyObject]") -> tuple[bool, bool]:
     """
     Determines if there are any incompatibilities with enemy graphics.
 
@@ -43,12 +47,57 @@ def find_incompatibilities(enemies: list[EnemyObject]) -> tuple[bool, bool]:
     return has_primary_incompatibilities, has_secondary_incompatibilities
 
 
+def find_incompatible_enemies(enemies: "list[EnemyObject]") -> list[bool]:
+    """
+    Determines for every enemy, if its graphics conflict with the enemies before it.
+
+    This is the same as calling :func:`find_incompatibilities` with every enemy and the enemies before it, but the
+    pages of the earlier enemies are gathered while going through the enemies, so they are only looked at once.
+
+    Parameters
+    ----------
+    enemies : list[EnemyObject]
+        The enemies to check compatibility of, in the order of the level.
+
+    Returns
+    -------
+    list[bool]
+        If there are any incompatibilities between each enemy and the enemies before it.
+    """
+    primary_pages: set[int] = set()
+    secondary_pages: set[int] = set()
+
+    incompatible_enemies = []
+
+    for enemy in enemies:
+        pages = enemy.definition.pages
+
+        primary_page = pages[2] if len(pages) >= 3 else 0
+        secondary_page = pages[3] if len(pages) >= 4 else 0
+
+        incompatible_enemies.append(
+            bool(primary_pages)
+            and primary_page != 0
+            and primary_page not in primary_pages
+            or bool(secondary_pages)
+            and secondary_page != 0
+            and secondary_page not in secondary_pages
+        )
+
+        if primary_page != 0:
+            primary_pages.add(primary_page)
+        if secondary_page != 0:
+            secondary_pages.add(secondary_page)
+
+    return incompatible_enemies
+
+
 class EnemyCompatibilityWarning(Warning):
     """
     A warning to ensure that an that checks that the graphics of enemies do not conflict.
     """
 
-    def check_object(self, obj: EnemyObject, level=None, index=0, *args, **kwargs) -> bool:
+    def check_object(self, obj: "EnemyObject", level=None, index=0, *args, **kwargs) -> bool:
         """
         Determines if the object should emit a warning for having graphical conflicts.
 
@@ -59,7 +108,7 @@ class EnemyCompatibilityWarning(Warning):
         level : Level
             The level the object is housed inside.
         index : int
-            The index into the level enemies obj is housed.
+            The index into the level enemies obj is housed, it is checked against the enemies before it.
 
         Returns
         -------
@@ -68,9 +117,9 @@ class EnemyCompatibilityWarning(Warning):
         """
         if level is None:
             return False
-        return any(find_incompatibilities(level.enemies[:index]))
+        return any(find_incompatibilities(level.enemies[: index + 1]))
 
-    def get_message(self, obj: ObjectLike) -> str:
+    def get_message(self, obj: "ObjectLike") -> str:
         return f"{obj} may have graphical conflicts with other enemies inside the level."
 
 
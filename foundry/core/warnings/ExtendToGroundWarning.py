@@ -1,6 +1,10 @@
+from typing import TYPE_CHECKING
+
 from foundry.core.warnings.Warning import PydanticWarning, Warning
-from foundry.game.gfx.objects.LevelObject import LevelObject
-from foundry.game.gfx.objects.ObjectLike import ObjectLike
+
+if TYPE_CHECKING:
+    from foundry.game.gfx.objects.LevelObject import LevelObject
+    from foundry.game.gfx.objects.ObjectLike import ObjectLike
 
 
 class ExtendToGroundWarning(Warning):
@@ -8,7 +12,7 @@ class ExtendToGroundWarning(Warning):
     A warning to ensure that an object does not extend to the ground.
     """
 
-    def check_object(self, obj: LevelObject, *args, **kwargs) -> bool:
+    def check_object(self, obj: "LevelObject", *args, **kwargs) -> bool:
         """
         Determines if the object should emit a warning for extending to the ground.
 
@@ -24,7 +28,7 @@ class ExtendToGroundWarning(Warning):
         """
         return obj.position.y + obj.rendered_size.height == 27
 
-    def get_message(self, obj: ObjectLike) -> str:
+    def get_message(self, obj: "ObjectLike") -> str:
         return f"{obj} extends until the level bottom. This can crash the game."
 
 
@@ -1,5 +1,9 @@
+from typing import TYPE_CHECKING
+
 from foundry.core.warnings.Warning import PydanticWarning, Warning
-from foundry.game.gfx.objects.ObjectLike import ObjectLike
+
+if TYPE_CHECKING:
+    from foundry.game.gfx.objects.ObjectLike import ObjectLike
 
 
 class InvalidObjectWarning(Warning):
@@ -7,7 +11,7 @@ class InvalidObjectWarning(Warning):
     A warning for an object that is invalid.
     """
 
-    def get_message(self, obj: ObjectLike, *args, **kwargs) -> str:
+    def get_message(self, obj: "ObjectLike", *args, **kwargs) -> str:
         return f"Object at {obj.position.x}, {obj.position.y} will likely cause the game to crash"
 
 
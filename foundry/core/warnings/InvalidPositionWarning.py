@@ -1,9 +1,11 @@
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 from attr import attrs
 
 from foundry.core.warnings.Warning import PydanticWarning, Warning
-from foundry.game.gfx.objects.ObjectLike import ObjectLike
+
+if TYPE_CHECKING:
+    from foundry.game.gfx.objects.ObjectLike import ObjectLike
 
 
 @attrs(slots=True, frozen=True, auto_attribs=True)
@@ -17,7 +19,7 @@ class InvalidPositionWarning(Warning):
     max_y: Optional[int] = None
     min_y: Optional[int] = None
 
-    def check_object(self, obj: ObjectLike, *args, **kwargs) -> bool:
+    def check_object(self, obj: "ObjectLike", *args, **kwargs) -> bool:
         """
         Determines if the object should emit a warning for having an invalid point.
 
@@ -42,7 +44,7 @@ class InvalidPositionWarning(Warning):
             and obj.position.y < self.min_y
         )
 
-    def get_message(self, obj: ObjectLike) -> str:
+    def get_message(self, obj: "ObjectLike") -> str:
         if self.max_x is not None and obj.position.x > self.max_x:
             return f"{obj.name} x point of {obj.position.x} is more than its safe maximum of {self.max_x}."
         if self.min_x is not None and obj.position.x < self.min_x:
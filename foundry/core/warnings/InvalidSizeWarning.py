@@ -1,9 +1,11 @@
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 from attr import attrs
 
 from foundry.core.warnings.Warning import PydanticWarning, Warning
-from foundry.game.gfx.objects.LevelObject import LevelObject
+
+if TYPE_CHECKING:
+    from foundry.game.gfx.objects.LevelObject import LevelObject
 
 
 @attrs(slots=True, frozen=True, auto_attribs=True)
@@ -17,7 +19,7 @@ class InvalidSizeWarning(Warning):
     max_height: Optional[int] = None
     min_height: Optional[int] = None
 
-    def check_object(self, obj: LevelObject, *args, **kwargs) -> bool:
+    def check_object(self, obj: "LevelObject", *args, **kwargs) -> bool:
         """
         Determines if the object should emit a warning for having an invalid size.
 
@@ -42,7 +44,7 @@ class InvalidSizeWarning(Warning):
             and obj.rendered_size.height < self.min_height
         )
 
-    def get_message(self, obj: LevelObject) -> str:
+    def get_message(self, obj: "LevelObject") -> str:
         if self.max_width is not None and obj.rendered_size.width > self.max_width:
             return f"{obj.name} width of {obj.rendered_size.width} is more than its safe maximum of {self.max_width}."
         if self.min_width is not None and obj.rendered_size.width < self.min_width:
@@ -1,6 +1,10 @@
+from typing import TYPE_CHECKING
+
 from foundry.core.warnings.Warning import PydanticWarning, Warning
-from foundry.game.gfx.objects.Jump import Jump
-from foundry.game.gfx.objects.ObjectLike import ObjectLike
+
+if TYPE_CHECKING:
+    from foundry.game.gfx.objects.Jump import Jump
+    from foundry.game.gfx.objects.ObjectLike import ObjectLike
 
 
 class InvalidWarpWarning(Warning):
@@ -8,7 +12,7 @@ class InvalidWarpWarning(Warning):
     A warning for jumps not having a valid warp.
     """
 
-    def check_object(self, obj: Jump, level=None, *args, **kwargs) -> bool:
+    def check_object(self, obj: "Jump", level=None, *args, **kwargs) -> bool:
         """
         Determines if a jump should emit a warning for not having a place to warp to.
 
@@ -30,7 +34,7 @@ class InvalidWarpWarning(Warning):
         """
         return level is not None and not level.has_next_area
 
-    def get_message(self, obj: ObjectLike) -> str:
+    def get_message(self, obj: "ObjectLike") -> str:
         return f"Level has {obj}, but no Jump Destination in Level Header."
 
 
@@ -0,0 +1,140 @@
+import operator
+from typing import TYPE_CHECKING, Optional, Sequence
+
+from foundry.core.warnings.EnemyCompatibilityWarning import (
+    EnemyCompatibilityWarning,
+    find_incompatible_enemies,
+)
+from foundry.core.warnings.Warning import Warning
+
+if TYPE_CHECKING:
+    from foundry.game.gfx.objects.ObjectLike import ObjectLike
+    from foundry.game.level.Level import Level
+
+LevelWarning = tuple[str, list["ObjectLike"]]
+
+
+class LevelWarnings:
+    """
+    Keeps the warnings of a level up to date, by only checking the objects again, which changed since the last update.
+
+    The level reports every object and enemy, which was rendered anew, so only those and the objects, which were added
+    since the last update, are checked for the warnings of their definition. Whether the graphics of the enemies
+    conflict depends on the enemies before them, so it is decided for all enemies at once, by going through them with
+    the pages seen so far, and only if an enemy changed or the enemies were added, removed or reordered. Everything is
+    checked again, if the size of the level or its next area changed, since some warnings depend on them.
+
+    Attributes
+    ----------
+    level: Level
+        The level, whose warnings are kept.
+    warnings: list[tuple[str, list[ObjectLike]]]
+        The message of every warning, which applied to the level at the last update, with the objects it is about.
+    """
+
+    def __init__(self, level: "Level"):
+        self.level = level
+        self.warnings: list[LevelWarning] = []
+
+        self._checked: dict[int, tuple["ObjectLike", list[tuple[Warning, str]]]] = {}
+        self._changed: set[int] = set()
+
+        self._checked_enemies: list["ObjectLike"] = []
+        self._incompatible_enemies: list[bool] = []
+
+        self._level_state: Optional[tuple] = None
+
+        self.level.add_object_listener(self._object_changed)
+
+    def close(self):
+        """
+        Stops following the changes of the level.
+        """
+        self.level.remove_object_listener(self._object_changed)
+
+    def _object_changed(self, obj: "ObjectLike"):
+        self._changed.add(id(obj))
+
+    def _check(self, obj: "ObjectLike") -> list[tuple[Warning, str]]:
+        checked_warnings = []
+
+        for warning in obj.definition.get_warnings():
+            if isinstance(warning, EnemyCompatibilityWarning):
+                # depends on the other enemies, so it is decided in _update_enemy_compatibility
+                checked_warnings.append((warning, warning.get_message(obj)))
+
+            elif warning.check_object(obj, level=self.level):
+                checked_warnings.append((warning, warning.get_message(obj)))
+
+        return checked_warnings
+
+    def _warnings_of(self, obj: "ObjectLike") -> list[tuple[Warning, str]]:
+        if id(obj) in self._changed or id(obj) not in self._checked or self._checked[id(obj)][0] is not obj:
+            self._checked[id(obj)] = obj, self._check(obj)
+
+        return self._checked[id(obj)][1]
+
+    def _update_enemy_compatibility(self, enemies_changed: bool):
+        enemies = self.level.enemies
+
+        if (
+            enemies_changed
+            or len(enemies) != len(self._checked_enemies)
+            or not all(map(operator.is_, enemies, self._checked_enemies))
+        ):
+            self._incompatible_enemies = find_incompatible_enemies(enemies)
+            self._checked_enemies = enemies.copy()
+
+    def update(self) -> bool:
+        """
+        Checks the objects, which changed since the last update, and brings the warnings of the level up to date.
+
+        Returns
+        -------
+        bool
+            If the warnings are different from the last update.
+        """
+        # objects are only rendered on demand, so bring them up to date, which reports the ones that changed
+        for level_object in self.level.objects:
+            level_object.render()
+
+        level_rect = self.level.get_rect()
+        level_state = level_rect.width(), level_rect.height(), self.level.has_next_area
+
+        if level_state != self._level_state:
+            self._checked.clear()
+            self._level_state = level_state
+
+        objects: Sequence["ObjectLike"] = self.level.objects
+        enemies: Sequence["ObjectLike"] = self.level.enemies
+
+        self._update_enemy_compatibility(any(id(enemy) in self._changed for enemy in enemies))
+
+        warnings: list[LevelWarning] = []
+        current_objects = set()
+
+        for obj in objects:
+            current_objects.add(id(obj))
+
+            warnings.extend((message, [obj]) for _, message in self._warnings_of(obj))
+
+        for enemy, incompatible in zip(enemies, self._incompatible_enemies):
+            current_objects.add(id(enemy))
+
+            for warning, message in self._warnings_of(enemy):
+                if incompatible or not isinstance(warning, EnemyCompatibilityWarning):
+                    warnings.append((message, [enemy]))
+
+        # jumps can be edited without being rendered and are only a handful, so they are always checked
+        for jump in self.level.jumps:
+            warnings.extend((message, [jump]) for _, message in self._check(jump))
+
+        for obj_id in self._checked.keys() - current_objects:
+            del self._checked[obj_id]
+
+        self._changed.clear()
+
+        changed = warnings != self.warnings
+        self.warnings = warnings
+
+        return changed
@@ -1,5 +1,9 @@
+from typing import TYPE_CHECKING
+
 from foundry.core.warnings.Warning import PydanticWarning, Warning
-from foundry.game.gfx.objects.ObjectLike import ObjectLike
+
+if TYPE_CHECKING:
+    from foundry.game.gfx.objects.ObjectLike import ObjectLike
 
 
 class OutsideLevelBoundsWarning(Warning):
@@ -7,7 +11,7 @@ class OutsideLevelBoundsWarning(Warning):
     A warning for objects going outside the level bounds.
     """
 
-    def check_object(self, obj: ObjectLike, level=None, *args, **kwargs) -> bool:
+    def check_object(self, obj: "ObjectLike", level=None, *args, **kwargs) -> bool:
         """
         Determines if an object should emit a warning for being outside the level bounds.
 
@@ -31,7 +35,7 @@ class OutsideLevelBoundsWarning(Warning):
             return False
         return not level.get_rect().contains(obj.get_rect())
 
-    def get_message(self, obj: ObjectLike) -> str:
+    def get_message(self, obj: "ObjectLike") -> str:
         return f"{obj} is outside of level bounds."
 
 
@@ -1,9 +1,13 @@
 from functools import cache
-from typing import Type
+from typing import TYPE_CHECKING, Type
 
 from foundry.core.warnings.Warning import PydanticWarning, Warning
 from foundry.core.warnings.WarningType import WarningType
 
+if TYPE_CHECKING:
+    from foundry.game.gfx.objects.ObjectLike import ObjectLike
+    from foundry.game.level.Level import Level
+
 
 @cache
 def type_to_pydantic_warning() -> dict[WarningType, Type[PydanticWarning]]:
@@ -90,3 +94,34 @@ def convert_pydantic_to_warning(warning: PydanticWarning) -> Type[Warning]:
         The class that represents the pydantic warning.
     """
     return type_to_warning()[warning.type]
+
+
+def get_level_warnings(level: "Level") -> list[tuple[str, list["ObjectLike"]]]:
+    """
+    Checks every object, enemy and jump of a level for the warnings of its definition.
+
+    Parameters
+    ----------
+    level : Level
+        The level to check.
+
+    Returns
+    -------
+    list[tuple[str, list[ObjectLike]]]
+        The message of every warning, which applies to the level, with the objects it is about.
+
+    Notes
+    -----
+    To check a level again after it changed, keep a :class:`~foundry.core.warnings.LevelWarnings.LevelWarnings`
+    instead, which only checks the objects, which changed.
+    """
+    from foundry.core.warnings.LevelWarnings import LevelWarnings
+
+    level_warnings = LevelWarnings(level)
+
+    try:
+        level_warnings.update()
+    finally:
+        level_warnings.close()
+
+    return level_warnings.warnings
@@ -1,8 +1,21 @@
+import os
+import pickle
+import sys
+from hashlib import sha256
+from importlib.metadata import PackageNotFoundError, version
+from json import loads
+from pathlib import Path
+from tempfile import NamedTemporaryFile
+from typing import Type, TypeVar
+
 from pydantic import BaseModel
 
+from foundry import definition_cache_path
 from foundry.core.warnings.Warning import Warning
 from foundry.core.warnings.WarningCreator import WarningCreator
 
+_M = TypeVar("_M", bound=BaseModel)
+
 
 class Definition(BaseModel):
     description: str = ""
@@ -13,3 +26,78 @@ class Definition(BaseModel):
 
     class Config:
         use_enum_values = True
+
+
+def _package_version() -> str:
+    try:
+        return version("foundry_smb3")
+    except PackageNotFoundError:
+        return "unknown"
+
+
+def _definition_cache_key(source_data: bytes, model: Type[BaseModel]) -> tuple[str, str, str, str]:
+    model_module = sys.modules[model.__module__].__file__
+
+    model_source = Path(model_module).read_bytes() if model_module is not None else b""
+
+    return (
+        _package_version(),
+        model.__qualname__,
+        sha256(source_data).hexdigest(),
+        sha256(model_source).hexdigest(),
+    )
+
+
+def load_definitions(source: Path, model: Type[_M], cache_dir: Path = definition_cache_path) -> _M:
+    """
+    Parses a JSON file into a pydantic model, using a binary cache of the validated model, if possible.
+
+    Validating the larger definition files takes a noticeable part of the startup, so the validated model is pickled
+    into the cache directory and later launches load it from there instead. The cache is only used, as long as the
+    JSON file, the module defining the model and the version of Foundry are the same, as when it was written.
+
+    Parameters
+    ----------
+    source : Path
+        The JSON file, which holds the data of the root of the model.
+    model : Type[_M]
+        The pydantic model with a ``__root__`` field, to parse the JSON file into.
+    cache_dir : Path, optional
+        The directory the cache file is kept in, by default the definition cache in the home directory of Foundry.
+
+    Returns
+    -------
+    _M
+        The validated model.
+    """
+    source_data = source.read_bytes()
+    key = _definition_cache_key(source_data, model)
+
+    cache_path = cache_dir / f"{source.stem}.pickle"
+
+    try:
+        with open(cache_path, "rb") as cache_file:
+            # the key is pickled separately, so an outdated cache is recognized without loading all of it
+            if pickle.load(cache_file) == key:
+                definitions = pickle.load(cache_file)
+
+                if isinstance(definitions, model):
+                    return definitions
+    except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError, IndexError, TypeError):
+        # a missing, broken or incompatible cache is simply written again
+        pass
+
+    definitions = model(__root__=loads(source_data))
+
+    try:
+        # write to a temporary file first, so other processes never read a half written cache
+        with NamedTemporaryFile("wb", dir=cache_dir, prefix=f"{source.stem}.", delete=False) as temporary_file:
+            pickle.dump(key, temporary_file, protocol=pickle.HIGHEST_PROTOCOL)
+            pickle.dump(definitions, temporary_file, protocol=pickle.HIGHEST_PROTOCOL)
+
+        os.replace(temporary_file.name, cache_path)
+    except OSError:
+        # the cache only makes the next start faster, so not being able to write it is fine
+        pass
+
+    return definitions
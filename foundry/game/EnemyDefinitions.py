@@ -1,13 +1,13 @@
 from enum import Enum
 from functools import cache
-from json import loads
 from typing import Optional
 
+from attr import attrs
 from pydantic import BaseModel, Field
 
 from foundry import enemy_definitions
 from foundry.core.warnings.Warning import Warning
-from foundry.game.Definitions import Definition
+from foundry.game.Definitions import Definition, load_definitions
 
 
 class GeneratorType(int, Enum):
@@ -140,5 +140,139 @@ class EnemyDefinitions(BaseModel):
 
 @cache
 def get_enemy_metadata() -> EnemyDefinitions:
-    with open(enemy_definitions, "r") as f:
-        return EnemyDefinitions(__root__=loads(f.read()))
+    return load_definitions(enemy_definitions, EnemyDefinitions)
+
+
+@attrs(slots=True, frozen=True, auto_attribs=True)
+class CompiledSprite:
+    """
+    A :class:`Sprite` in a slotted class, so drawing it does not go through pydantic.
+    """
+
+    index: int
+    palette_index: int
+    x_offset: int
+    y_offset: int
+    horizontal_mirror: bool
+    vertical_mirror: bool
+
+    @classmethod
+    def from_sprite(cls, sprite: Sprite):
+        return cls(
+            sprite.index,
+            sprite.palette_index,
+            sprite.x_offset,
+            sprite.y_offset,
+            sprite.horizontal_mirror,
+            sprite.vertical_mirror,
+        )
+
+
+@attrs(slots=True, frozen=True, auto_attribs=True)
+class CompiledEnemyDefinition:
+    """
+    The parts of an :class:`EnemyDefinition`, that are needed to draw and check enemies and items, in a slotted
+    class, with the suggested icon geometry and the warnings already resolved.
+
+    Attributes
+    ----------
+    description: str
+        The name of the enemy or item.
+    bmp_width: int
+        The width of its graphics.
+    bmp_height: int
+        The height of its graphics.
+    rect_width: int
+        The width of its rect, 0 if the width of its graphics should be used.
+    rect_height: int
+        The height of its rect, 0 if the height of its graphics should be used.
+    rect_x_offset: int
+        How far its rect reaches left of its position.
+    rect_y_offset: int
+        How far its rect reaches above its position.
+    sprites: tuple[CompiledSprite, ...]
+        The sprites it is drawn with, if it is made up of sprites.
+    blocks: list[int]
+        The blocks it is drawn with, if it is made up of blocks.
+    pages: list[int]
+        The graphics pages its sprites are taken from.
+    orientation: GeneratorType
+        Whether it is made up of sprites or blocks.
+    suggested_icon_width: int
+        See :attr:`EnemyDefinition.suggested_icon_width`.
+    suggested_icon_height: int
+        See :attr:`EnemyDefinition.suggested_icon_height`.
+    suggested_icon_x_offset: int
+        See :attr:`EnemyDefinition.suggested_icon_x_offset`.
+    suggested_icon_y_offset: int
+        See :attr:`EnemyDefinition.suggested_icon_y_offset`.
+    warnings: tuple[Warning, ...]
+        The warnings, that apply to it.
+    """
+
+    description: str
+    bmp_width: int
+    bmp_height: int
+    rect_width: int
+    rect_height: int
+    rect_x_offset: int
+    rect_y_offset: int
+    sprites: tuple[CompiledSprite, ...]
+    blocks: list[int]
+    pages: list[int]
+    orientation: GeneratorType
+    suggested_icon_width: int
+    suggested_icon_height: int
+    suggested_icon_x_offset: int
+    suggested_icon_y_offset: int
+    warnings: tuple[Warning, ...]
+
+    def get_warnings(self) -> list[Warning]:
+        return list(self.warnings)
+
+    @classmethod
+    def from_definition(cls, definition: EnemyDefinition):
+        """
+        Compiles a definition.
+
+        Parameters
+        ----------
+        definition : EnemyDefinition
+            The definition as it was parsed from the JSON definitions.
+
+        Returns
+        -------
+        CompiledEnemyDefinition
+            The compiled definition.
+        """
+        return cls(
+            definition.description,
+            definition.bmp_width,
+            definition.bmp_height,
+            definition.rect_width,
+            definition.rect_height,
+            definition.rect_x_offset,
+            definition.rect_y_offset,
+            tuple(CompiledSprite.from_sprite(sprite) for sprite in definition.sprites),
+            definition.blocks,
+            definition.pages,
+            GeneratorType(definition.orientation),
+            definition.suggested_icon_width,
+            definition.suggested_icon_height,
+            definition.suggested_icon_x_offset,
+            definition.suggested_icon_y_offset,
+            tuple(definition.get_warnings()),
+        )
+
+
+@cache
+def get_compiled_enemy_definitions() -> tuple[CompiledEnemyDefinition, ...]:
+    """
+    Compiles the definitions of every enemy and item, so they can be looked up by type.
+
+    Returns
+    -------
+    tuple[CompiledEnemyDefinition, ...]
+        The compiled definitions in the same order as :func:`get_enemy_metadata`.
+    """
+    return tuple(CompiledEnemyDefinition.from_definition(definition) for definition in get_enemy_metadata().__root__)
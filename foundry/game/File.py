@@ -1,5 +1,5 @@
 from os.path import basename
-from typing import ClassVar, List, Optional, Type, TypeVar
+from typing import Callable, ClassVar, List, Optional, Type, TypeVar
 
 from attr import attrs
 
@@ -18,6 +18,8 @@ TSA_OS_LIST = PAGE_A000_ByTileset
 TSA_TABLE_SIZE = 0x400
 TSA_TABLE_INTERVAL = TSA_TABLE_SIZE + 0x1C00
 
+CHANGE_CHUNK_SIZE = 0x100  # bytes
+
 
 Self = TypeVar("Self")
 
@@ -223,6 +225,158 @@ class INESHeader:
         )
 
 
+@attrs(slots=True, auto_attribs=True, frozen=True, eq=False)
+class RomSubscription:
+    """
+    A callback, which is called after bytes inside its range of the ROM were written.
+
+    Attributes
+    ----------
+    callback: Callable[[int, int], None]
+        Called with the position of the first byte written and the amount of bytes written.
+    position: int
+        The position of the first byte of the range.
+    count: Optional[int]
+        The amount of bytes of the range or None, for everything from its position onwards.
+    """
+
+    callback: Callable[[int, int], None]
+    position: int = 0
+    count: Optional[int] = None
+
+    def overlaps(self, position: int, count: int) -> bool:
+        return position + count > self.position and (self.count is None or position < self.position + self.count)
+
+
+class RomChanges:
+    """
+    Keeps track of which parts of the ROM changed, so data derived from the ROM knows when it is outdated.
+
+    Every write increments the version of the ROM and the ranges written to take on that version, so the version of a
+    range only ever grows and only changes, if a byte inside of it was written. Data derived from the ROM can either be
+    cached by the version of the range it was read from, or subscribe to the range, to be told about writes to it.
+
+    Positions are absolute positions inside the data of the ROM, including the iNES header, as used by
+    :meth:`Rom.read` and :meth:`Rom.write`. Versions are kept for chunks of :data:`CHANGE_CHUNK_SIZE` bytes, so a
+    write counts as a change for the bytes around it in the same chunk as well.
+
+    Attributes
+    ----------
+    version: int
+        The version of the whole ROM, which is incremented by every write.
+    """
+
+    def __init__(self):
+        self.version = 0
+
+        self._chunk_versions: list[int] = []
+        self._subscriptions: list[RomSubscription] = []
+
+    def reset(self, size: int):
+        """
+        Marks every byte of the ROM as changed, after new data was loaded.
+
+        Parameters
+        ----------
+        size : int
+            The amount of bytes of the new data.
+        """
+        self.version += 1
+        self._chunk_versions = [self.version] * -(-size // CHANGE_CHUNK_SIZE)
+
+        self._notify(0, size)
+
+    def record(self, position: int, count: int):
+        """
+        Marks bytes of the ROM as changed, after they were written.
+
+        Parameters
+        ----------
+        position : int
+            The position of the first byte written.
+        count : int
+            The amount of bytes written.
+        """
+        if count <= 0:
+            return
+
+        self.version += 1
+
+        first_chunk, last_chunk = position // CHANGE_CHUNK_SIZE, (position + count - 1) // CHANGE_CHUNK_SIZE
+
+        if last_chunk >= len(self._chunk_versions):
+            self._chunk_versions.extend([self.version] * (last_chunk + 1 - len(self._chunk_versions)))
+
+        self._chunk_versions[first_chunk : last_chunk + 1] = [self.version] * (last_chunk + 1 - first_chunk)
+
+        self._notify(position, count)
+
+    def version_of(self, position: int, count: int = 1) -> int:
+        """
+        Provides the version of a range of the ROM.
+
+        Parameters
+        ----------
+        position : int
+            The position of the first byte of the range.
+        count : int, optional
+            The amount of bytes of the range, by default a single byte.
+
+        Returns
+        -------
+        int
+            The version of the last write to the range, which is larger than every version of the range before it.
+        """
+        chunk_versions = self._chunk_versions[
+            position // CHANGE_CHUNK_SIZE : (position + max(count, 1) - 1) // CHANGE_CHUNK_SIZE + 1
+        ]
+
+        return max(chunk_versions, default=0)
+
+    def subscribe(
+        self, callback: Callable[[int, int], None], position: int = 0, count: Optional[int] = None
+    ) -> RomSubscription:
+        """
+        Calls a callback after every write to a range of the ROM and after new data was loaded.
+
+        Parameters
+        ----------
+        callback : Callable[[int, int], None]
+            Called with the position of the first byte written and the amount of bytes written.
+        position : int, optional
+            The position of the first byte of the range, by default the start of the ROM.
+        count : Optional[int], optional
+            The amount of bytes of the range, by default everything from the position onwards.
+
+        Returns
+        -------
+        RomSubscription
+            The subscription, to end it with :meth:`unsubscribe`.
+        """
+        subscription = RomSubscription(callback, position, count)
+
+        self._subscriptions.append(subscription)
+
+        return subscription
+
+    def unsubscribe(self, subscription: RomSubscription):
+        """
+        Stops calling the callback of a subscription.
+
+        Parameters
+        ----------
+        subscription : RomSubscription
+            The subscription returned by :meth:`subscribe`.
+        """
+        if subscription in self._subscriptions:
+            self._subscriptions.remove(subscription)
+
+    def _notify(self, position: int, count: int):
+        for subscription in list(self._subscriptions):
+            if subscription.overlaps(position, count):
+                subscription.callback(position, count)
+
+
 class ROM(Rom):
     MARKER_VALUE = bytes("SMB3FOUNDRY", "ascii")
 
@@ -236,6 +390,11 @@ class ROM(Rom):
 
     W_INIT_OS_LIST: List[int] = []
 
+    changes: RomChanges = RomChanges()
+    """Keeps track of the parts of the ROM, which were loaded or written to."""
+
+    _tsa_tables: dict[int, tuple[int, bytes]] = {}
+
     def __init__(self, path: Optional[str] = None):
         if not ROM.rom_data:
             if path is None:
@@ -248,7 +407,7 @@ class ROM(Rom):
         self.position = 0
 
     @staticmethod
-    def get_tsa_data(object_set: int) -> bytearray:
+    def _tsa_position(object_set: int) -> int:
         rom = ROM()
 
         if object_set == 0:
@@ -256,12 +415,59 @@ class ROM(Rom):
         else:
             tsa_index = rom.get_byte(TSA_OS_LIST + object_set)
 
-        tsa_start = BASE_OFFSET + tsa_index * TSA_TABLE_INTERVAL
-        tsa_data = rom.bulk_read(TSA_TABLE_SIZE, rom.header.normalized_address(tsa_start))
+        return rom.header.normalized_address(BASE_OFFSET + tsa_index * TSA_TABLE_INTERVAL)
+
+    @staticmethod
+    def get_tsa_data(object_set: int) -> bytearray:
+        tsa_data = ROM().bulk_read(TSA_TABLE_SIZE, ROM._tsa_position(object_set))
 
         assert len(tsa_data) == TSA_TABLE_SIZE
         return tsa_data
 
+    @staticmethod
+    def get_tsa_table(object_set: int) -> bytes:
+        """
+        Provides the TSA table of an object set, which is only read from the ROM again, once it was written to.
+
+        Parameters
+        ----------
+        object_set : int
+            The object set to get the TSA table of.
+
+        Returns
+        -------
+        bytes
+            The TSA table, which is shared by every caller, use :meth:`get_tsa_data` for a copy to change.
+        """
+        if object_set not in ROM._tsa_tables:
+            tsa_position = ROM._tsa_position(object_set)
+
+            ROM._tsa_tables[object_set] = tsa_position, bytes(ROM().bulk_read(TSA_TABLE_SIZE, tsa_position))
+
+        return ROM._tsa_tables[object_set][1]
+
+    @staticmethod
+    def _forget_tsa_tables(position: int, count: int):
+        """
+        Removes the TSA tables from the cache, whose bytes or whose index were written to.
+
+        Parameters
+        ----------
+        position : int
+            The position of the first byte written.
+        count : int
+            The amount of bytes written.
+        """
+        for object_set, (tsa_position, _) in list(ROM._tsa_tables.items()):
+            index_position = ROM.header.normalized_address(TSA_OS_LIST + object_set)
+
+            if (
+                position < tsa_position + TSA_TABLE_SIZE
+                and tsa_position < position + count
+                or position <= index_position < position + count
+            ):
+                del ROM._tsa_tables[object_set]
+
     @staticmethod
     def write_tsa_data(object_set: int, tsa_data: bytearray):
         rom = ROM()
@@ -297,6 +503,8 @@ class ROM(Rom):
             ROM.additional_data = data[additional_data_start:].decode("utf-8")
         ROM.header = INESHeader.from_data(ROM.rom_data)
 
+        ROM.changes.reset(len(ROM.rom_data))
+
     @staticmethod
     def save_to_file(path: str, set_new_path=True):
         with open(path, "wb") as f:
@@ -315,6 +523,20 @@ class ROM(Rom):
     def set_additional_data(additional_data):
         ROM.additional_data = additional_data
 
+    @staticmethod
+    def graphics_range() -> tuple[int, int]:
+        """
+        Provides the range of the graphical data inside the ROM, to find its version in :attr:`changes`.
+
+        Returns
+        -------
+        tuple[int, int]
+            The position of the first byte of the graphical data and the amount of bytes of it.
+        """
+        graphics_start = ROM.header.program_size + INESHeader.INES_HEADER_SIZE
+
+        return graphics_start, len(ROM.rom_data) - graphics_start
+
     @staticmethod
     def is_loaded() -> bool:
         return bool(ROM.path)
@@ -341,3 +563,26 @@ class ROM(Rom):
     def bulk_write(self, data: bytearray, position: int):
         position = self.header.normalized_address(position)
         self.rom_data[position : position + len(data)] = data
+
+        self._on_write(position, len(data))
+
+    def write(self, offset: int, data: bytes):
+        super().write(offset, data)
+
+        self._on_write(offset, len(data))
+
+    def _on_write(self, position: int, count: int):
+        """
+        Keeps track of the writes, which invalidate data derived from the ROM.
+
+        Parameters
+        ----------
+        position : int
+            The absolute position of the first byte written.
+        count : int
+            The amount of bytes written.
+        """
+        ROM.changes.record(position, count)
+
+
+ROM.changes.subscribe(ROM._forget_tsa_tables)
@@ -1,13 +1,13 @@
 from enum import Enum
 from functools import cache
-from json import loads
 
+from attr import attrs
 from pydantic import BaseModel
 
 from foundry import tileset_definitions
 from foundry.core.warnings.OutsideLevelBoundsWarning import OutsideLevelBoundsWarning
 from foundry.core.warnings.Warning import Warning
-from foundry.game.Definitions import Definition
+from foundry.game.Definitions import Definition, load_definitions
 from foundry.smb3parse.objects.object_set import (
     AIR_SHIP_OBJECT_SET,
     CLOUDY_OBJECT_SET,
@@ -103,8 +103,96 @@ class Tilesets(BaseModel):
 
 @cache
 def get_object_metadata() -> Tilesets:
-    with open(tileset_definitions, "r") as f:
-        return Tilesets(__root__=loads(f.read()))
+    return load_definitions(tileset_definitions, Tilesets)
+
+
+@attrs(slots=True, frozen=True, auto_attribs=True)
+class CompiledTilesetDefinition:
+    """
+    The parts of a :class:`TilesetDefinition`, that are needed to generate and check level objects, in a slotted
+    class, so that looking them up for every object does not go through pydantic.
+
+    Attributes
+    ----------
+    description: str
+        The name of the object.
+    bmp_width: int
+        The width of the blocks the object is generated from.
+    bmp_height: int
+        The height of the blocks the object is generated from.
+    blocks: list[int]
+        The blocks the object is generated from.
+    orientation: GeneratorType
+        The way the object is generated.
+    ending: EndType
+        Where the blocks at the ends of the object are placed.
+    size: int
+        The amount of bytes of the object, either 3 or 4.
+    warnings: tuple[Warning, ...]
+        The warnings, that apply to the object.
+    """
+
+    description: str
+    bmp_width: int
+    bmp_height: int
+    blocks: list[int]
+    orientation: GeneratorType
+    ending: EndType
+    size: int
+    warnings: tuple[Warning, ...]
+
+    @property
+    def object_design_length(self) -> int:
+        return len(self.blocks)
+
+    @property
+    def is_4byte(self) -> bool:
+        return self.size == 4
+
+    def get_warnings(self) -> list[Warning]:
+        return list(self.warnings)
+
+    @classmethod
+    def from_definition(cls, definition: TilesetDefinition):
+        """
+        Compiles a definition.
+
+        Parameters
+        ----------
+        definition : TilesetDefinition
+            The definition as it was parsed from the JSON definitions.
+
+        Returns
+        -------
+        CompiledTilesetDefinition
+            The compiled definition.
+        """
+        return cls(
+            definition.description,
+            definition.bmp_width,
+            definition.bmp_height,
+            definition.blocks,
+            GeneratorType(definition.orientation),
+            EndType(definition.ending),
+            definition.size,
+            tuple(definition.get_warnings()),
+        )
+
+
+@cache
+def get_compiled_object_definitions() -> tuple[tuple[CompiledTilesetDefinition, ...], ...]:
+    """
+    Compiles the definitions of every object of every tileset, so they can be looked up by index.
+
+    Returns
+    -------
+    tuple[tuple[CompiledTilesetDefinition, ...], ...]
+        The compiled definitions in the same order as :func:`get_object_metadata`.
+    """
+    return tuple(
+        tuple(CompiledTilesetDefinition.from_definition(definition) for definition in tileset.__root__)
+        for tileset in get_object_metadata().__root__
+    )
 
 
 object_set_to_definition = {
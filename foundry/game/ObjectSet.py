@@ -1,6 +1,6 @@
 from foundry.game.ObjectDefinitions import (
-    TilesetDefinition,
-    get_object_metadata,
+    CompiledTilesetDefinition,
+    get_compiled_object_definitions,
     object_set_to_definition,
 )
 from foundry.smb3parse.constants import TILESET_ENDINGS, TILESET_NAMES
@@ -12,7 +12,7 @@ class ObjectSet:
 
         self.name = TILESET_NAMES[self.number]
 
-        self.definitions = get_object_metadata().__root__[object_set_to_definition[self.number]]
+        self.definitions = get_compiled_object_definitions()[object_set_to_definition[self.number]]
 
     def object_type(self, domain: int, index: int) -> int:
         domain_offset = domain * 0x1F
@@ -22,15 +22,11 @@ class ObjectSet:
         else:
             return (index >> 4) + domain_offset + 16 - 1
 
-    def get_definition_of(self, object_id: int) -> TilesetDefinition:
-        return self.definitions.__root__[object_id]
+    def get_definition_of(self, object_id: int) -> CompiledTilesetDefinition:
+        return self.definitions[object_id]
 
     def get_ending_offset(self) -> int:
         return TILESET_ENDINGS[self.number]
 
     def get_object_byte_length(self, domain: int, object_id: int) -> int:
-        definition = self.get_definition_of(self.object_type(domain, object_id))
-        if definition.is_4byte:
-            return 4
-        else:
-            return 3
+        return self.get_definition_of(self.object_type(domain, object_id)).size
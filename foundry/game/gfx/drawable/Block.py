@@ -1,28 +1,43 @@
-from functools import lru_cache
+import sys
 
 from PySide6.QtCore import QPoint
 from PySide6.QtGui import QColor, QImage, QPainter, Qt
 
 from foundry.core.graphics_set.GraphicsSet import GraphicsSetProtocol
+from foundry.core.LRUCache import LRUCache
 from foundry.core.palette import NESPalette
 from foundry.core.palette.PaletteGroup import MutablePaletteGroup
 from foundry.game.File import ROM
 from foundry.game.gfx.drawable import MASK_COLOR, apply_selection_overlay
-from foundry.game.gfx.drawable.Tile import Tile
+from foundry.game.gfx.drawable.Tile import Tile, get_tile
 
 TSA_BANK_0 = 0 * 256
 TSA_BANK_1 = 1 * 256
 TSA_BANK_2 = 2 * 256
 TSA_BANK_3 = 3 * 256
 
+BLOCK_CACHE_SIZE = 2**23  # bytes
+BLOCK_IMAGE_CACHE_SIZE = 2**26  # bytes
+
+block_cache: "LRUCache[tuple, Block]" = LRUCache(
+    "blocks", BLOCK_CACHE_SIZE, lambda block: sys.getsizeof(block.pixels) + block.image.sizeInBytes()
+)
+block_image_cache: LRUCache[tuple, QImage] = LRUCache("block images", BLOCK_IMAGE_CACHE_SIZE, QImage.sizeInBytes)
+
 
-@lru_cache(2**10)
 def get_block(block_index: int, palette_group: MutablePaletteGroup, graphics_set: GraphicsSetProtocol, tsa_data: bytes):
-    if block_index > 0xFF:
-        rom_block_index = ROM().get_byte(block_index)  # block_index is an offset into the graphic memory
-        block = Block(rom_block_index, palette_group, graphics_set, tsa_data)
-    else:
-        block = Block(block_index, palette_group, graphics_set, tsa_data)
+    key = block_index, palette_group, graphics_set, tsa_data
+
+    block = block_cache.get(key)
+
+    if block is None:
+        if block_index > 0xFF:
+            rom_block_index = ROM().get_byte(block_index)  # block_index is an offset into the graphic memory
+            block = Block(rom_block_index, palette_group, graphics_set, tsa_data)
+        else:
+            block = Block(block_index, palette_group, graphics_set, tsa_data)
+
+        block_cache.put(key, block, (palette_group, graphics_set, tsa_data, *graphics_set.pages))
 
     return block
 
@@ -36,8 +51,6 @@ class Block:
 
     tsa_data = bytes()
 
-    _block_cache = {}
-
     def __init__(
         self,
         block_index: int,
@@ -50,47 +63,47 @@ class Block:
         self.palette_group = palette_group
         self.palette_index = (block_index & 0b1100_0000) >> 6
 
-        # can't hash list, so turn it into a string instead
-        self._block_id = hash((block_index, palette_group, graphics_set))
+        # the images of the block are cached by what they are made from, so they can be invalidated by it as well
+        tsa_key = bytes(tsa_data)
+
+        self._block_id = block_index, palette_group, graphics_set, tsa_key, mirrored
+        self._tags = palette_group, graphics_set, tsa_key, *graphics_set.pages
 
         lu = tsa_data[TSA_BANK_0 + block_index]
         ld = tsa_data[TSA_BANK_1 + block_index]
         ru = tsa_data[TSA_BANK_2 + block_index]
         rd = tsa_data[TSA_BANK_3 + block_index]
 
-        self.lu_tile = Tile(lu, self.palette_group, self.palette_index, graphics_set)
-        self.ld_tile = Tile(ld, self.palette_group, self.palette_index, graphics_set)
+        self.lu_tile = get_tile(lu, self.palette_group, self.palette_index, graphics_set)
+        self.ld_tile = get_tile(ld, self.palette_group, self.palette_index, graphics_set)
 
         if mirrored:
-            self.ru_tile = Tile(lu, self.palette_group, self.palette_index, graphics_set, mirrored=True)
-            self.rd_tile = Tile(ld, self.palette_group, self.palette_index, graphics_set, mirrored=True)
+            self.ru_tile = get_tile(lu, self.palette_group, self.palette_index, graphics_set, mirrored=True)
+            self.rd_tile = get_tile(ld, self.palette_group, self.palette_index, graphics_set, mirrored=True)
         else:
-            self.ru_tile = Tile(ru, self.palette_group, self.palette_index, graphics_set)
-            self.rd_tile = Tile(rd, self.palette_group, self.palette_index, graphics_set)
+            self.ru_tile = get_tile(ru, self.palette_group, self.palette_index, graphics_set)
+            self.rd_tile = get_tile(rd, self.palette_group, self.palette_index, graphics_set)
 
-        self.image = QImage(Block.WIDTH, Block.HEIGHT, QImage.Format_RGB888)
-        painter = QPainter(self.image)
+        # compose the block row by row from the decoded tiles, instead of painting each tile
+        self.pixels = bytearray()
 
-        painter.drawImage(QPoint(0, 0), self.lu_tile.as_image())
-        painter.drawImage(QPoint(Tile.WIDTH, 0), self.ru_tile.as_image())
-        painter.drawImage(QPoint(0, Tile.HEIGHT), self.ld_tile.as_image())
-        painter.drawImage(QPoint(Tile.WIDTH, Tile.HEIGHT), self.rd_tile.as_image())
+        for left_tile, right_tile in [(self.lu_tile, self.ru_tile), (self.ld_tile, self.rd_tile)]:
+            for row in range(Tile.HEIGHT):
+                self.pixels.extend(left_tile.row(row))
+                self.pixels.extend(right_tile.row(row))
 
-        painter.end()
+        self.image = QImage(self.pixels, Block.WIDTH, Block.HEIGHT, QImage.Format_RGB888)
 
-        if _image_only_one_color(self.image) and self.image.pixelColor(0, 0) == QColor(*MASK_COLOR):
-            self._whole_block_is_transparent = True
-        else:
-            self._whole_block_is_transparent = False
-
-    @classmethod
-    def clear_cache(cls):
-        cls._block_cache.clear()
+        self._whole_block_is_transparent = not any(
+            any(tile.pattern) for tile in [self.lu_tile, self.ru_tile, self.ld_tile, self.rd_tile]
+        )
 
     def draw(self, painter: QPainter, x, y, block_length, selected=False, transparent=False):
         block_attributes = (self._block_id, block_length, selected, transparent)
 
-        if block_attributes not in Block._block_cache:
+        image = block_image_cache.get(block_attributes)
+
+        if image is None:
             image = self.image.copy()
 
             if block_length != Block.WIDTH:
@@ -106,9 +119,9 @@ class Block:
             if selected:
                 apply_selection_overlay(image, mask)
 
-            Block._block_cache[block_attributes] = image
+            block_image_cache.put(block_attributes, image, self._tags)
 
-        painter.drawImage(x, y, Block._block_cache[block_attributes])
+        painter.drawImage(x, y, image)
 
     def _replace_transparent_with_background(self, image: QImage):
         # draw image on background layer, to fill transparent pixels
@@ -121,11 +134,3 @@ class Block:
         _painter.end()
 
         return background
-
-
-def _image_only_one_color(image):
-    copy = image.copy()
-
-    copy.convertTo(QImage.Format_Indexed8)
-
-    return copy.colorCount() == 1
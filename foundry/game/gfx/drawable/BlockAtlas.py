@@ -0,0 +1,253 @@
+from functools import lru_cache
+
+import numpy as np
+from PySide6.QtCore import QPoint, QRect
+from PySide6.QtGui import QColor, QImage, QPainter, Qt
+
+from foundry.core.graphics_set.GraphicsSet import GraphicsSetProtocol, decode_blocks
+from foundry.core.palette import (
+    COLORS_PER_PALETTE,
+    PALETTES_PER_PALETTES_GROUP,
+    NESPalette,
+)
+from foundry.game.File import ROM
+from foundry.game.gfx.drawable import MASK_COLOR, apply_selection_overlay
+from foundry.game.gfx.drawable.Block import Block
+
+BLOCK_COUNT = 0x100
+BLOCKS_PER_ROW = 0x10
+BLOCKS_PER_PALETTE = 0x40
+
+
+class BlockAtlas:
+    """
+    A sheet of every block of a tileset, prerendered into a single image, so drawing a block only
+    requires copying a region of the sheet, instead of constructing the block and its tiles.
+
+    The blocks are decoded once into an indexed sheet, which does not depend on the palette group, so coloring them
+    with another palette group only takes applying a different color table to it.
+
+    Attributes
+    ----------
+    palette_group: tuple[tuple[int, ...], ...]
+        The palette group the blocks are colored with.
+    image: QImage
+        The unscaled sheet of every block, ordered by their index from left to right and top to bottom.
+    """
+
+    def __init__(self, palette_group: tuple[tuple[int, ...], ...], graphics_set: GraphicsSetProtocol, tsa_data: bytes):
+        self.palette_group = palette_group
+
+        indexed_sheet = get_indexed_block_sheet(graphics_set, tsa_data)
+        indexed_sheet.setColorTable(get_color_table(palette_group))
+
+        self.image = indexed_sheet.convertToFormat(QImage.Format_RGB888)
+
+        self._sheets: dict[tuple[int, bool, bool], QImage] = {}
+
+    @staticmethod
+    def _block_rect(block_index: int, block_length: int) -> QRect:
+        row, column = divmod(block_index, BLOCKS_PER_ROW)
+        return QRect(column * block_length, row * block_length, block_length, block_length)
+
+    def sheet(self, block_length: int, selected: bool = False, transparent: bool = False) -> QImage:
+        """
+        Provides the sheet of every block, as it would be drawn by :meth:`Block.draw`.
+
+        Parameters
+        ----------
+        block_length : int
+            The length in pixels of each side of a block.
+        selected : bool, optional
+            If the blocks should have the selection overlay applied, by default False.
+        transparent : bool, optional
+            If the transparent pixels of the blocks should be kept, otherwise they are replaced by the background
+            color of the palette of each block, by default False.
+
+        Returns
+        -------
+        QImage
+            The sheet of every block.
+        """
+        key = block_length, selected, transparent
+
+        if key not in self._sheets:
+            self._sheets[key] = self._create_sheet(block_length, selected, transparent)
+
+        return self._sheets[key]
+
+    def _create_sheet(self, block_length: int, selected: bool, transparent: bool) -> QImage:
+        image = self.image.copy()
+
+        if block_length != Block.WIDTH:
+            image = image.scaled(block_length * BLOCKS_PER_ROW, block_length * BLOCK_COUNT // BLOCKS_PER_ROW)
+
+        # mask out the transparent pixels first
+        mask = image.createMaskFromColor(QColor(*MASK_COLOR).rgb(), Qt.MaskOutColor)
+        image.setAlphaChannel(mask)
+
+        if not transparent:
+            image = self._replace_transparent_with_background(image, block_length)
+
+        if selected:
+            apply_selection_overlay(image, mask)
+
+        return image
+
+    def _replace_transparent_with_background(self, image: QImage, block_length: int) -> QImage:
+        # every palette covers a band of rows of the sheet, so fill each band with its background color
+        background = image.copy()
+
+        _painter = QPainter(background)
+        _painter.setCompositionMode(QPainter.CompositionMode_Source)
+
+        band_height = block_length * BLOCKS_PER_PALETTE // BLOCKS_PER_ROW
+        for palette_index in range(BLOCK_COUNT // BLOCKS_PER_PALETTE):
+            color = NESPalette[self.palette_group[palette_index][0]]
+            _painter.fillRect(QRect(0, palette_index * band_height, background.width(), band_height), color)
+
+        _painter.setCompositionMode(QPainter.CompositionMode_SourceOver)
+        _painter.drawImage(QPoint(), image)
+        _painter.end()
+
+        return background
+
+    def draw(
+        self,
+        painter: QPainter,
+        block_index: int,
+        x: int,
+        y: int,
+        block_length: int,
+        selected: bool = False,
+        transparent: bool = False,
+    ):
+        """
+        Draws a single block of the atlas.
+
+        Parameters
+        ----------
+        painter : QPainter
+            The painter to draw the block with.
+        block_index : int
+            The index of the block or, if larger than a byte, the offset into the ROM of the index of the block.
+        x : int
+            The horizontal position in pixels to draw the block at.
+        y : int
+            The vertical position in pixels to draw the block at.
+        block_length : int
+            The length in pixels of each side of the block.
+        selected : bool, optional
+            If the block should have the selection overlay applied, by default False.
+        transparent : bool, optional
+            If the transparent pixels of the block should be kept, by default False.
+        """
+        if block_index > 0xFF:
+            block_index = ROM().get_byte(block_index)  # block_index is an offset into the graphic memory
+
+        painter.drawImage(
+            QPoint(x, y),
+            self.sheet(block_length, selected, transparent),
+            self._block_rect(block_index, block_length),
+        )
+
+
+@lru_cache(2**4)
+def get_block_atlas(
+    palette_group: tuple[tuple[int, ...], ...], graphics_set: GraphicsSetProtocol, tsa_data: bytes
+) -> BlockAtlas:
+    """
+    Provides the atlas of the blocks of a tileset, keeping the most recently used atlases around.
+
+    Parameters
+    ----------
+    palette_group : tuple[tuple[int, ...], ...]
+        The palette group the blocks are colored with.
+    graphics_set : GraphicsSetProtocol
+        The graphics set the tiles of the blocks are taken from.
+    tsa_data : bytes
+        The TSA table of the object set, which defines the tiles of each block.
+
+    Returns
+    -------
+    BlockAtlas
+        The atlas of every block of the tileset.
+    """
+    return BlockAtlas(palette_group, graphics_set, tsa_data)
+
+
+def _forget_written_atlases(position: int, count: int):
+    """
+    Removes every atlas, once the graphical data of the ROM is written to, as the atlases are only keyed by the pages
+    of their graphics sets and not by their bytes.
+
+    Parameters
+    ----------
+    position : int
+        The position of the first byte written.
+    count : int
+        The amount of bytes written.
+    """
+    graphics_start, _ = ROM.graphics_range()
+
+    if position + count > graphics_start:
+        get_block_atlas.cache_clear()
+
+
+ROM.changes.subscribe(_forget_written_atlases)
+
+
+def get_indexed_block_sheet(graphics_set: GraphicsSetProtocol, tsa_data: bytes) -> QImage:
+    """
+    Provides the sheet of every block of a tileset, with each pixel being an index into the color table of
+    :func:`get_color_table`, so it can be colored by any palette group.
+
+    Parameters
+    ----------
+    graphics_set : GraphicsSetProtocol
+        The graphics set the tiles of the blocks are taken from.
+    tsa_data : bytes
+        The TSA table of the object set, which defines the tiles of each block.
+
+    Returns
+    -------
+    QImage
+        The indexed sheet of every block, ordered by their index from left to right and top to bottom.
+    """
+    color_indexes = decode_blocks(graphics_set, tsa_data)
+
+    # the upper two bits of the index of a block select its palette, which selects its colors in the color table
+    palette_offsets = np.arange(BLOCK_COUNT, dtype=np.uint8) // BLOCKS_PER_PALETTE * COLORS_PER_PALETTE
+    indexes = color_indexes + palette_offsets[:, np.newaxis, np.newaxis]
+
+    rows = BLOCK_COUNT // BLOCKS_PER_ROW
+    sheet = indexes.reshape(rows, BLOCKS_PER_ROW, Block.HEIGHT, Block.WIDTH).transpose(0, 2, 1, 3)
+    sheet = np.ascontiguousarray(sheet).tobytes()
+
+    width, height = BLOCKS_PER_ROW * Block.WIDTH, rows * Block.HEIGHT
+
+    # copied, so the image does not depend on the lifetime of the bytes
+    return QImage(sheet, width, height, width, QImage.Format_Indexed8).copy()
+
+
+def get_color_table(palette_group: tuple[tuple[int, ...], ...]) -> list[int]:
+    """
+    Provides the colors of a palette group for the indexes of :func:`get_indexed_block_sheet`.
+
+    Parameters
+    ----------
+    palette_group : tuple[tuple[int, ...], ...]
+        The palette group the blocks are colored with.
+
+    Returns
+    -------
+    list[int]
+        The color of every color of every palette, with the transparent colors being the mask color.
+    """
+    mask_color = QColor(*MASK_COLOR).rgb()
+
+    return [
+        mask_color if color_index == 0 else NESPalette[palette_group[palette_index][color_index]].rgb()
+        for palette_index in range(PALETTES_PER_PALETTES_GROUP)
+        for color_index in range(COLORS_PER_PALETTE)
+    ]
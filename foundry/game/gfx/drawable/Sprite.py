@@ -1,17 +1,25 @@
-from functools import lru_cache
+import sys
 
 from PySide6.QtCore import QPoint
 from PySide6.QtGui import QColor, QImage, QPainter, Qt
 
 from foundry.core.graphics_set.GraphicsSet import GraphicsSetProtocol
+from foundry.core.LRUCache import LRUCache
 from foundry.core.palette import NESPalette
 from foundry.core.palette.PaletteGroup import MutablePaletteGroupProtocol
 from foundry.game.File import ROM
 from foundry.game.gfx.drawable import MASK_COLOR, apply_selection_overlay
-from foundry.game.gfx.drawable.Tile import Tile
+from foundry.game.gfx.drawable.Tile import Tile, get_tile
+
+SPRITE_CACHE_SIZE = 2**22  # bytes
+SPRITE_IMAGE_CACHE_SIZE = 2**25  # bytes
+
+sprite_cache: "LRUCache[tuple, Sprite]" = LRUCache(
+    "sprites", SPRITE_CACHE_SIZE, lambda sprite: sys.getsizeof(sprite.pixels) + sprite.image.sizeInBytes()
+)
+sprite_image_cache: LRUCache[tuple, QImage] = LRUCache("sprite images", SPRITE_IMAGE_CACHE_SIZE, QImage.sizeInBytes)
 
 
-@lru_cache(2**10)
 def get_sprite(
     index: int,
     palette_group: MutablePaletteGroupProtocol,
@@ -20,12 +28,21 @@ def get_sprite(
     horizontal_mirror: bool = False,
     vertical_mirror: bool = False,
 ):
-    if index > 0xFF:
-        return Sprite(
-            ROM().get_byte(index), palette_group, palette_index, graphics_set, horizontal_mirror, vertical_mirror
-        )
-    else:
-        return Sprite(index, palette_group, palette_index, graphics_set, horizontal_mirror, vertical_mirror)
+    key = index, palette_group, palette_index, graphics_set, horizontal_mirror, vertical_mirror
+
+    sprite = sprite_cache.get(key)
+
+    if sprite is None:
+        if index > 0xFF:
+            sprite = Sprite(
+                ROM().get_byte(index), palette_group, palette_index, graphics_set, horizontal_mirror, vertical_mirror
+            )
+        else:
+            sprite = Sprite(index, palette_group, palette_index, graphics_set, horizontal_mirror, vertical_mirror)
+
+        sprite_cache.put(key, sprite, (palette_group, graphics_set, *graphics_set.pages))
+
+    return sprite
 
 
 class Sprite:
@@ -33,8 +50,6 @@ class Sprite:
     HEIGHT: int = Tile.SIDE_LENGTH * 2  # type: ignore
     PIXEL_COUNT = WIDTH * HEIGHT
 
-    _sprite_cache = {}
-
     def __init__(
         self,
         index: int,
@@ -50,24 +65,21 @@ class Sprite:
         self.palette_group = palette_group
         self.palette_index = palette_index
 
-        # can't hash list, so turn it into a string instead
-        self._sprite_id = (index, str(palette_group), palette_index, graphics_set)
+        self._sprite_id = index, palette_group, palette_index, graphics_set
+        self._tags = palette_group, graphics_set, *graphics_set.pages
+
+        self.top_tile = get_tile(index, palette_group, palette_index, graphics_set, horizontal_mirror)
+        self.bottom_tile = get_tile(index + 1, palette_group, palette_index, graphics_set, horizontal_mirror)
 
-        self.top_tile = Tile(index, palette_group, palette_index, graphics_set)
-        self.bottom_tile = Tile(index + 1, palette_group, palette_index, graphics_set)
+        rows = [tile.row(row) for tile in [self.top_tile, self.bottom_tile] for row in range(Tile.HEIGHT)]
 
         if vertical_mirror:
             self.top_tile, self.bottom_tile = self.bottom_tile, self.top_tile
+            rows.reverse()
 
-        self.image = QImage(Sprite.WIDTH, Sprite.HEIGHT, QImage.Format_RGB888)
+        self.pixels = bytearray(b"".join(rows))
 
-        painter = QPainter(self.image)
-        painter.drawImage(QPoint(0, 0), self.top_tile.as_image().copy().mirrored(horizontal_mirror, vertical_mirror))
-        painter.drawImage(
-            QPoint(0, Tile.HEIGHT),  # type: ignore
-            self.bottom_tile.as_image().copy().mirrored(horizontal_mirror, vertical_mirror),
-        )
-        painter.end()
+        self.image = QImage(self.pixels, Sprite.WIDTH, Sprite.HEIGHT, QImage.Format_RGB888)
 
     def draw(self, painter: QPainter, x, y, width, height, selected=False, transparent=False):
         sprite_attributes = (
@@ -80,7 +92,9 @@ class Sprite:
             transparent,
         )
 
-        if sprite_attributes not in Sprite._sprite_cache:
+        image = sprite_image_cache.get(sprite_attributes)
+
+        if image is None:
             image = self.image.copy()
 
             if width != Sprite.WIDTH or height != Sprite.HEIGHT:
@@ -96,9 +110,9 @@ class Sprite:
             if selected:
                 apply_selection_overlay(image, mask)
 
-            Sprite._sprite_cache[sprite_attributes] = image
+            sprite_image_cache.put(sprite_attributes, image, self._tags)
 
-        painter.drawImage(x, y, Sprite._sprite_cache[sprite_attributes])
+        painter.drawImage(x, y, image)
 
     def _replace_transparent_with_background(self, image):
         # draw image on background layer, to fill transparent pixels
@@ -1,18 +1,67 @@
-from functools import lru_cache
+import sys
 
 from PySide6.QtGui import QImage
 
-from foundry.core.graphics_set.GraphicsSet import GraphicsSetProtocol
+from foundry.core.graphics_set.GraphicsSet import (
+    GraphicsSetProtocol,
+    decode_graphics_set,
+    mirror_pattern,
+)
+from foundry.core.LRUCache import LRUCache
 from foundry.core.palette import NESPalette
 from foundry.core.palette.PaletteGroup import MutablePaletteGroup
-from foundry.game.gfx.drawable import MASK_COLOR, bit_reverse
+from foundry.game.gfx.drawable import MASK_COLOR
 
 PIXEL_OFFSET = 8  # both bits describing the color of a pixel are in separate 8 byte chunks at the same index
 
 BACKGROUND_COLOR_INDEX = 0
 
+TILE_CACHE_SIZE = 2**22  # bytes
+
+tile_cache: "LRUCache[tuple, Tile]" = LRUCache(
+    "tiles", TILE_CACHE_SIZE, lambda tile: sys.getsizeof(tile.pixels) + sys.getsizeof(tile.pattern)
+)
+
+
+def get_tile(
+    object_index: int,
+    palette_group: MutablePaletteGroup,
+    palette_index: int,
+    graphics_set: GraphicsSetProtocol,
+    mirrored: bool = False,
+) -> "Tile":
+    """
+    Provides a tile, which is only decoded, if it was not used recently.
+
+    Parameters
+    ----------
+    object_index : int
+        The index of the tile inside the graphics set.
+    palette_group : MutablePaletteGroup
+        The palette group the tile is colored with.
+    palette_index : int
+        The palette of the palette group the tile is colored with.
+    graphics_set : GraphicsSetProtocol
+        The graphics set the pattern of the tile is taken from.
+    mirrored : bool, optional
+        If the tile is mirrored horizontally, by default False.
+
+    Returns
+    -------
+    Tile
+        The tile, which might be shared with others.
+    """
+    key = object_index, palette_group, palette_index, graphics_set, mirrored
+
+    tile = tile_cache.get(key)
+
+    if tile is None:
+        tile = Tile(object_index, palette_group, palette_index, graphics_set, mirrored)
+        tile_cache.put(key, tile, (palette_group, graphics_set, *graphics_set.pages))
+
+    return tile
+
 
-@lru_cache(2**10)
 class Tile:
     SIDE_LENGTH = 8  # pixel
     WIDTH = SIDE_LENGTH
@@ -29,44 +78,41 @@ class Tile:
         graphics_set: GraphicsSetProtocol,
         mirrored=False,
     ):
-        start = object_index * Tile.SIZE
+        start = object_index * Tile.PIXEL_COUNT
 
         self.cached_tiles = dict()
 
         self.palette = palette_group[palette_index]
 
-        self.data = bytearray()
-        self.pixels = bytearray()
-        self.mask_pixels = bytearray()
-
-        self.data = bytearray(bytes(graphics_set))[start : start + Tile.SIZE]
+        self.pattern = decode_graphics_set(graphics_set)[start : start + Tile.PIXEL_COUNT]
 
         if mirrored:
-            self._mirror()
-
-        for i in range(Tile.PIXEL_COUNT):
-            byte_index = i // Tile.HEIGHT
-            bit_index = 2 ** (7 - (i % Tile.WIDTH))
-
-            left_bit = right_bit = 0
+            self.pattern = mirror_pattern(self.pattern)
 
-            if self.data[byte_index] & bit_index:
-                left_bit = 1
+        # add alpha values
+        colors = [bytes(MASK_COLOR)] + [
+            bytes(NESPalette[self.palette[color_index]].toTuple()[:3]) for color_index in range(1, 4)
+        ]
 
-            if self.data[PIXEL_OFFSET + byte_index] & bit_index:
-                right_bit = 1
+        self.pixels = bytearray(b"".join([colors[color_index] for color_index in self.pattern]))
 
-            color_index = (right_bit << 1) | left_bit
+        assert len(self.pixels) == 3 * Tile.PIXEL_COUNT
 
-            color = self.palette[color_index]
+    def row(self, index: int) -> bytes:
+        """
+        Provides the RGB values of a single row of the tile.
 
-            # add alpha values
-            if color_index == 0:
-                self.pixels.extend(MASK_COLOR)
-            else:
-                self.pixels.extend(NESPalette[color].toTuple()[:3])
+        Parameters
+        ----------
+        index : int
+            The row of the tile, starting from the top.
 
-        assert len(self.pixels) == 3 * Tile.PIXEL_COUNT
+        Returns
+        -------
+        bytes
+            The three color channels for each pixel of the row.
+        """
+        return bytes(self.pixels[index * 3 * Tile.WIDTH : (index + 1) * 3 * Tile.WIDTH])
 
     def as_image(self, tile_length=8):
         if tile_length not in self.cached_tiles.keys():
@@ -79,7 +125,3 @@ class Tile:
             self.cached_tiles[tile_length] = image
 
         return self.cached_tiles[tile_length]
-
-    def _mirror(self):
-        for byte in range(len(self.data)):
-            self.data[byte] = bit_reverse[self.data[byte]]
@@ -1,3 +1,5 @@
+from math import ceil, floor
+
 from PySide6.QtCore import QRect, QSize
 from PySide6.QtGui import QColor, QImage, QPainter, Qt
 
@@ -6,9 +8,9 @@ from foundry.core.graphics_set.GraphicsSet import GraphicsSet, GraphicsSetProtoc
 from foundry.core.palette.PaletteGroup import MutablePaletteGroup
 from foundry.core.point.Point import Point, PointProtocol
 from foundry.game.EnemyDefinitions import (
-    EnemyDefinition,
+    CompiledEnemyDefinition,
     GeneratorType,
-    get_enemy_metadata,
+    get_compiled_enemy_definitions,
 )
 from foundry.game.gfx.drawable import apply_selection_overlay
 from foundry.game.gfx.drawable.Block import Block
@@ -24,7 +26,7 @@ class EnemyObject(ObjectLike):
         super().__init__()
         self.enemy = Enemy.from_bytes(data)
 
-        self.palette_group = tuple(tuple(c for c in pal) for pal in palette_group)
+        self._palette_group = _as_tuples(palette_group)
 
         self.png_data = png_data
 
@@ -33,22 +35,39 @@ class EnemyObject(ObjectLike):
         self._render()
 
     @property
-    def definition(self) -> EnemyDefinition:
-        return get_enemy_metadata().__root__[self.obj_index]
+    def palette_group(self) -> tuple[tuple[int, ...], ...]:
+        return self._palette_group
+
+    @palette_group.setter
+    def palette_group(self, palette_group: MutablePaletteGroup):
+        palette_group = _as_tuples(palette_group)
+
+        if palette_group == self._palette_group:
+            return
+
+        self._palette_group = palette_group
+
+        self._render()
+
+    @property
+    def definition(self) -> CompiledEnemyDefinition:
+        return get_compiled_enemy_definitions()[self.obj_index]
 
     @property
     def rect(self):
+        definition = self.definition
+
         bmp_width = (
-            self.definition.bmp_width
-            if not GeneratorType.SINGLE_SPRITE_OBJECT == self.definition.orientation
-            else self.definition.bmp_width // 2
+            definition.bmp_width
+            if not GeneratorType.SINGLE_SPRITE_OBJECT == definition.orientation
+            else definition.bmp_width // 2
         )
-        width = self.definition.rect_width if self.definition.rect_width != 0 else bmp_width
-        height = self.definition.rect_height if self.definition.rect_height != 0 else self.definition.bmp_height
+        width = definition.rect_width if definition.rect_width != 0 else bmp_width
+        height = definition.rect_height if definition.rect_height != 0 else definition.bmp_height
 
         return QRect(
-            self.position.x - self.definition.rect_x_offset,
-            self.position.y - self.definition.rect_y_offset,
+            self.position.x - definition.rect_x_offset,
+            self.position.y - definition.rect_y_offset,
             width,
             height,
         )
@@ -73,11 +92,16 @@ class EnemyObject(ObjectLike):
         return self.definition.bmp_height
 
     def _render(self):
+        self._rendered_type = self.type
+
         if not GeneratorType.SINGLE_SPRITE_OBJECT == self.definition.orientation:
             self._render_blocks()
         else:
             self._render_sprites()
 
+        # the rect depends on the definition of the type
+        self._notify_rect_changed()
+
     def _render_sprites(self):
         self.sprites = self.definition.sprites
 
@@ -93,8 +117,9 @@ class EnemyObject(ObjectLike):
             self.blocks.append(self.png_data.copy(QRect(x, y, Block.WIDTH, Block.HEIGHT)))
 
     def render(self):
-        # nothing to re-render since enemies are just copied over
-        pass
+        # enemies are just copied over, so only a change of type requires them to be rendered again
+        if self.type != self._rendered_type:
+            self._render()
 
     def draw(self, painter: QPainter, block_length, transparency, *, is_icon=False):
         if not GeneratorType.SINGLE_SPRITE_OBJECT == self.definition.orientation:
@@ -113,8 +138,7 @@ class EnemyObject(ObjectLike):
             y -= sprite_info.y_offset / 16
 
             if is_icon:
-                definition = get_enemy_metadata().__root__[self.obj_index]
-                x_offset, y_offset = definition.suggested_icon_x_offset, definition.suggested_icon_y_offset
+                x_offset, y_offset = self.definition.suggested_icon_x_offset, self.definition.suggested_icon_y_offset
                 x += x_offset / 16
                 y -= y_offset / 16
             if not is_icon:
@@ -145,8 +169,7 @@ class EnemyObject(ObjectLike):
             y = self.position.y + (i // self.width) if not is_icon else (i // self.width)
 
             if is_icon:
-                definition = get_enemy_metadata().__root__[self.obj_index]
-                x_offset, y_offset = definition.suggested_icon_x_offset, definition.suggested_icon_y_offset
+                x_offset, y_offset = self.definition.suggested_icon_x_offset, self.definition.suggested_icon_y_offset
                 x -= x_offset
             if not is_icon:
                 y_offset = self.height - 1
@@ -166,6 +189,55 @@ class EnemyObject(ObjectLike):
 
             painter.drawImage(x * block_length, y * block_length, block)
 
+    def drawn_rect(self, block_length: int = 1) -> QRect:
+        """
+        The area the sprites or blocks of the enemy are drawn into, which can exceed its rect, since sprites are
+        offset from its position.
+
+        Parameters
+        ----------
+        block_length : int, optional
+            The length of a block in pixels, by default 1.
+
+        Returns
+        -------
+        QRect
+            The area the enemy is drawn into.
+        """
+        drawn_rect = QRect(
+            self.rect.x() * block_length,
+            self.rect.y() * block_length,
+            self.rect.width() * block_length,
+            self.rect.height() * block_length,
+        )
+
+        if not GeneratorType.SINGLE_SPRITE_OBJECT == self.definition.orientation:
+            for i in range(len(self.blocks)):
+                x = self.position.x + (i % self.width)
+                y = self.position.y + (i // self.width) - (self.height - 1)
+
+                drawn_rect = drawn_rect.united(QRect(x * block_length, y * block_length, block_length, block_length))
+        else:
+            # mirrors the positioning of draw_sprites, including the offsets of the sprites
+            scale_factor = block_length // 2
+
+            for i, sprite_info in enumerate(self.sprites):
+                if sprite_info.index < 0:
+                    continue
+
+                x = ((self.position.x * 2) + (i % self.width) + sprite_info.x_offset / 16) * scale_factor
+                y = (
+                    (self.position.y + (i // self.width) - sprite_info.y_offset / 16 - (self.height - 1))
+                    * scale_factor
+                    * 2
+                )
+
+                drawn_rect = drawn_rect.united(
+                    QRect(floor(x), floor(y), ceil(x - floor(x)) + scale_factor, ceil(y - floor(y)) + scale_factor * 2)
+                )
+
+        return drawn_rect
+
     def get_status_info(self):
         return [("Name", self.name), ("X", self.position.x), ("Y", self.position.y)]
 
@@ -188,6 +260,8 @@ class EnemyObject(ObjectLike):
     def position(self, position: PointProtocol):
         self.enemy.position = Point(max(0, position.x), max(0, position.y))
 
+        self._notify_rect_changed()
+
     @property
     def obj_index(self):
         return self.enemy.type
@@ -200,7 +274,7 @@ class EnemyObject(ObjectLike):
         return bytes(self.enemy)
 
     def as_image(self) -> QImage:
-        definition = get_enemy_metadata().__root__[self.obj_index]
+        definition = self.definition
         width, height = definition.suggested_icon_width * 16, definition.suggested_icon_height * 16
 
         image = QImage(QSize(width, height), QImage.Format_RGBA8888)
@@ -217,3 +291,8 @@ class EnemyObject(ObjectLike):
 
     def __repr__(self):
         return f"EnemyObject: {self}"
+
+
+def _as_tuples(palette_group: MutablePaletteGroup) -> tuple[tuple[int, ...], ...]:
+    # mutable palette groups would never compare equal to the tuples of the palette group set before
+    return tuple(tuple(color for color in palette) for palette in palette_group)
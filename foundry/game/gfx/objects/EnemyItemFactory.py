@@ -1,9 +1,11 @@
+from functools import cache
+
 from PySide6.QtCore import QRect
 from PySide6.QtGui import QImage
 
 from foundry import data_dir
 from foundry.core.palette import PALETTE_GROUPS_PER_OBJECT_SET
-from foundry.core.palette.PaletteGroup import MutablePaletteGroup
+from foundry.core.palette.PaletteGroup import get_palette_group_colors
 from foundry.game.gfx.drawable.Block import Block
 from foundry.game.gfx.objects.EnemyItem import EnemyObject
 
@@ -15,17 +17,15 @@ class EnemyItemFactory:
     definitions: list = []
 
     def __init__(self, object_set: int, palette_index: int):
-        png = QImage(str(data_dir.joinpath("gfx.png")))
-
-        png.convertTo(QImage.Format_RGB888)
-
-        rows_per_object_set = 256 // 64
+        self.object_set = object_set
+        self.palette_index = palette_index
 
-        y_offset = 12 * rows_per_object_set * Block.HEIGHT
+        self.png_data = _load_enemy_graphics()
 
-        self.png_data = png.copy(QRect(0, y_offset, png.width(), png.height() - y_offset))
-
-        self.palette_group = MutablePaletteGroup.from_tileset(object_set, PALETTE_GROUPS_PER_OBJECT_SET + palette_index)
+    @property
+    def palette_group(self) -> tuple[tuple[int, ...], ...]:
+        # read on demand, so a factory kept around still hands out palette groups edited in the meantime
+        return get_palette_group_colors(self.object_set, PALETTE_GROUPS_PER_OBJECT_SET + self.palette_index)
 
     def from_data(self, data, _):
         return EnemyObject(data, self.png_data, self.palette_group)
@@ -40,3 +40,17 @@ class EnemyItemFactory:
         obj = self.from_data(data, 0)
 
         return obj
+
+
+@cache
+def _load_enemy_graphics() -> QImage:
+    # the image is the same for every factory and only ever copied from, so it is only loaded once
+    png = QImage(str(data_dir.joinpath("gfx.png")))
+
+    png.convertTo(QImage.Format_RGB888)
+
+    rows_per_object_set = 256 // 64
+
+    y_offset = 12 * rows_per_object_set * Block.HEIGHT
+
+    return png.copy(QRect(0, y_offset, png.width(), png.height() - y_offset))
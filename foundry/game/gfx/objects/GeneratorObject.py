@@ -4,4 +4,6 @@ from foundry.game.gfx.objects.ObjectLike import ObjectLike
 
 
 class GeneratorObject(ObjectLike, ABC):
+    __slots__ = ()
+
     domain: int
@@ -1,7 +1,7 @@
 from typing import List, Optional, Union
 
 from foundry.core.graphics_set.GraphicsSet import GraphicsSet, GraphicsSetProtocol
-from foundry.core.palette.PaletteGroup import MutablePaletteGroup
+from foundry.core.palette.PaletteGroup import get_palette_group_colors
 from foundry.game.gfx.objects.Jump import Jump
 from foundry.game.gfx.objects.LevelObject import (
     SCREEN_HEIGHT,
@@ -16,7 +16,6 @@ class LevelObjectFactory:
     palette_group_index: int
 
     graphics_set: Optional[GraphicsSetProtocol] = None
-    palette_group: list = []
 
     def __init__(
         self,
@@ -48,7 +47,11 @@ class LevelObjectFactory:
 
     def set_palette_group_index(self, palette_group_index: int):
         self.palette_group_index = palette_group_index
-        self.palette_group = MutablePaletteGroup.from_tileset(self.object_set, self.palette_group_index)
+
+    @property
+    def palette_group(self) -> tuple[tuple[int, ...], ...]:
+        # read on demand, so a factory kept around still hands out palette groups edited in the meantime
+        return get_palette_group_colors(self.object_set, self.palette_group_index)
 
     def from_data(self, data: bytearray, index: int):
         if Jump.is_jump(data):
@@ -1,7 +1,10 @@
+from typing import Optional
+
 from PySide6.QtCore import QRect
 
 from foundry.core.point.Point import Point, PointProtocol
 from foundry.game.Definitions import Definition
+from foundry.game.gfx.drawable.BlockAtlas import BlockAtlas
 from foundry.game.gfx.objects.ObjectLike import ObjectLike
 
 map_object_names = {
@@ -164,15 +167,26 @@ class MapObject(ObjectLike):
     def render(self):
         pass
 
-    def draw(self, dc, block_length, _=None):
-        self.block.draw(
-            dc,
-            self.x_position * block_length,
-            self.y_position * block_length,
-            block_length=block_length,
-            selected=self.selected,
-            transparent=False,
-        )
+    def draw(self, dc, block_length, _=None, block_atlas: Optional[BlockAtlas] = None):
+        if block_atlas is None:
+            self.block.draw(
+                dc,
+                self.x_position * block_length,
+                self.y_position * block_length,
+                block_length=block_length,
+                selected=self.selected,
+                transparent=False,
+            )
+        else:
+            block_atlas.draw(
+                dc,
+                self.block.index,
+                self.x_position * block_length,
+                self.y_position * block_length,
+                block_length=block_length,
+                selected=self.selected,
+                transparent=False,
+            )
 
     def get_status_info(self):
         return ("x", self.x_position), ("y", self.y_position), ("Block Type", self.name)
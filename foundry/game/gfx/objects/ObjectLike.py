@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from typing import Callable, Optional
 
 from PySide6.QtCore import QRect
 
@@ -12,11 +13,20 @@ EXPANDS_BOTH = EXPANDS_HORIZ | EXPANDS_VERT
 
 
 class ObjectLike(ABC):
+    __slots__ = ()
+
     obj_index: int
     name: str
 
     rect: QRect
 
+    rect_changed: Optional[Callable[["ObjectLike"], None]] = None
+    """Called with the object, after its rect changed, for example to keep a spatial index up to date."""
+
+    def _notify_rect_changed(self):
+        if self.rect_changed is not None:
+            self.rect_changed(self)
+
     @abstractmethod
     def render(self):
         pass
@@ -74,6 +84,25 @@ class ObjectLike(ABC):
     def to_bytes(self):
         pass
 
+    def has_same_content_as(self, other: "ObjectLike") -> bool:
+        """
+        Compares two objects by the bytes, they are saved as.
+
+        Objects compare equal and hash by their identity, so two separate objects with the same bytes are still
+        different objects of a level. This is for the few places, which care about what an object is, instead.
+
+        Parameters
+        ----------
+        other : ObjectLike
+            The object to compare to.
+
+        Returns
+        -------
+        bool
+            Whether both objects are of the same type and would be saved as the same bytes.
+        """
+        return type(self) is type(other) and bytes(self.to_bytes()) == bytes(other.to_bytes())
+
     def expands(self):
         return EXPANDS_NOT
 
@@ -37,9 +37,13 @@ def change_level_object_type(item: LevelObject, increment: bool):
 
         new_domain = item.domain
 
-    item.data[0] &= 0b0001_1111
-    item.data[0] |= new_domain << 5
-    item.data[2] = new_type
+    data = bytearray(item.data)
+
+    data[0] &= 0b0001_1111
+    data[0] |= new_domain << 5
+    data[2] = new_type
+
+    item.data = data
 
     if item.is_4byte and item.size == 3:
         item.data.append(0)
@@ -60,7 +64,7 @@ def set_level_object_width(item: LevelObject, width: int, *, render: bool = True
         item.obj_index = (item.obj_index & 0xF0) + max(0, min(0x0F, width - item.position.x))
     else:
         if item.is_4byte:
-            item.data[3] = max(0, min(0xFF, width - item.position.x))
+            item.length = max(0, min(0xFF, width - item.position.x))
         else:
             raise NotImplementedError(f"Resize is not possible for {item}")
 
@@ -76,7 +80,7 @@ def set_level_object_height(item: LevelObject, height: int, *, render: bool = Tr
         item.obj_index = (item.obj_index & 0xF0) + max(0, min(0x0F, height - item.position.y))
     else:
         if item.is_4byte:
-            item.data[3] = max(0, min(0xFF, height - item.position.y))
+            item.length = max(0, min(0xFF, height - item.position.y))
         else:
             raise NotImplementedError(f"Resize is not possible for {item}")
 
@@ -1,16 +1,33 @@
+from bisect import bisect_right
+from difflib import SequenceMatcher
 from functools import reduce
-from typing import List, Optional, Tuple, Union, overload
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+    overload,
+)
 
 from PySide6.QtCore import QObject, QPoint, QRect, QSize, Signal, SignalInstance
 
+from foundry.core.point.Point import Point
 from foundry.game.File import ROM
+from foundry.game.gfx.objects.BlockGenerator import GROUND_DEPENDENT_ORIENTATIONS
+from foundry.game.gfx.objects.Enemy import Enemy
 from foundry.game.gfx.objects.EnemyItem import EnemyObject
 from foundry.game.gfx.objects.EnemyItemFactory import EnemyItemFactory
 from foundry.game.gfx.objects.Jump import Jump
 from foundry.game.gfx.objects.LevelObject import LevelObject
 from foundry.game.gfx.objects.LevelObjectFactory import LevelObjectFactory
 from foundry.game.level import LevelByteData
+from foundry.game.level.LevelDataCursor import LevelDataCursor
 from foundry.game.level.LevelLike import LevelLike
+from foundry.game.level.SpatialIndex import SpatialIndex
+from foundry.game.level.util import Level as LevelMeta
 from foundry.game.level.util import get_worlds, load_level_offsets
 from foundry.game.ObjectSet import ObjectSet
 from foundry.smb3parse.constants import (
@@ -20,9 +37,10 @@ from foundry.smb3parse.constants import (
 )
 from foundry.smb3parse.levels.level_header import LevelHeader
 
-LEVEL_POINTER_OFFSET = Level_TilesetIdx_ByTileset
+if TYPE_CHECKING:
+    from foundry.game.level.LevelHistory import LevelState
 
-ENEMY_SIZE = 3
+LEVEL_POINTER_OFFSET = Level_TilesetIdx_ByTileset
 
 TIME_INF = -1
 
@@ -51,6 +69,7 @@ class Level(LevelLike):
 
     offsets = load_level_offsets()
     sorted_offsets = sorted(offsets, key=lambda level: level.generator_pointer)
+    offsets_by_enemy_pointer = sorted(offsets, key=lambda level: level.enemy_pointer)
 
     WORLDS = get_worlds(offsets)
 
@@ -79,6 +98,14 @@ class Level(LevelLike):
         self.jumps: List[Jump] = []
         self.enemies: List[EnemyObject] = []
 
+        self._spatial_index: SpatialIndex[Union[LevelObject, EnemyObject]] = SpatialIndex(
+            object_updated=self._object_updated
+        )
+        self._object_listeners: List[Callable[[Union[LevelObject, EnemyObject]], None]] = []
+
+        self._object_factories: dict[tuple[int, int, int, bool], LevelObjectFactory] = {}
+        self._enemy_item_factories: dict[tuple[int, int], EnemyItemFactory] = {}
+
         if self.layout_address == self.enemy_offset == 0:
             # probably loaded to become an m3l
             return
@@ -88,14 +115,23 @@ class Level(LevelLike):
         self.header_bytes = rom.bulk_read(Level.HEADER_LENGTH, self.header_offset)
         self._parse_header()
 
-        object_data = ROM.rom_data[self.object_offset :]
-        enemy_data = ROM.rom_data[self.enemy_offset :]
+        self._load_level_data(
+            ROM.rom_data, ROM.rom_data, object_offset=self.object_offset, enemy_offset=self.enemy_offset
+        )
 
-        self._load_level_data(object_data, enemy_data)
+    def _load_level_data(
+        self,
+        object_data: bytearray,
+        enemy_data: bytearray,
+        new_level: bool = True,
+        object_offset: int = 0,
+        enemy_offset: int = 0,
+    ):
+        with LevelDataCursor(object_data, object_offset) as objects:
+            self._load_objects(objects)
 
-    def _load_level_data(self, object_data: bytearray, enemy_data: bytearray, new_level: bool = True):
-        self._load_objects(object_data)
-        self._load_enemies(enemy_data)
+        with LevelDataCursor(enemy_data, enemy_offset) as enemies:
+            self._load_enemies(enemies)
 
         if new_level:
             self._update_level_size()
@@ -159,56 +195,74 @@ class Level(LevelLike):
     def _parse_header(self):
         self.header = LevelHeader(self.header_bytes, self.object_set_number)
 
-        self.object_factory = LevelObjectFactory(
+        object_factory_key = (
             self.object_set_number,
             self.header.graphic_set_index,
             self.header.object_palette_index,
-            self.objects,
             bool(self.header.is_vertical),
         )
-        self.enemy_item_factory = EnemyItemFactory(self.object_set_number, self.header.enemy_palette_index)
 
-        self.size = self.header.width, self.header.height
+        if object_factory_key not in self._object_factories:
+            self._object_factories[object_factory_key] = LevelObjectFactory(
+                *object_factory_key[:3], self.objects, object_factory_key[3]
+            )
 
-        self.data_changed.emit()
+        enemy_item_factory_key = self.object_set_number, self.header.enemy_palette_index
 
-    def _load_enemies(self, data: bytearray):
-        self.enemies.clear()
+        if enemy_item_factory_key not in self._enemy_item_factories:
+            self._enemy_item_factories[enemy_item_factory_key] = EnemyItemFactory(*enemy_item_factory_key)
 
-        def data_left(_data: bytearray):
-            # the commented out code seems to hold for the stock ROM, but if the ROM was already edited with another
-            # editor, it might not, since they only wrote the 0xFF to end the enemy data
+        self.object_factory = self._object_factories[object_factory_key]
+        self.enemy_item_factory = self._enemy_item_factories[enemy_item_factory_key]
 
-            return _data and not _data[0] == 0xFF  # and _data[1] in [0x00, 0x01]
+        self._retarget_objects()
 
-        enemy_data, data = data[0:ENEMY_SIZE], data[ENEMY_SIZE:]
+        self.size = self.header.width, self.header.height
 
-        while data_left(enemy_data):
-            enemy = self.enemy_item_factory.from_data(enemy_data, 0)
+        self.data_changed.emit()
 
-            self.enemies.append(enemy)
+    def _retarget_objects(self):
+        """
+        Brings the palette group, graphics set and orientation of the objects and enemies in line with the header.
 
-            enemy_data, data = data[0:ENEMY_SIZE], data[ENEMY_SIZE:]
+        None of them change the blocks an object is made of, so the objects are kept, instead of being parsed again.
+        Only a change of orientation moves the objects, so they are rendered again.
+        """
+        palette_group = self.object_factory.palette_group
+        graphics_set = self.object_factory.graphics_set
+        vertical_level = self.object_factory.vertical_level
 
-    def _load_objects(self, data: bytearray):
-        self.objects.clear()
-        self.jumps.clear()
+        for level_object in self.objects:
+            if level_object.palette_group != palette_group:
+                level_object.palette_group = palette_group
 
-        if not data or data[0] == 0xFF:
-            return
+            level_object.graphics_set = graphics_set
 
-        while True:
-            obj_data, data = data[0:3], data[3:]
+            if level_object.vertical_level != vertical_level:
+                level_object.vertical_level = vertical_level
+                level_object.render()
 
-            domain = (obj_data[0] & 0b1110_0000) >> 5
+        enemy_palette_group = tuple(tuple(palette) for palette in self.enemy_item_factory.palette_group)
 
-            obj_id = obj_data[2]
-            has_length_byte = self.object_set.get_object_byte_length(domain, obj_id) == 4
+        for enemy in self.enemies:
+            if enemy.palette_group != enemy_palette_group:
+                enemy.palette_group = enemy_palette_group
 
-            if has_length_byte:
-                fourth_byte, data = data[0], data[1:]
-                obj_data.append(fourth_byte)
+    def _load_enemies(self, data: LevelDataCursor):
+        old_enemies = self.enemies.copy()
+        self.enemies.clear()
+
+        for enemy_data in data.enemy_records():
+            self.enemies.append(self.enemy_item_factory.from_data(enemy_data, 0))
+
+        self._update_spatial_index(added=self.enemies, removed=old_enemies)
 
+    def _load_objects(self, data: LevelDataCursor):
+        old_objects = self.objects.copy()
+        self.objects.clear()
+        self.jumps.clear()
+
+        for obj_data in data.object_records(self.object_set):
             level_object = self.object_factory.from_data(obj_data, len(self.objects))
 
             if isinstance(level_object, LevelObject):
@@ -216,8 +270,7 @@ class Level(LevelLike):
             elif isinstance(level_object, Jump):
                 self.jumps.append(level_object)
 
-            if data[0] == 0xFF:
-                break
+        self._update_spatial_index(added=self.objects, removed=old_objects)
 
     def _update_level_size(self):
         self.object_size_on_disk = self.current_object_size()
@@ -251,6 +304,74 @@ class Level(LevelLike):
     def enemies_end(self):
         return self.enemy_offset + self.current_enemies_size() + len(b"\xFF\x00")  # the delimiter
 
+    def level_overwritten_by_objects(self) -> Optional[LevelMeta]:
+        """
+        Finds the level, whose data the objects of this level would overwrite, if they were saved.
+
+        Returns
+        -------
+        Optional[LevelMeta]
+            The level with the closest object data before the last byte of the object data of this level, if it is not
+            this level itself.
+        """
+        # the last byte written is the delimiter, right before the end
+        level_index = (
+            bisect_right(
+                [level.generator_pointer - Level.HEADER_LENGTH for level in Level.sorted_offsets], self.objects_end - 1
+            )
+            - 1
+        )
+
+        if level_index < 0:
+            return None
+
+        found_level = Level.sorted_offsets[level_index]
+
+        return None if found_level.generator_pointer == self.object_offset else found_level
+
+    def level_overwritten_by_enemies(self) -> Optional[LevelMeta]:
+        """
+        Finds the level, whose enemy data the enemies and items of this level would overwrite, if they were saved.
+
+        Returns
+        -------
+        Optional[LevelMeta]
+            The level with the closest enemy data before the last byte of the enemy data of this level, if it is not
+            this level itself.
+        """
+        levels_by_enemy_offset = Level.offsets_by_enemy_pointer
+
+        level_index = bisect_right([level.enemy_pointer for level in levels_by_enemy_offset], self.enemies_end - 1) - 1
+
+        if level_index < 0:
+            return None
+
+        found_level = levels_by_enemy_offset[level_index]
+
+        return None if found_level.enemy_pointer == self.enemy_offset else found_level
+
+    @classmethod
+    def from_meta(cls, level: LevelMeta) -> "Level":
+        """
+        Loads a level from the ROM, as it is listed in :attr:`Level.offsets`.
+
+        Parameters
+        ----------
+        level : LevelMeta
+            The level to load, which must not be a world map.
+
+        Returns
+        -------
+        Level
+            The loaded level.
+        """
+        return cls(
+            level.display_information.name or "",
+            level.generator_pointer - Level.HEADER_LENGTH,
+            level.enemy_pointer,
+            level.tileset,
+        )
+
     @property
     def next_area_objects(self):
         return self.header.jump_level_address
@@ -369,8 +490,6 @@ class Level(LevelLike):
 
         self._parse_header()
 
-        self.reload()
-
     @property
     def pipe_ends_level(self):
         return self.header.pipe_ends_level
@@ -455,8 +574,6 @@ class Level(LevelLike):
 
         self._parse_header()
 
-        self.reload()
-
     @property
     def time_index(self):
         return self.header.time_index
@@ -502,12 +619,157 @@ class Level(LevelLike):
     def get_object_names(self):
         return [obj.name for obj in self.get_all_objects()]
 
+    @property
+    def spatial_index(self) -> SpatialIndex[Union[LevelObject, EnemyObject]]:
+        """
+        The spatial index over the objects and enemies of the level.
+
+        Adding, removing and reordering objects and enemies through the level updates the index, moving and resizing
+        them updates it by itself, see :attr:`ObjectLike.rect_changed`.
+
+        Returns
+        -------
+        SpatialIndex[Union[LevelObject, EnemyObject]]
+            The spatial index of the level.
+        """
+        return self._spatial_index
+
+    def _update_spatial_index(
+        self,
+        added: Sequence[Union[LevelObject, EnemyObject]] = (),
+        removed: Sequence[Union[LevelObject, EnemyObject]] = (),
+    ):
+        """
+        Updates the spatial index and the index in the level of the objects, after objects or enemies were added,
+        removed or reordered.
+
+        The objects, which extend down to the ground, use the index to find what is below them, so only the objects in
+        the index are given access to it.
+
+        Parameters
+        ----------
+        added : Sequence[Union[LevelObject, EnemyObject]], optional
+            The objects and enemies, which were added to the level.
+        removed : Sequence[Union[LevelObject, EnemyObject]], optional
+            The objects and enemies, which were removed from the level.
+        """
+        for obj in removed:
+            self._spatial_index.remove(obj)
+
+            if isinstance(obj, LevelObject):
+                obj.ground_index = None
+
+        for obj in added:
+            self._spatial_index.insert(obj)
+
+            if isinstance(obj, LevelObject):
+                obj.ground_index = self._spatial_index
+
+        self._spatial_index.set_order(self.get_all_objects())
+        self._update_object_indices()
+
+        # the objects, which extend down to the ground, could stand on other objects now
+        for level_object in self.objects:
+            if level_object.orientation in GROUND_DEPENDENT_ORIENTATIONS:
+                level_object.render()
+
+        self.notify_object_listeners([*removed, *added])
+
+    def _update_object_indices(self, start: int = 0):
+        """
+        Updates the index in the level of the objects, after objects were added, removed or reordered.
+
+        Parameters
+        ----------
+        start : int, optional
+            The index of the first object, which could have moved, by default all objects are updated.
+        """
+        for index in range(start, len(self.objects)):
+            self.objects[index].index_in_level = index
+
+    def add_object_listener(self, listener: Callable[[Union[LevelObject, EnemyObject]], None]):
+        """
+        Calls the listener with every object or enemy of the level, after it was rendered anew, added, removed or
+        reordered.
+
+        Objects, which changed in another way, like being selected, are reported by :meth:`notify_object_listeners`.
+
+        Parameters
+        ----------
+        listener : Callable[[Union[LevelObject, EnemyObject]], None]
+            Called with the object, which changed.
+        """
+        self._object_listeners.append(listener)
+
+    def remove_object_listener(self, listener: Callable[[Union[LevelObject, EnemyObject]], None]):
+        """
+        Stops calling a listener added by :meth:`add_object_listener`.
+
+        Parameters
+        ----------
+        listener : Callable[[Union[LevelObject, EnemyObject]], None]
+            The listener to remove.
+        """
+        if listener in self._object_listeners:
+            self._object_listeners.remove(listener)
+
+    def notify_object_listeners(self, objects: Sequence[Union[LevelObject, EnemyObject]]):
+        """
+        Calls the listeners added by :meth:`add_object_listener` with objects, which changed without being rendered
+        anew, like when they were selected.
+
+        Parameters
+        ----------
+        objects : Sequence[Union[LevelObject, EnemyObject]]
+            The objects and enemies, which changed.
+        """
+        for obj in objects:
+            for listener in self._object_listeners:
+                listener(obj)
+
+    def _object_updated(self, obj: Union[LevelObject, EnemyObject], old_rect: QRect):
+        self._render_objects_above(obj, old_rect)
+
+        self.notify_object_listeners([obj])
+
+    def _render_objects_above(self, obj: Union[LevelObject, EnemyObject], old_rect: QRect):
+        """
+        Renders the later objects, which extend down to the ground, if the object moved into or out of their way.
+
+        Parameters
+        ----------
+        obj : Union[LevelObject, EnemyObject]
+            The object, whose rect changed.
+        old_rect : QRect
+            The rect of the object, before it changed.
+        """
+        if not isinstance(obj, LevelObject):
+            return
+
+        changed_area = old_rect.united(obj.get_rect())
+        order = self._spatial_index.order_of(obj)
+
+        for later_object in self.objects[order + 1 :]:
+            if later_object.orientation not in GROUND_DEPENDENT_ORIENTATIONS:
+                continue
+
+            if later_object.ground_search_area.intersects(changed_area):
+                # only renders, if the object actually ended up in its way, which in turn informs the objects above it
+                later_object.render()
+
     def object_at(self, x: int, y: int) -> Optional[Union[EnemyObject, LevelObject]]:
-        for obj in reversed(self.get_all_objects()):
-            if (x, y) in obj:
-                return obj
-        else:
-            return None
+        objects_at_point = self.spatial_index.at(x, y)
+
+        return objects_at_point[-1] if objects_at_point else None
+
+    def get_objects_intersecting(self, rect: QRect) -> List[Union[LevelObject, EnemyObject]]:
+        """
+        Returns all objects and enemies, that overlap the rect, in the order of :meth:`get_all_objects`.
+
+        :param rect: The area to check overlaps for, in blocks.
+        :return:
+        """
+        return self.spatial_index.intersecting(rect)
 
     def bring_to_foreground(self, objects: List[Union[LevelObject, EnemyObject]]):
         for obj in objects:
@@ -529,6 +791,10 @@ class Level(LevelLike):
 
             objects.insert(index, obj)
 
+            # the next object is compared against the objects in their new order
+            self._update_spatial_index()
+            self.notify_object_listeners([obj])
+
     def bring_to_background(self, level_objects: List[Union[LevelObject, EnemyObject]]):
         for obj in level_objects:
             intersecting_objects = self.get_intersecting_objects(obj)
@@ -551,6 +817,10 @@ class Level(LevelLike):
 
             objects.insert(index, obj)
 
+            # the next object is compared against the objects in their new order
+            self._update_spatial_index()
+            self.notify_object_listeners([obj])
+
     @overload
     def get_intersecting_objects(self, obj: LevelObject) -> List[LevelObject]:
         ...
@@ -570,19 +840,17 @@ class Level(LevelLike):
         :return:
         """
         if isinstance(obj, LevelObject):
-            objects_to_check = self.objects
+            object_type: type = LevelObject
         elif isinstance(obj, EnemyObject):
-            objects_to_check = self.enemies
+            object_type = EnemyObject
         else:
             raise TypeError()
 
-        intersecting_objects = []
-
-        for other_object in objects_to_check:
-            if obj.get_rect().intersects(other_object.get_rect()):
-                intersecting_objects.append(other_object)
-
-        return intersecting_objects
+        return [
+            other_object
+            for other_object in self.spatial_index.intersecting(obj.get_rect())
+            if isinstance(other_object, object_type)
+        ]
 
     def draw(self, *_):
         pass
@@ -627,6 +895,8 @@ class Level(LevelLike):
         obj = self.object_factory.from_properties(domain, object_index, x, y, length, index)
         self.objects.insert(index, obj)
 
+        self._update_spatial_index(added=[obj])
+
         return obj
 
     def add_enemy(self, object_index: int, x: int, y: int, index: int = -1) -> EnemyObject:
@@ -639,6 +909,8 @@ class Level(LevelLike):
 
         self.enemies.insert(index, enemy)
 
+        self._update_spatial_index(added=[enemy])
+
         return enemy
 
     def add_jump(self):
@@ -653,7 +925,10 @@ class Level(LevelLike):
 
     def index_of(self, obj: Union[EnemyObject, LevelObject]) -> int:
         if isinstance(obj, LevelObject):
-            return self.objects.index(obj)
+            if not (0 <= obj.index_in_level < len(self.objects) and self.objects[obj.index_in_level] is obj):
+                raise ValueError(f"{obj} is not in the level.")
+
+            return obj.index_in_level
         elif isinstance(obj, EnemyObject):
             return len(self.objects) + self.enemies.index(obj)
         else:
@@ -674,6 +949,8 @@ class Level(LevelLike):
         elif isinstance(obj, EnemyObject):
             self.enemies.remove(obj)
 
+        self._update_spatial_index(removed=[obj])
+
     def to_m3l(self) -> bytearray:
         world_number = level_number = 1
 
@@ -719,9 +996,12 @@ class Level(LevelLike):
 
         m3l_bytes = m3l_bytes[Level.HEADER_LENGTH :]
 
-        # figure out how many bytes are the objects
-        self._load_objects(m3l_bytes)
-        object_size = self.current_object_size() + len(b"\xFF")  # delimiter
+        # figure out how many bytes are the objects, including the delimiter
+        with LevelDataCursor(m3l_bytes) as cursor:
+            for _ in cursor.object_records(self.object_set):
+                pass
+
+            object_size = cursor.offset
 
         object_bytes = m3l_bytes[:object_size]
         enemy_bytes = m3l_bytes[object_size:]
@@ -771,3 +1051,76 @@ class Level(LevelLike):
 
         self._parse_header()
         self._load_level_data(objects, enemies, new_level)
+
+    def restore(self, state: "LevelState"):
+        """
+        Brings the level to a state, like :meth:`from_bytes`, but only changes the objects and enemies, which differ.
+
+        Objects and enemies, which are the same in the state, are kept as they are. The ones, which only differ in
+        their bytes, but not in their size or type, are changed in place, so only what was added or changed beyond
+        that is created anew.
+
+        Parameters
+        ----------
+        state : LevelState
+            The state to bring the level to.
+        """
+        self.header_offset = state.header_offset
+        self.enemy_offset = state.enemy_offset
+
+        if bytes(self.header_bytes) != state.header:
+            self.header_bytes = bytearray(state.header)
+            self._parse_header()
+
+        old_objects = self.get_all_objects()
+
+        self._restore_records(self.objects, state.objects, self._restore_object)
+        self._restore_records(self.jumps, state.jumps, lambda _, record: Jump(bytearray(record)))
+        self._restore_records(self.enemies, state.enemies, self._restore_enemy)
+
+        new_objects = self.get_all_objects()
+
+        old_ids = set(map(id, old_objects))
+        new_ids = set(map(id, new_objects))
+
+        self._update_spatial_index(
+            added=[obj for obj in new_objects if id(obj) not in old_ids],
+            removed=[obj for obj in old_objects if id(obj) not in new_ids],
+        )
+
+        self.data_changed.emit()
+
+    @staticmethod
+    def _restore_records(objects: list, records: Tuple[bytes, ...], restore: Callable):
+        current_records = [bytes(obj.to_bytes()) for obj in objects]
+
+        opcodes = SequenceMatcher(None, current_records, records, autojunk=False).get_opcodes()
+
+        # going from the last change to the first keeps the indexes of the changes before valid
+        for tag, start, end, record_start, record_end in reversed(opcodes):
+            if tag == "equal":
+                continue
+
+            replaced = objects[start:end] if tag == "replace" and end - start == record_end - record_start else []
+            replaced += [None] * (record_end - record_start - len(replaced))
+
+            objects[start:end] = [
+                restore(obj, record) for obj, record in zip(replaced, records[record_start:record_end])
+            ]
+
+    def _restore_object(self, level_object: Optional[LevelObject], record: bytes) -> LevelObject:
+        if level_object is not None and len(level_object.data) == len(record):
+            level_object.data = bytearray(record)
+            level_object.render()
+
+            return level_object
+
+        return self.object_factory.from_data(bytearray(record), len(self.objects))
+
+    def _restore_enemy(self, enemy: Optional[EnemyObject], record: bytes) -> EnemyObject:
+        if enemy is not None and enemy.type == record[0]:
+            position = Enemy.from_bytes(record).position
+            enemy.position = Point(position.x, position.y)
+            return enemy
+
+        return self.enemy_item_factory.from_data(bytearray(record), 0)
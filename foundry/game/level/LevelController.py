@@ -219,6 +219,7 @@ class LevelController:
 
         if isinstance(self.level_ref.level, Level):
             self.level_ref.level.jumps[index] = jump
+            self.level_ref.level.jumps_changed.emit()
             self.parent.jump_list.item(index).setText(str(jump))
 
     @undoable
@@ -0,0 +1,100 @@
+from typing import Iterator, Union
+
+from foundry.game.ObjectSet import ObjectSet
+
+ENEMY_SIZE = 3
+DATA_DELIMITER = 0xFF
+
+
+class LevelDataCursor:
+    """
+    Reads the object and enemy records of a level one after another, starting at an offset into some data.
+
+    The data is only looked at through a memoryview, so neither the data, nor what is left of it after every record,
+    are copied. Only the records themselves are copied, since the objects created from them change them.
+
+    The memoryview keeps a bytearray from being resized, so the cursor should be used as a context manager or
+    released explicitly, when it is done reading.
+
+    Attributes
+    ----------
+    offset: int
+        The position in the data of the next byte to be read.
+    """
+
+    def __init__(self, data: Union[bytes, bytearray, memoryview], offset: int = 0):
+        self._view = memoryview(data)
+        self.offset = offset
+
+    def __enter__(self) -> "LevelDataCursor":
+        return self
+
+    def __exit__(self, *_):
+        self.release()
+
+    def release(self):
+        """
+        Releases the memoryview of the data, so it can be resized again.
+        """
+        self._view.release()
+
+    def object_records(self, object_set: ObjectSet) -> Iterator[bytearray]:
+        """
+        Reads the records of the objects and jumps, up to and including the delimiter after them.
+
+        Parameters
+        ----------
+        object_set : ObjectSet
+            The object set of the level, which determines, whether an object takes up 3 or 4 bytes.
+
+        Returns
+        -------
+        Iterator[bytearray]
+            The 3 or 4 bytes of every object and jump.
+        """
+        view = self._view
+
+        if self.offset >= len(view):
+            return
+
+        if view[self.offset] == DATA_DELIMITER:
+            self.offset += 1
+            return
+
+        while True:
+            record = bytearray(view[self.offset : self.offset + 3])
+            self.offset += 3
+
+            domain = (record[0] & 0b1110_0000) >> 5
+
+            if object_set.get_object_byte_length(domain, record[2]) == 4:
+                record.append(view[self.offset])
+                self.offset += 1
+
+            yield record
+
+            if view[self.offset] == DATA_DELIMITER:
+                self.offset += 1
+                break
+
+    def enemy_records(self) -> Iterator[bytearray]:
+        """
+        Reads the records of the enemies and items, up to and including the delimiter after them.
+
+        Returns
+        -------
+        Iterator[bytearray]
+            The 3 bytes of every enemy and item, the last one might be shorter, if the data ends without a delimiter.
+        """
+        view = self._view
+
+        # the enemy data of the stock ROM seems to always be followed by specific bytes, but if the ROM was already
+        # edited with another editor, it might not be, since they only wrote the delimiter to end the enemy data
+        while self.offset < len(view) and view[self.offset] != DATA_DELIMITER:
+            record = bytearray(view[self.offset : self.offset + ENEMY_SIZE])
+            self.offset += ENEMY_SIZE
+
+            yield record
+
+        if self.offset < len(view):
+            self.offset += 1
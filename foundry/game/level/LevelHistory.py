@@ -0,0 +1,458 @@
+"""
+Keeps the undo and redo history of a level as the differences between its states, instead of copies of them.
+
+A state of a level is the header and the records of its objects, jumps and enemies, which is what the level is saved
+as. After every undoable action only the records, which changed since the state before, are kept, so an action on a
+large level takes up as much memory as the objects it touched. The history only holds on to a single state in full,
+the current one, every other state is recreated from it, by applying the differences in between.
+
+The history has a budget of bytes, beyond which the oldest actions are forgotten. Actions can be given a key, like
+the objects, which were moved, so consecutive actions with the same key become a single action.
+"""
+
+from collections import deque
+from difflib import SequenceMatcher
+from typing import Hashable, Optional, Sequence
+
+from attr import attrs
+
+from foundry.game.gfx.objects.Jump import Jump
+from foundry.game.level import LevelByteData
+from foundry.game.level.Level import Level
+from foundry.game.level.LevelDataCursor import DATA_DELIMITER, LevelDataCursor
+from foundry.game.ObjectSet import ObjectSet
+
+UNDO_MEMORY_BUDGET = 16 * 1024 * 1024  # bytes
+
+# an approximation of what keeping a change around costs, besides its records
+CHANGE_OVERHEAD = 64  # bytes
+
+Records = tuple[bytes, ...]
+
+
+@attrs(slots=True, auto_attribs=True, frozen=True)
+class LevelState:
+    """
+    Everything that makes up a level, as it would be saved.
+
+    Attributes
+    ----------
+    header_offset: int
+        The position of the header of the level in the ROM.
+    header: bytes
+        The bytes of the header.
+    objects: tuple[bytes, ...]
+        The bytes of every object, in the order they are drawn in.
+    jumps: tuple[bytes, ...]
+        The bytes of every jump.
+    enemy_offset: int
+        The position of the enemy data of the level in the ROM.
+    enemies: tuple[bytes, ...]
+        The bytes of every enemy and item, in the order they are saved in.
+    """
+
+    header_offset: int
+    header: bytes
+    objects: Records
+    jumps: Records
+    enemy_offset: int
+    enemies: Records
+
+    @classmethod
+    def from_level(cls, level: Level) -> "LevelState":
+        """
+        Takes the current state of a level.
+
+        Parameters
+        ----------
+        level : Level
+            The level to take the state of.
+
+        Returns
+        -------
+        LevelState
+            The state of the level.
+        """
+        return cls.from_bytes(level.to_bytes(), level.object_set)
+
+    @classmethod
+    def from_bytes(cls, level_data: LevelByteData, object_set: ObjectSet) -> "LevelState":
+        """
+        Splits the data of a level into its header and records.
+
+        Parameters
+        ----------
+        level_data : LevelByteData
+            The offset and data of the header and objects and the offset and data of the enemies of the level.
+        object_set : ObjectSet
+            The object set of the level, which determines, whether an object takes up 3 or 4 bytes.
+
+        Returns
+        -------
+        LevelState
+            The state the data describes.
+        """
+        (header_offset, object_data), (enemy_offset, enemy_data) = level_data
+
+        with LevelDataCursor(object_data, Level.HEADER_LENGTH) as cursor:
+            object_records = [bytes(record) for record in cursor.object_records(object_set)]
+
+        with LevelDataCursor(enemy_data) as cursor:
+            enemies = tuple(bytes(record) for record in cursor.enemy_records())
+
+        return cls(
+            header_offset,
+            bytes(object_data[: Level.HEADER_LENGTH]),
+            tuple(record for record in object_records if not Jump.is_jump(record)),
+            tuple(record for record in object_records if Jump.is_jump(record)),
+            enemy_offset,
+            enemies,
+        )
+
+    def to_bytes(self) -> LevelByteData:
+        """
+        Puts the header and records back together, like :meth:`Level.to_bytes` does.
+
+        Returns
+        -------
+        LevelByteData
+            The offset and data of the header and objects and the offset and data of the enemies of the level.
+        """
+        object_data = bytearray(self.header)
+        object_data.extend(b"".join(self.objects + self.jumps))
+        object_data.append(DATA_DELIMITER)
+
+        enemy_data = bytearray(b"".join(self.enemies))
+        enemy_data.append(DATA_DELIMITER)
+
+        return (self.header_offset, object_data), (self.enemy_offset, enemy_data)
+
+
+@attrs(slots=True, auto_attribs=True, frozen=True)
+class RecordChange:
+    """
+    A run of records, which was replaced by another run of records.
+
+    Attributes
+    ----------
+    old_start: int
+        The index of the first replaced record, before the change.
+    new_start: int
+        The index of the first replacing record, after the change.
+    old_records: tuple[bytes, ...]
+        The records, which were replaced.
+    new_records: tuple[bytes, ...]
+        The records, which replaced them.
+    """
+
+    old_start: int
+    new_start: int
+    old_records: Records
+    new_records: Records
+
+    @property
+    def size(self) -> int:
+        return CHANGE_OVERHEAD + sum(map(len, self.old_records)) + sum(map(len, self.new_records))
+
+
+def diff_records(old_records: Records, new_records: Records) -> tuple[RecordChange, ...]:
+    """
+    Finds the runs of records, which differ between two sequences of records.
+
+    Parameters
+    ----------
+    old_records : tuple[bytes, ...]
+        The records before the change.
+    new_records : tuple[bytes, ...]
+        The records after the change.
+
+    Returns
+    -------
+    tuple[RecordChange, ...]
+        The changes, which turn the old records into the new ones, from the first record to the last.
+    """
+    if old_records == new_records:
+        return ()
+
+    matcher = SequenceMatcher(None, old_records, new_records, autojunk=False)
+
+    return tuple(
+        RecordChange(old_start, new_start, old_records[old_start:old_end], new_records[new_start:new_end])
+        for tag, old_start, old_end, new_start, new_end in matcher.get_opcodes()
+        if tag != "equal"
+    )
+
+
+def _apply_changes(records: Records, changes: Sequence[RecordChange]) -> Records:
+    result = list(records)
+
+    # going from the last change to the first keeps the indexes of the changes before valid
+    for change in reversed(changes):
+        result[change.old_start : change.old_start + len(change.old_records)] = change.new_records
+
+    return tuple(result)
+
+
+def _revert_changes(records: Records, changes: Sequence[RecordChange]) -> Records:
+    result = list(records)
+
+    for change in reversed(changes):
+        result[change.new_start : change.new_start + len(change.new_records)] = change.old_records
+
+    return tuple(result)
+
+
+@attrs(slots=True, auto_attribs=True, frozen=True)
+class LevelDelta:
+    """
+    The difference between two states of a level.
+
+    Attributes
+    ----------
+    old_offsets: tuple[int, int]
+        The offsets of the header and the enemies before the change.
+    new_offsets: tuple[int, int]
+        The offsets of the header and the enemies after the change.
+    old_header: bytes
+        The header before the change.
+    new_header: bytes
+        The header after the change.
+    objects: tuple[RecordChange, ...]
+        The changes of the records of the objects.
+    jumps: tuple[RecordChange, ...]
+        The changes of the records of the jumps.
+    enemies: tuple[RecordChange, ...]
+        The changes of the records of the enemies and items.
+    """
+
+    old_offsets: tuple[int, int]
+    new_offsets: tuple[int, int]
+    old_header: bytes
+    new_header: bytes
+    objects: tuple[RecordChange, ...]
+    jumps: tuple[RecordChange, ...]
+    enemies: tuple[RecordChange, ...]
+
+    @classmethod
+    def between(cls, old_state: LevelState, new_state: LevelState) -> "LevelDelta":
+        """
+        Finds the difference between two states of a level.
+
+        Parameters
+        ----------
+        old_state : LevelState
+            The state before the change.
+        new_state : LevelState
+            The state after the change.
+
+        Returns
+        -------
+        LevelDelta
+            What changed from the old state to the new one.
+        """
+        return cls(
+            (old_state.header_offset, old_state.enemy_offset),
+            (new_state.header_offset, new_state.enemy_offset),
+            old_state.header,
+            new_state.header,
+            diff_records(old_state.objects, new_state.objects),
+            diff_records(old_state.jumps, new_state.jumps),
+            diff_records(old_state.enemies, new_state.enemies),
+        )
+
+    @property
+    def is_empty(self) -> bool:
+        return (
+            self.old_offsets == self.new_offsets
+            and self.old_header == self.new_header
+            and not (self.objects or self.jumps or self.enemies)
+        )
+
+    @property
+    def size(self) -> int:
+        """
+        The approximate amount of bytes the delta takes up.
+        """
+        return (
+            CHANGE_OVERHEAD
+            + len(self.old_header)
+            + len(self.new_header)
+            + sum(change.size for change in self.objects + self.jumps + self.enemies)
+        )
+
+    def apply(self, state: LevelState) -> LevelState:
+        """
+        Turns the state before the change into the state after it.
+
+        Parameters
+        ----------
+        state : LevelState
+            The state before the change.
+
+        Returns
+        -------
+        LevelState
+            The state after the change.
+        """
+        return LevelState(
+            self.new_offsets[0],
+            self.new_header,
+            _apply_changes(state.objects, self.objects),
+            _apply_changes(state.jumps, self.jumps),
+            self.new_offsets[1],
+            _apply_changes(state.enemies, self.enemies),
+        )
+
+    def revert(self, state: LevelState) -> LevelState:
+        """
+        Turns the state after the change back into the state before it.
+
+        Parameters
+        ----------
+        state : LevelState
+            The state after the change.
+
+        Returns
+        -------
+        LevelState
+            The state before the change.
+        """
+        return LevelState(
+            self.old_offsets[0],
+            self.old_header,
+            _revert_changes(state.objects, self.objects),
+            _revert_changes(state.jumps, self.jumps),
+            self.old_offsets[1],
+            _revert_changes(state.enemies, self.enemies),
+        )
+
+
+class LevelHistory:
+    """
+    The undo and redo history of a level, kept as the differences between its states.
+
+    Attributes
+    ----------
+    max_size: int
+        The budget of the history in bytes, once the actions take up more than that, the oldest ones are forgotten.
+    undo_stack: deque[LevelDelta]
+        The actions, which can be undone, with the most recent one last.
+    redo_stack: deque[LevelDelta]
+        The actions, which were undone and can be redone, with the most recently undone one last.
+    """
+
+    def __init__(self, initial_state: LevelState, max_size: int = UNDO_MEMORY_BUDGET):
+        self._state = initial_state
+        self.max_size = max_size
+
+        self.undo_stack: deque[LevelDelta] = deque()
+        self.redo_stack: deque[LevelDelta] = deque()
+
+        self._size = 0
+        self._merge_key: Optional[Hashable] = None
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.state}, {self.max_size})"
+
+    @property
+    def state(self) -> LevelState:
+        return self._state
+
+    @property
+    def size(self) -> int:
+        """
+        The approximate amount of bytes the actions of the history take up.
+        """
+        return self._size
+
+    def do(self, new_state: LevelState, merge_key: Optional[Hashable] = None) -> LevelState:
+        """
+        Adds an action to the history, which led to a new state, and clears the actions, which could be redone.
+
+        Parameters
+        ----------
+        new_state : LevelState
+            The state after the action.
+        merge_key : Optional[Hashable], optional
+            What the action did, if it is the same as for the action before, both become a single action, so they are
+            undone together, by default actions are never merged.
+
+        Returns
+        -------
+        LevelState
+            The new state.
+        """
+        old_state = self._state
+
+        if merge_key is not None and merge_key == self._merge_key and self.undo_stack:
+            merged_delta = self.undo_stack.pop()
+            self._size -= merged_delta.size
+
+            old_state = merged_delta.revert(old_state)
+
+        delta = LevelDelta.between(old_state, new_state)
+
+        if delta.is_empty:
+            # nothing was added to merge with, so the next action must not merge with an older one
+            merge_key = None
+        else:
+            self.undo_stack.append(delta)
+            self._size += delta.size
+
+        for redo_delta in self.redo_stack:
+            self._size -= redo_delta.size
+        self.redo_stack.clear()
+
+        self._state = new_state
+        self._merge_key = merge_key
+
+        self._forget_oldest_actions()
+
+        return self.state
+
+    def _forget_oldest_actions(self):
+        # the most recent action is always kept, so it can be undone, even if it is larger than the budget on its own
+        while self._size > self.max_size and len(self.undo_stack) > 1:
+            self._size -= self.undo_stack.popleft().size
+
+    @property
+    def can_undo(self) -> bool:
+        return bool(self.undo_stack)
+
+    def undo(self) -> LevelState:
+        """
+        Undoes the most recent action.
+
+        Returns
+        -------
+        LevelState
+            The state before the action.
+        """
+        delta = self.undo_stack.pop()
+        self.redo_stack.append(delta)
+
+        self._state = delta.revert(self._state)
+        self._merge_key = None
+
+        return self.state
+
+    @property
+    def can_redo(self) -> bool:
+        return bool(self.redo_stack)
+
+    def redo(self) -> LevelState:
+        """
+        Redoes the most recently undone action.
+
+        Returns
+        -------
+        LevelState
+            The state after the action.
+        """
+        delta = self.redo_stack.pop()
+        self.undo_stack.append(delta)
+
+        self._state = delta.apply(self._state)
+        self._merge_key = None
+
+        return self.state
@@ -25,6 +25,7 @@ from foundry.gui.ObjectToolBar import ObjectToolBar
 from foundry.gui.ObjectViewer import ObjectViewer
 from foundry.gui.PaletteGroupController import PaletteGroupController
 from foundry.gui.PlayerViewer import PlayerViewerController as PlayerViewer
+from foundry.gui.settings import SETTINGS
 from foundry.gui.SpinnerPanel import SpinnerPanel
 from foundry.gui.Toolbar import create_toolbar
 from foundry.gui.WarningList import WarningList
@@ -103,7 +104,7 @@ class LevelManager:
     def on_enable(self):
         self._enabled = True
 
-        level_ref = LevelRef()
+        level_ref = LevelRef(SETTINGS["undo_memory_budget"])
 
         self.controller = LevelController(self.parent, level_ref)
 
@@ -1,22 +1,28 @@
-from typing import Optional
+from typing import Hashable, Optional
 
 from PySide6.QtCore import QObject, Signal, SignalInstance
 
-from foundry.core.UndoController import UndoController
 from foundry.game.level import LevelByteData
 from foundry.game.level.Level import Level
+from foundry.game.level.LevelHistory import (
+    UNDO_MEMORY_BUDGET,
+    LevelHistory,
+    LevelState,
+)
 
 
 class LevelRef(QObject):
     data_changed: SignalInstance = Signal()  # type: ignore
     jumps_changed: SignalInstance = Signal()  # type: ignore
 
-    def __init__(self):
+    def __init__(self, undo_memory_budget: int = UNDO_MEMORY_BUDGET):
         super(LevelRef, self).__init__()
         self._internal_level = None
-        self._undo_controller = None
+        self._history: Optional[LevelHistory] = None
         self._is_loaded = False
 
+        self.undo_memory_budget = undo_memory_budget
+
     @property
     def is_loaded(self) -> bool:
         return self._is_loaded
@@ -30,7 +36,7 @@ class LevelRef(QObject):
 
     def unload_level(self) -> None:
         self._internal_level = None
-        self._undo_controller = None
+        self._history = None
         self._is_loaded = False
 
     @property
@@ -43,7 +49,7 @@ class LevelRef(QObject):
     def level(self, level: Level):
         self._internal_level = level
 
-        self._undo_controller = UndoController(self._internal_level.to_bytes())
+        self._history = LevelHistory(LevelState.from_level(self._internal_level), self.undo_memory_budget)
 
         self._internal_level.data_changed.connect(self.data_changed.emit)
         self._internal_level.jumps_changed.connect(self.jumps_changed.emit)
@@ -61,49 +67,61 @@ class LevelRef(QObject):
         if selected_objects == self.selected_objects:
             return
 
+        selected_objects = set(selected_objects)
+        changed_objects = []
+
         for obj in self._internal_level.get_all_objects():
-            obj.selected = obj in selected_objects
+            if obj.selected != (obj in selected_objects):
+                obj.selected = not obj.selected
+                changed_objects.append(obj)
+
+        self._internal_level.notify_object_listeners(changed_objects)
 
         self.data_changed.emit()
 
     @property
     def state(self) -> LevelByteData:
-        assert self._undo_controller is not None
+        assert self._history is not None
 
-        return self._undo_controller.state
+        return self._history.state.to_bytes()
 
-    def do(self, level_data: Optional[LevelByteData] = None) -> LevelByteData:
-        assert self._undo_controller is not None
+    def do(self, level_data: Optional[LevelByteData] = None, merge_key: Optional[Hashable] = None) -> LevelByteData:
+        assert self._history is not None
 
-        data = self._undo_controller.do(level_data if level_data is not None else self.level.to_bytes())
+        if level_data is None:
+            new_state = LevelState.from_level(self.level)
+        else:
+            new_state = LevelState.from_bytes(level_data, self.level.object_set)
+
+        data = self._history.do(new_state, merge_key).to_bytes()
         self.data_changed.emit()
         return data
 
     @property
     def can_undo(self) -> bool:
-        assert self._undo_controller is not None
+        assert self._history is not None
 
-        return self._undo_controller.can_undo
+        return self._history.can_undo
 
     def undo(self) -> LevelByteData:
-        assert self._undo_controller is not None
+        assert self._history is not None
 
-        new_state = self._undo_controller.undo()
-        self.set_level_state(*new_state)
-        return new_state
+        new_state = self._history.undo()
+        self.restore_level_state(new_state)
+        return new_state.to_bytes()
 
     @property
     def can_redo(self) -> bool:
-        assert self._undo_controller is not None
+        assert self._history is not None
 
-        return self._undo_controller.can_redo
+        return self._history.can_redo
 
     def redo(self) -> LevelByteData:
-        assert self._undo_controller is not None
+        assert self._history is not None
 
-        new_state = self._undo_controller.redo()
-        self.set_level_state(*new_state)
-        return new_state
+        new_state = self._history.redo()
+        self.restore_level_state(new_state)
+        return new_state.to_bytes()
 
     def set_level_state(self, object_data, enemy_data):
         self.level.from_bytes(object_data, enemy_data, new_level=False)
@@ -111,11 +129,34 @@ class LevelRef(QObject):
 
         self.data_changed.emit()
 
-    def save_level_state(self):
+    def restore_level_state(self, state: LevelState):
+        """
+        Brings the level to a state of its history, only changing the objects and enemies, which differ from it.
+
+        Parameters
+        ----------
+        state : LevelState
+            The state to bring the level to.
+        """
+        self.level.restore(state)
+        self.level.changed = True
+
+        self.data_changed.emit()
+
+    def save_level_state(self, merge_key: Optional[Hashable] = None):
+        """
+        Adds the current state of the level to its history, as the result of an action, which can be undone.
+
+        Parameters
+        ----------
+        merge_key : Optional[Hashable], optional
+            What the action did, like moving a selection of objects, so consecutive actions, which did the same, are
+            undone together, by default every action is undone on its own.
+        """
         assert self._internal_level is not None
-        assert self._undo_controller is not None
+        assert self._history is not None
 
-        self.do(self._internal_level.to_bytes())
+        self.do(merge_key=merge_key)
         self.level.changed = True
 
         self.data_changed.emit()
@@ -0,0 +1,269 @@
+from collections import defaultdict
+from typing import Callable, Generic, Iterable, Iterator, Optional, TypeVar
+
+from PySide6.QtCore import QRect
+
+from foundry.game.gfx.objects.ObjectLike import ObjectLike
+
+CELL_SIZE = 8
+
+_T = TypeVar("_T", bound=ObjectLike)
+
+
+class SpatialIndex(Generic[_T]):
+    """
+    A uniform grid over the rects of the objects of a level, so the objects at a point or inside an area can be found
+    by only checking the objects of the cells the query touches, instead of every object of the level.
+
+    The objects report changes to their rect by themselves, see :attr:`ObjectLike.rect_changed`, so moving or resizing
+    them keeps the index up to date. Adding, removing and reordering objects has to be reported to the index.
+
+    Attributes
+    ----------
+    cell_size: int
+        The length of each side of a cell of the grid in blocks.
+    object_updated: Optional[Callable[[_T, QRect], None]]
+        Called with an object and its old rect, after the object was moved to the cells of its new rect.
+    """
+
+    def __init__(self, cell_size: int = CELL_SIZE, object_updated: Optional[Callable[[_T, QRect], None]] = None):
+        self.cell_size = cell_size
+        self.object_updated = object_updated
+
+        self._cells: defaultdict[tuple[int, int], dict[int, _T]] = defaultdict(dict)
+        self._objects: dict[int, tuple[_T, list[tuple[int, int]], QRect]] = {}
+        self._order: dict[int, int] = {}
+
+        # only ever grows, which is fine for finding the objects below a row
+        self._lowest_cell = 0
+
+    def __len__(self) -> int:
+        return len(self._objects)
+
+    def __contains__(self, obj: _T) -> bool:
+        return id(obj) in self._objects
+
+    def __iter__(self) -> Iterator[_T]:
+        return iter([obj for obj, _, _ in self._objects.values()])
+
+    def _cells_of(self, rect: QRect) -> Iterator[tuple[int, int]]:
+        # empty rects are still put into the cell of their position, so they are not lost
+        left, top = rect.x() // self.cell_size, rect.y() // self.cell_size
+        right = (rect.x() + max(rect.width(), 1) - 1) // self.cell_size
+        bottom = (rect.y() + max(rect.height(), 1) - 1) // self.cell_size
+
+        for cell_x in range(left, right + 1):
+            for cell_y in range(top, bottom + 1):
+                yield cell_x, cell_y
+
+    def insert(self, obj: _T):
+        """
+        Adds an object to the index and starts following the changes of its rect.
+
+        Parameters
+        ----------
+        obj : _T
+            The object to add.
+        """
+        if obj in self:
+            self.remove(obj)
+
+        rect = QRect(obj.get_rect())
+        cells = list(self._cells_of(rect))
+
+        for cell in cells:
+            self._cells[cell][id(obj)] = obj
+
+            self._lowest_cell = max(self._lowest_cell, cell[1])
+
+        self._objects[id(obj)] = obj, cells, rect
+        self._order.setdefault(id(obj), len(self._order))
+
+        obj.rect_changed = self.update
+
+    def remove(self, obj: _T):
+        """
+        Removes an object from the index.
+
+        Parameters
+        ----------
+        obj : _T
+            The object to remove.
+        """
+        _, cells, _ = self._objects.pop(id(obj), (obj, [], QRect()))
+
+        for cell in cells:
+            del self._cells[cell][id(obj)]
+
+            if not self._cells[cell]:
+                del self._cells[cell]
+
+        self._order.pop(id(obj), None)
+
+        if obj.rect_changed == self.update:
+            obj.rect_changed = None
+
+    def update(self, obj: _T):
+        """
+        Moves an object to the cells of its current rect.
+
+        Parameters
+        ----------
+        obj : _T
+            The object, whose rect changed.
+        """
+        if obj not in self:
+            return
+
+        order = self._order[id(obj)]
+        _, _, old_rect = self._objects[id(obj)]
+
+        self.remove(obj)
+        self.insert(obj)
+
+        self._order[id(obj)] = order
+
+        if self.object_updated is not None:
+            self.object_updated(obj, old_rect)
+
+    def clear(self):
+        """
+        Removes every object from the index.
+        """
+        for obj, _, _ in self._objects.values():
+            obj.rect_changed = None
+
+        self._cells.clear()
+        self._objects.clear()
+        self._order.clear()
+        self._lowest_cell = 0
+
+    def set_order(self, objects: Iterable[_T]):
+        """
+        Sets the order the objects are returned in, by the queries of the index.
+
+        Parameters
+        ----------
+        objects : Iterable[_T]
+            The objects of the index, ordered from back to front.
+        """
+        self._order = {id(obj): index for index, obj in enumerate(objects)}
+
+    def order_of(self, obj: _T) -> int:
+        """
+        Returns the position of an object in the order set by :meth:`set_order`.
+
+        Parameters
+        ----------
+        obj : _T
+            An object of the index.
+
+        Returns
+        -------
+        int
+            The position of the object, objects in front of it have a higher one.
+        """
+        return self._order[id(obj)]
+
+    def _candidates(self, rect: QRect, before: Optional[_T] = None) -> list[_T]:
+        candidates: dict[int, _T] = {}
+
+        for cell in self._cells_of(rect):
+            candidates.update(self._cells.get(cell, {}))
+
+        if before is not None:
+            limit = self._order[id(before)]
+
+            return sorted(
+                (obj for obj in candidates.values() if self._order[id(obj)] < limit),
+                key=lambda obj: self._order[id(obj)],
+            )
+
+        return sorted(candidates.values(), key=lambda obj: self._order[id(obj)])
+
+    def at(self, x: int, y: int) -> list[_T]:
+        """
+        Finds the objects at a point.
+
+        Parameters
+        ----------
+        x : int
+            The horizontal position of the point in blocks.
+        y : int
+            The vertical position of the point in blocks.
+
+        Returns
+        -------
+        list[_T]
+            The objects containing the point, ordered from back to front.
+        """
+        cell = self._cells.get((x // self.cell_size, y // self.cell_size), {})
+
+        return sorted((obj for obj in cell.values() if (x, y) in obj), key=lambda obj: self._order[id(obj)])
+
+    def intersecting(self, rect: QRect, before: Optional[_T] = None) -> list[_T]:
+        """
+        Finds the objects overlapping an area.
+
+        Parameters
+        ----------
+        rect : QRect
+            The area in blocks.
+        before : Optional[_T], optional
+            An object of the index, if given, only the objects behind it are returned.
+
+        Returns
+        -------
+        list[_T]
+            The objects, whose rect intersects the area, ordered from back to front.
+        """
+        if rect.isNull():
+            return []
+
+        # the rect might not be normalized, so look around it a little, before checking it exactly
+        candidates = self._candidates(rect.normalized().adjusted(-1, -1, 1, 1), before)
+
+        return [obj for obj in candidates if rect.intersects(obj.get_rect())]
+
+    def near(self, rect: QRect) -> list[_T]:
+        """
+        Finds the objects in the cells of the grid, which an area touches, without checking their rects.
+
+        Objects, which are drawn outside of their rect, or whose rect is empty, can be found by looking a little
+        further around the area and checking what they draw into afterwards.
+
+        Parameters
+        ----------
+        rect : QRect
+            The area in blocks.
+
+        Returns
+        -------
+        list[_T]
+            The objects, which are in any cell the area touches, ordered from back to front.
+        """
+        return self._candidates(rect.normalized())
+
+    def below(self, x: int, width: int, y: int, before: Optional[_T] = None) -> list[_T]:
+        """
+        Finds the objects in a range of columns at or below a row.
+
+        Parameters
+        ----------
+        x : int
+            The first column in blocks.
+        width : int
+            The amount of columns.
+        y : int
+            The row in blocks.
+        before : Optional[_T], optional
+            An object of the index, if given, only the objects behind it are returned.
+
+        Returns
+        -------
+        list[_T]
+            The objects, which reach into the columns at or below the row, ordered from back to front.
+        """
+        height = max(1, (self._lowest_cell + 1) * self.cell_size - y)
+
+        return self.intersecting(QRect(x, y, width, height), before)
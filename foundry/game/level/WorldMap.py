@@ -4,6 +4,7 @@ from foundry.core.graphics_set.GraphicsSet import GraphicsSet
 from foundry.core.palette.PaletteGroup import MutablePaletteGroup
 from foundry.game.File import ROM
 from foundry.game.gfx.drawable.Block import Block
+from foundry.game.gfx.drawable.BlockAtlas import get_block_atlas
 from foundry.game.gfx.objects.MapObject import MapObject
 from foundry.game.level.LevelLike import LevelLike
 from foundry.smb3parse.levels.world_map import (
@@ -29,7 +30,7 @@ class WorldMap(LevelLike):
         self.palette_group = MutablePaletteGroup.from_tileset(WORLD_MAP_OBJECT_SET, 0)
 
         self.object_set = WORLD_MAP_OBJECT_SET
-        self.tsa_data = ROM.get_tsa_data(self.object_set)
+        self.tsa_data = ROM.get_tsa_table(self.object_set)
 
         self.world = 0
         self.level_number = world_index
@@ -83,8 +84,12 @@ class WorldMap(LevelLike):
         return [obj.name for obj in self.objects]
 
     def draw(self, dc, zoom, transparency=None, show_expansion=None):
+        block_atlas = get_block_atlas(
+            tuple(tuple(c for c in pal) for pal in self.palette_group), self.graphics_set, self.tsa_data
+        )
+
         for obj in self.objects:
-            obj.draw(dc, Block.SIDE_LENGTH * zoom, transparency)
+            obj.draw(dc, Block.SIDE_LENGTH * zoom, transparency, block_atlas=block_atlas)
 
     def index_of(self, obj):
         return self.objects.index(obj)
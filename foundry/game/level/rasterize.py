@@ -0,0 +1,455 @@
+"""
+Draws the blocks of a level into NumPy arrays, without painting anything through Qt.
+
+Every block of a tileset is decoded once into an array of NES colors, so drawing a level only needs a grid of the
+index of the block in every cell, from which the pixels of the whole level are gathered at once. Neither Qt, nor a
+``QApplication`` or a display are needed, since the objects are laid out by :class:`BlockGenerator` and the header is
+read by :class:`LevelHeader`, which makes this suitable for thumbnails, screenshots and comparing levels in scripts and
+tests. A :class:`~foundry.game.level.Level.Level` of the editor can be drawn as well, as its objects are generated the
+same way.
+
+Only the blocks are drawn, which is the same as what :class:`~foundry.gui.LevelDrawer.LevelDrawer` draws for the
+background and the objects of a level. Enemies, the overlays of objects, selections and decorations like the grid
+are left out.
+"""
+
+from functools import lru_cache
+from typing import TYPE_CHECKING, Iterable, Iterator, Optional, Sequence, Union
+
+import numpy as np
+
+from foundry.core.graphics_set.GraphicsSet import GraphicsSet, decode_blocks
+from foundry.core.palette import get_nes_colors
+from foundry.core.palette.PaletteGroup import get_palette_group_colors
+from foundry.game.File import ROM
+from foundry.game.gfx.objects.BlockGenerator import (
+    BLANK,
+    GROUND,
+    SPECIAL_BACKGROUND_OBJECTS,
+    BlockGenerator,
+    Rect,
+)
+from foundry.game.level.LevelDataCursor import LevelDataCursor
+from foundry.game.ObjectSet import ObjectSet
+from foundry.smb3parse.constants import TILESET_BACKGROUND_BLOCKS
+from foundry.smb3parse.levels import HEADER_LENGTH, LEVEL_MAX_LENGTH
+from foundry.smb3parse.levels.level_header import LevelHeader
+from foundry.smb3parse.objects.object_set import (
+    DESERT_OBJECT_SET,
+    DUNGEON_OBJECT_SET,
+    ICE_OBJECT_SET,
+)
+
+if TYPE_CHECKING:
+    from foundry.game.level.Level import Level
+
+BLOCK_COUNT = 0x100
+BLOCK_LENGTH = 16  # pixels
+BLOCKS_PER_PALETTE = 0x40
+
+JUMP_DOMAIN = 0b111  # the domain of the records of jumps, see Jump.POINTER_DOMAIN
+
+_Region = tuple[slice, slice]
+
+
+@lru_cache(2**4)
+def get_block_pixels(
+    palette_group: tuple[tuple[int, ...], ...], graphics_set: GraphicsSet, tsa_data: bytes
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Decodes every block of a tileset into the NES colors of its pixels.
+
+    Parameters
+    ----------
+    palette_group : tuple[tuple[int, ...], ...]
+        The palette group the blocks are colored with.
+    graphics_set : GraphicsSet
+        The graphics set the tiles of the blocks are taken from.
+    tsa_data : bytes
+        The TSA table of the object set, which defines the tiles of each block.
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray]
+        The index into the NES colors of every pixel of every block, with the transparent pixels having the
+        background color of the palette of the block, and whether each pixel is transparent. Both arrays have the
+        shape ``(256, 16, 16)`` and must not be changed, since they are shared.
+    """
+    color_indexes = decode_blocks(graphics_set, tsa_data)
+
+    # the upper two bits of the index of a block select its palette
+    block_palettes = np.array(palette_group, dtype=np.uint8)[np.arange(BLOCK_COUNT) // BLOCKS_PER_PALETTE]
+
+    colors = block_palettes[np.arange(BLOCK_COUNT)[:, np.newaxis, np.newaxis], color_indexes]
+    transparent = color_indexes == 0
+
+    colors.setflags(write=False)
+    transparent.setflags(write=False)
+
+    return colors, transparent
+
+
+def _forget_written_block_pixels(position: int, count: int):
+    """
+    Removes the pixels of every tileset, once the graphical data of the ROM is written to, as they are only keyed by
+    the pages of their graphics sets and not by their bytes.
+
+    Parameters
+    ----------
+    position : int
+        The position of the first byte written.
+    count : int
+        The amount of bytes written.
+    """
+    graphics_start, _ = ROM.graphics_range()
+
+    if position + count > graphics_start:
+        get_block_pixels.cache_clear()
+
+
+ROM.changes.subscribe(_forget_written_block_pixels)
+
+
+class _RasterizedObject(BlockGenerator):
+    """
+    An object of a level, which is only generated to be rasterized, so it finds the objects before it by itself,
+    instead of through a spatial index.
+
+    Attributes
+    ----------
+    objects_ref: list[BlockGenerator]
+        Every object of the level, in the order they are drawn in.
+    index_in_level: int
+        The index of the object in the objects of the level.
+    rect: tuple[int, int, int, int]
+        The x and y position and the width and height in blocks of the object, after it was rendered.
+    """
+
+    __slots__ = ("objects_ref", "index_in_level", "rect")
+
+    def __init__(self, data: bytearray, object_set: int, is_vertical: bool, objects_ref: list[BlockGenerator]):
+        self.objects_ref = objects_ref
+        self.index_in_level = len(objects_ref)
+
+        super().__init__(data, object_set, is_vertical)
+
+    def _earlier_rects_in(self, x: int, y: int, width: int, height: int) -> Iterable[Rect]:
+        area = (x, y, width, height)
+
+        return (obj.rect for obj in self.objects_ref[: self.index_in_level] if _intersects(area, obj.rect))
+
+    def _render(self):
+        super()._render()
+
+        self.rect = (
+            self.rendered_position.x,
+            self.rendered_position.y,
+            self.rendered_size.width,
+            self.rendered_size.height,
+        )
+
+
+def _span(position: int, length: int) -> tuple[int, int]:
+    # like QRect, a negative length spans the cells before the position
+    return (position + length, position - 1) if length < 0 else (position, position + length - 1)
+
+
+def _intersects(first: Rect, second: Rect) -> bool:
+    """
+    Checks if two rects overlap, exactly like ``QRect.intersects`` does, so objects are laid out like in the editor.
+    """
+    if first[2:] == (0, 0) or second[2:] == (0, 0):
+        return False
+
+    first_left, first_right = _span(first[0], first[2])
+    second_left, second_right = _span(second[0], second[2])
+    first_top, first_bottom = _span(first[1], first[3])
+    second_top, second_bottom = _span(second[1], second[3])
+
+    return (
+        first_left <= second_right
+        and second_left <= first_right
+        and first_top <= second_bottom
+        and second_top <= first_bottom
+    )
+
+
+def generate_objects(object_set_number: int, level_data: Union[bytes, bytearray]) -> list[BlockGenerator]:
+    """
+    Generates the objects of a level from its header and object data, leaving out its jumps.
+
+    Parameters
+    ----------
+    object_set_number : int
+        The object set of the level.
+    level_data : Union[bytes, bytearray]
+        The header of the level, followed by its objects and the delimiter after them.
+
+    Returns
+    -------
+    list[BlockGenerator]
+        The objects of the level, in the order they are drawn in.
+    """
+    is_vertical = bool(LevelHeader(bytearray(level_data[:HEADER_LENGTH]), object_set_number).is_vertical)
+
+    objects: list[BlockGenerator] = []
+
+    with LevelDataCursor(level_data, HEADER_LENGTH) as cursor:
+        for record in cursor.object_records(ObjectSet(object_set_number)):
+            if record[0] >> 5 != JUMP_DOMAIN:
+                objects.append(_RasterizedObject(record, object_set_number, is_vertical, objects))
+
+    return objects
+
+
+def _tileset_of(object_set_number: int, header: LevelHeader) -> tuple[tuple[tuple[int, ...], ...], GraphicsSet, bytes]:
+    return (
+        get_palette_group_colors(object_set_number, header.object_palette_index),
+        GraphicsSet.from_tileset(header.graphic_set_index),
+        ROM.get_tsa_table(object_set_number),
+    )
+
+
+def _resolve_rom_blocks(blocks: np.ndarray) -> np.ndarray:
+    # block indexes larger than a byte are offsets into the ROM, where the actual index is stored
+    rom_blocks = blocks > 0xFF
+
+    if rom_blocks.any():
+        for offset in np.unique(blocks[rom_blocks]):
+            blocks[blocks == offset] = ROM().get_byte(int(offset))
+
+    return blocks
+
+
+def _default_block_grid(object_set_number: int, header: LevelHeader) -> np.ndarray:
+    grid = np.full((header.height, header.width), TILESET_BACKGROUND_BLOCKS[object_set_number], dtype=np.intp)
+
+    if object_set_number == DESERT_OBJECT_SET:
+        grid[GROUND - 1 : GROUND] = 86
+
+    elif object_set_number == DUNGEON_OBJECT_SET:
+        grid[:] = 140
+        grid[0] = 139
+
+        grid[GROUND - 2 : GROUND - 1, 0::2] = 20
+        grid[GROUND - 2 : GROUND - 1, 1::2] = 21
+        grid[GROUND - 1 : GROUND, 0::2] = 22
+        grid[GROUND - 1 : GROUND, 1::2] = 23
+
+    elif object_set_number == ICE_OBJECT_SET:
+        grid[:] = 0x80
+
+    return grid
+
+
+def _clip(x: int, y: int, blocks: np.ndarray, width: int, height: int) -> Optional[tuple[_Region, np.ndarray]]:
+    left, top = max(x, 0), max(y, 0)
+    right, bottom = min(x + blocks.shape[1], width), min(y + blocks.shape[0], height)
+
+    if left >= right or top >= bottom:
+        return None
+
+    return (slice(top, bottom), slice(left, right)), blocks[top - y : bottom - y, left - x : right - x]
+
+
+def _object_layers(
+    header: LevelHeader, objects: Sequence[BlockGenerator]
+) -> Iterator[tuple[_Region, np.ndarray, bool]]:
+    """
+    Arranges the rendered blocks of the objects of a level, in the order they are drawn.
+
+    Returns
+    -------
+    Iterator[tuple[_Region, np.ndarray, bool]]
+        The cells of the level an object covers, the indexes of the blocks it draws there, with :data:`BLANK` for
+        the cells it leaves alone, and whether its blocks are always drawn without transparency.
+    """
+    for level_object in objects:
+        level_object.render()
+
+        if level_object.name.lower() in SPECIAL_BACKGROUND_OBJECTS:
+            x, y = level_object.position.x, level_object.position.y
+
+            # special backgrounds fill everything to the right of and below them, up to the ground
+            blocks = np.full((max(0, GROUND - y), LEVEL_MAX_LENGTH), level_object.blocks[0], dtype=np.intp)
+            always_opaque = True
+        else:
+            x, y = level_object.rendered_position.x, level_object.rendered_position.y
+            width = max(level_object.rendered_size.width, 1)
+
+            # the last row of blocks might not be complete
+            blocks = np.full(-(-len(level_object.rendered_blocks) // width) * width, BLANK, dtype=np.intp)
+            blocks[: len(level_object.rendered_blocks)] = level_object.rendered_blocks
+            blocks = blocks.reshape(-1, width)
+            always_opaque = False
+
+        clipped = _clip(x, y, _resolve_rom_blocks(blocks), header.width, header.height)
+
+        if clipped is not None:
+            yield clipped + (always_opaque,)
+
+
+def get_block_grid(object_set_number: int, header: LevelHeader, objects: Sequence[BlockGenerator]) -> np.ndarray:
+    """
+    Finds the block, which is visible in every cell of a level, when it is drawn without transparency.
+
+    Parameters
+    ----------
+    object_set_number : int
+        The object set of the level.
+    header : LevelHeader
+        The header of the level.
+    objects : Sequence[BlockGenerator]
+        The objects of the level, in the order they are drawn in.
+
+    Returns
+    -------
+    np.ndarray
+        The index of the block of every cell, with the shape ``(height, width)`` of the level in blocks.
+    """
+    grid = _default_block_grid(object_set_number, header)
+
+    for region, blocks, _ in _object_layers(header, objects):
+        grid[region] = np.where(blocks == BLANK, grid[region], blocks)
+
+    return grid
+
+
+def get_level_block_grid(level: "Level") -> np.ndarray:
+    """
+    Finds the block, which is visible in every cell of a level of the editor, see :func:`get_block_grid`.
+
+    Parameters
+    ----------
+    level : Level
+        The level to find the blocks of.
+
+    Returns
+    -------
+    np.ndarray
+        The index of the block of every cell, with the shape ``(height, width)`` of the level in blocks.
+    """
+    return get_block_grid(level.object_set_number, level.header, level.objects)
+
+
+@lru_cache(1)
+def _nes_color_table() -> np.ndarray:
+    return np.array(get_nes_colors(), dtype=np.uint8)
+
+
+def rasterize_objects(
+    object_set_number: int,
+    header: LevelHeader,
+    objects: Sequence[BlockGenerator],
+    transparent: bool = False,
+    indexed: bool = False,
+) -> np.ndarray:
+    """
+    Draws the blocks of a level, given by its header and objects, into an array.
+
+    Parameters
+    ----------
+    object_set_number : int
+        The object set of the level.
+    header : LevelHeader
+        The header of the level, which determines its size and its graphics.
+    objects : Sequence[BlockGenerator]
+        The objects of the level, in the order they are drawn in.
+    transparent : bool, optional
+        If the transparent pixels of the objects should show the blocks behind them, otherwise they are drawn in the
+        background color of the palette of their block, by default False.
+    indexed : bool, optional
+        If the index into the NES colors should be returned for every pixel, instead of its color, by default False.
+
+    Returns
+    -------
+    np.ndarray
+        The pixels of the level, with the shape ``(height, width, 3)`` holding the red, green and blue values of
+        every pixel or, if indexed, the shape ``(height, width)`` holding the index of the NES color of every pixel.
+    """
+    colors, transparent_pixels = get_block_pixels(*_tileset_of(object_set_number, header))
+
+    if transparent:
+        # the pixels of each block are kept together, so the objects can be drawn into the cells they cover
+        pixels = np.take(colors, _default_block_grid(object_set_number, header), axis=0)
+
+        for region, blocks, always_opaque in _object_layers(header, objects):
+            drawn = blocks != BLANK
+            blocks = np.where(drawn, blocks, 0)
+
+            visible = np.broadcast_to(drawn[:, :, np.newaxis, np.newaxis], pixels[region].shape)
+
+            if not always_opaque:
+                visible = visible & ~np.take(transparent_pixels, blocks, axis=0)
+
+            np.copyto(pixels[region], np.take(colors, blocks, axis=0), where=visible)
+
+        rows, columns = pixels.shape[:2]
+        image = pixels.transpose(0, 2, 1, 3).reshape(rows * BLOCK_LENGTH, columns * BLOCK_LENGTH)
+
+        return image if indexed else np.take(_nes_color_table(), image, axis=0)
+
+    if not indexed:
+        colors = np.take(_nes_color_table(), colors, axis=0)
+
+    grid = get_block_grid(object_set_number, header, objects)
+    rows, columns = grid.shape
+
+    # gathering whole rows of pixels of the blocks puts them right where they belong in the image, so the gathered
+    # pixels do not need to be rearranged afterwards
+    block_rows = colors.reshape(BLOCK_COUNT * BLOCK_LENGTH, -1)
+    row_indexes = grid[:, np.newaxis, :] * BLOCK_LENGTH + np.arange(BLOCK_LENGTH)[:, np.newaxis]
+
+    return np.take(block_rows, row_indexes, axis=0).reshape(
+        rows * BLOCK_LENGTH, columns * BLOCK_LENGTH, *colors.shape[3:]
+    )
+
+
+def rasterize_level(level: "Level", transparent: bool = False, indexed: bool = False) -> np.ndarray:
+    """
+    Draws the blocks of a level of the editor into an array, see :func:`rasterize_objects`.
+
+    Parameters
+    ----------
+    level : Level
+        The level to draw.
+    transparent : bool, optional
+        If the transparent pixels of the objects should show the blocks behind them, by default False.
+    indexed : bool, optional
+        If the index into the NES colors should be returned for every pixel, instead of its color, by default False.
+
+    Returns
+    -------
+    np.ndarray
+        The pixels of the level, as returned by :func:`rasterize_objects`.
+    """
+    return rasterize_objects(level.object_set_number, level.header, level.objects, transparent, indexed)
+
+
+def rasterize_level_data(
+    object_set_number: int, level_data: Union[bytes, bytearray], transparent: bool = False, indexed: bool = False
+) -> np.ndarray:
+    """
+    Draws the blocks of a level, given by its header and object data, with the graphics of the loaded ROM.
+
+    Parameters
+    ----------
+    object_set_number : int
+        The object set of the level.
+    level_data : Union[bytes, bytearray]
+        The header of the level, followed by its objects and the delimiter after them.
+    transparent : bool, optional
+        If the transparent pixels of the objects should show the blocks behind them, by default False.
+    indexed : bool, optional
+        If the index into the NES colors should be returned for every pixel, instead of its color, by default False.
+
+    Returns
+    -------
+    np.ndarray
+        The pixels of the level, as returned by :func:`rasterize_objects`.
+    """
+    header = LevelHeader(bytearray(level_data[:HEADER_LENGTH]), object_set_number)
+
+    return rasterize_objects(
+        object_set_number, header, generate_objects(object_set_number, level_data), transparent, indexed
+    )
@@ -1,9 +1,9 @@
-from json import loads
 from typing import Optional
 
 from pydantic import BaseModel
 
 from foundry import data_dir
+from foundry.game.Definitions import load_definitions
 
 
 class Location(BaseModel):
@@ -116,6 +116,9 @@ def get_worlds(levels: list[Level]) -> int:
     return worlds
 
 
+class Levels(BaseModel):
+    __root__: list[Level]
+
+
 def load_level_offsets() -> list[Level]:
-    with open(data_dir.joinpath("levels.json"), "r") as f:
-        return [Level(**level) for level in loads(f.read())]
+    return load_definitions(data_dir.joinpath("levels.json"), Levels).__root__
@@ -68,20 +68,15 @@ class AutoScrollEditor(CustomDialog):
         autoscroll_item = _get_autoscroll(self.level_ref.level.enemies)
 
         if autoscroll_item is not None:
-            self.level_ref.level.enemies.remove(autoscroll_item)
+            self.level_ref.level.remove_object(autoscroll_item)
 
         if should_insert:
-            self.level_ref.level.enemies.insert(0, self._create_autoscroll_object())
+            self.level_ref.level.add_enemy(OBJ_AUTOSCROLL, 0, self.y_position_spinner.value(), 0)
 
         self.level_ref.data_changed.emit()
 
         self.update()
 
-    def _create_autoscroll_object(self):
-        return self.level_ref.level.enemy_item_factory.from_properties(
-            OBJ_AUTOSCROLL, 0, self.y_position_spinner.value()
-        )
-
     def closeEvent(self, event):
         current_autoscroll_item = _get_autoscroll(self.level_ref.level.enemies)
 
@@ -12,12 +12,14 @@ from PySide6.QtWidgets import QComboBox, QLabel, QLayout, QStatusBar, QToolBar,
 
 from foundry import icon
 from foundry.core.graphics_set.GraphicsSet import GraphicsSet
+from foundry.core.LRUCache import invalidate_caches
 from foundry.core.palette import PALETTE_GROUPS_PER_OBJECT_SET
 from foundry.core.palette.PaletteGroup import MutablePaletteGroup
 from foundry.core.point.Point import Point
 from foundry.core.UndoController import UndoController
 from foundry.game.File import ROM
 from foundry.game.gfx.drawable.Block import Block
+from foundry.game.gfx.drawable.BlockAtlas import get_block_atlas
 from foundry.gui.BlockEditor import BlockEditorController as BlockEditor
 from foundry.gui.CustomChildWindow import CustomChildWindow
 from foundry.gui.LevelSelector import OBJECT_SET_ITEMS
@@ -122,8 +124,11 @@ class BlockViewerController(CustomChildWindow):
         self._update_tsa_data()
 
     def _update_tsa_data(self):
+        # only the images made from the old blocks of the tileset are outdated
+        old_tsa_data = ROM.get_tsa_table(self.tileset)
+
         ROM.write_tsa_data(self.tileset, self.tsa_data)
-        Block.clear_cache()
+        invalidate_caches(old_tsa_data)
         self.undo_action.setEnabled(self.undo_controller.can_undo)
         self.redo_action.setEnabled(self.undo_controller.can_redo)
         self.tile_square_assembly_changed.emit(self.tsa_data)
@@ -246,12 +251,11 @@ class BlockViewerView(QWidget):
         painter.drawRect(QRect(QPoint(0, 0), self.size()))
 
         graphics_set = GraphicsSet.from_tileset(self.object_set)
-        tsa_data = ROM.get_tsa_data(self.object_set)
+        tsa_data = ROM.get_tsa_table(self.object_set)
+        block_atlas = get_block_atlas(frozen_palette, graphics_set, tsa_data)
 
         for i in range(self.BLOCKS):
-            block = Block(i, frozen_palette, graphics_set, tsa_data)
-
             x = (i % self.BLOCKS_PER_ROW) * self.block_scale
             y = (i // self.BLOCKS_PER_ROW) * self.block_scale
 
-            block.draw(painter, x, y, self.block_scale)
+            block_atlas.draw(painter, i, x, y, self.block_scale)
@@ -1,5 +1,5 @@
 from itertools import product
-from typing import Tuple
+from typing import Optional, Tuple, Union
 
 from PySide6.QtCore import QPoint, QRect
 from PySide6.QtGui import QBrush, QColor, QImage, QPainter, QPen, Qt
@@ -7,10 +7,12 @@ from PySide6.QtGui import QBrush, QColor, QImage, QPainter, QPen, Qt
 from foundry import data_dir
 from foundry.core.graphics_set.GraphicsSet import GraphicsSet
 from foundry.core.palette import NESPalette
-from foundry.core.palette.PaletteGroup import MutablePaletteGroup
+from foundry.core.palette.PaletteGroup import get_palette_group_colors
 from foundry.game.File import ROM
 from foundry.game.gfx.drawable import apply_selection_overlay
 from foundry.game.gfx.drawable.Block import Block
+from foundry.game.gfx.drawable.BlockAtlas import BlockAtlas, get_block_atlas
+from foundry.game.gfx.objects.BlockGenerator import SPECIAL_BACKGROUND_OBJECTS
 from foundry.game.gfx.objects.EnemyItem import MASK_COLOR, EnemyObject
 from foundry.game.gfx.objects.LevelObject import (
     GROUND,
@@ -35,6 +37,9 @@ from foundry.smb3parse.objects.object_set import (
     ICE_OBJECT_SET,
 )
 
+# the sprites of enemies are drawn up to 7 blocks away from their rect, the blocks of level objects at most one
+DRAWN_OUTSIDE_OF_RECT = 8  # blocks
+
 png = QImage(str(data_dir / "gfx.png"))
 png.convertTo(QImage.Format_RGB888)
 
@@ -50,6 +55,10 @@ def _make_image_selected(image: QImage) -> QImage:
     return selected_image
 
 
+def _is_special_background(level_object: Union[LevelObject, EnemyObject]) -> bool:
+    return isinstance(level_object, LevelObject) and level_object.name.lower() in SPECIAL_BACKGROUND_OBJECTS
+
+
 def _load_from_png(x: int, y: int):
     image = png.copy(QRect(x * 16, y * 16, 16, 16))
     mask = image.createMaskFromColor(QColor(*MASK_COLOR).rgb(), Qt.MaskOutColor)
@@ -82,37 +91,25 @@ ITEM_ARROW = _load_from_png(53, 53)
 EMPTY_IMAGE = _load_from_png(0, 53)
 
 
-SPECIAL_BACKGROUND_OBJECTS = [
-    "blue background",
-    "starry background",
-    "underground background under this",
-    "sets background to actual background color",
-]
-
-
-def get_blocks(level: Level) -> list[Block]:
-    palette_group = MutablePaletteGroup.from_tileset(level.object_set_number, level.header.object_palette_index)
-    palette_group = tuple(tuple(c for c in pal) for pal in palette_group)
-    graphics_set = GraphicsSet.from_tileset(level.header.graphic_set_index)
-    tsa_data = ROM().get_tsa_data(level.object_set_number)
-
-    return [Block(i, palette_group, graphics_set, tsa_data) for i in range(0x100)]
-
-
-def _block_from_index(block_index: int, level: Level) -> Block:
+def get_block_atlas_for_level(level: Level) -> BlockAtlas:
     """
-    Returns the block at the given index, from the TSA table for the given level.
+    Provides the atlas of every block of the tileset of a level, as colored by its object palette.
 
-    :param block_index:
-    :param level:
-    :return:
-    """
+    Parameters
+    ----------
+    level : Level
+        The level to provide the blocks of.
 
-    palette_group = MutablePaletteGroup.from_tileset(level.object_set_number, level.header.object_palette_index)
+    Returns
+    -------
+    BlockAtlas
+        The atlas of the blocks of the level.
+    """
+    palette_group = get_palette_group_colors(level.object_set_number, level.header.object_palette_index)
     graphics_set = GraphicsSet.from_tileset(level.header.graphic_set_index)
-    tsa_data = ROM().get_tsa_data(level.object_set_number)
+    tsa_data = ROM.get_tsa_table(level.object_set_number)
 
-    return Block(block_index, tuple(tuple(c for c in pal) for pal in palette_group), graphics_set, tsa_data)
+    return get_block_atlas(palette_group, graphics_set, tsa_data)
 
 
 class LevelDrawer:
@@ -134,25 +131,97 @@ class LevelDrawer:
         self.screen_pen = QPen(QColor(0xFF, 0x00, 0x00, 0xFF))
         self.screen_pen.setWidth(1)
 
-    def draw(self, painter: QPainter, level: Level):
-        self._draw_background(painter, level)
+    def draw(self, painter: QPainter, level: Level, clip: Optional[QRect] = None):
+        """
+        Draws the level.
+
+        Parameters
+        ----------
+        painter : QPainter
+            The painter to draw the level with.
+        level : Level
+            The level to draw.
+        clip : Optional[QRect], optional
+            The area in pixels, which needs to be drawn. Everything outside of it is skipped as far as possible, so
+            the cost of drawing depends on the size of the area instead of the size of the level. The objects are
+            looked up by where they were last rendered. By default the whole level is drawn.
+        """
+        painter.save()
+
+        if clip is not None:
+            painter.setClipRect(clip, Qt.IntersectClip)
+
+        self._draw_content(painter, level, clip)
+        self._draw_decorations(painter, level, clip)
+
+        painter.restore()
+
+    def draw_content(self, painter: QPainter, level: Level, clip: Optional[QRect] = None):
+        """
+        Draws everything that belongs to the objects of the level: The background, the objects themselves and the
+        overlays on top of them. Together with :meth:`draw_decorations` this draws the same as :meth:`draw`.
+
+        Parameters
+        ----------
+        painter : QPainter
+            The painter to draw the level with.
+        level : Level
+            The level to draw.
+        clip : Optional[QRect], optional
+            The area in pixels, which needs to be drawn, by default the whole level is drawn.
+        """
+        painter.save()
 
-        self._draw_default_graphics(painter, level)
+        if clip is not None:
+            painter.setClipRect(clip, Qt.IntersectClip)
+
+        self._draw_content(painter, level, clip)
+
+        painter.restore()
+
+    def draw_decorations(self, painter: QPainter, level: Level, clip: Optional[QRect] = None):
+        """
+        Draws the information, which spans the whole level and is drawn on top of its content, like the grid, the
+        jumps, Mario and the autoscroll path.
+
+        Parameters
+        ----------
+        painter : QPainter
+            The painter to draw the level with.
+        level : Level
+            The level to draw.
+        clip : Optional[QRect], optional
+            The area in pixels, which needs to be drawn, by default the whole level is drawn.
+        """
+        painter.save()
+
+        if clip is not None:
+            painter.setClipRect(clip, Qt.IntersectClip)
+
+        self._draw_decorations(painter, level, clip)
+
+        painter.restore()
+
+    def _draw_content(self, painter: QPainter, level: Level, clip: Optional[QRect]):
+        self._draw_background(painter, level, clip)
+
+        self._draw_default_graphics(painter, level, clip)
 
         if level.object_set_number == DESERT_OBJECT_SET:
-            self._draw_desert_default_graphics(painter, level)
+            self._draw_desert_default_graphics(painter, level, clip)
         elif level.object_set_number == DUNGEON_OBJECT_SET:
-            self._draw_dungeon_default_graphics(painter, level)
+            self._draw_dungeon_default_graphics(painter, level, clip)
         elif level.object_set_number == ICE_OBJECT_SET:
-            self._draw_ice_default_graphics(painter, level)
+            self._draw_ice_default_graphics(painter, level, clip)
 
-        self._draw_objects(painter, level)
+        self._draw_objects(painter, level, clip)
 
-        self._draw_overlays(painter, level)
+        self._draw_overlays(painter, level, clip)
 
         if self.draw_expansions:
-            self._draw_expansions(painter, level)
+            self._draw_expansions(painter, level, clip)
 
+    def _draw_decorations(self, painter: QPainter, level: Level, clip: Optional[QRect]):
         if self.draw_mario:
             self._draw_mario(painter, level)
 
@@ -160,95 +229,193 @@ class LevelDrawer:
             self._draw_jumps(painter, level)
 
         if self.draw_grid:
-            self._draw_grid(painter, level)
+            self._draw_grid(painter, level, clip)
 
         if self.draw_autoscroll:
             self._draw_auto_scroll(painter, level)
 
-    def _draw_background(self, painter: QPainter, level: Level):
+    def object_area(self, level_object: Union[LevelObject, EnemyObject]) -> QRect:
+        """
+        The area an object can influence, when it is drawn.
+
+        Parameters
+        ----------
+        level_object : Union[LevelObject, EnemyObject]
+            The object to find the area of.
+
+        Returns
+        -------
+        QRect
+            The area in pixels the object is drawn into, including its overlays and selection outline.
+        """
+        area = level_object.drawn_rect(self.block_length)
+
+        if _is_special_background(level_object):
+            x, y = level_object.position.x, level_object.position.y
+
+            # special backgrounds fill everything to the right of and below them, up to the ground
+            background_rect = QRect(x, y, LEVEL_MAX_LENGTH, max(0, GROUND - y))
+
+            area = area.united(
+                QRect(
+                    background_rect.topLeft() * self.block_length,
+                    background_rect.size() * self.block_length,
+                )
+            )
+
+        # overlays are drawn at most a block away from the object
+        return area.adjusted(-self.block_length, -self.block_length, self.block_length + 1, self.block_length + 1)
+
+    @staticmethod
+    def _is_visible(rect: QRect, clip: Optional[QRect]) -> bool:
+        return clip is None or rect.intersects(clip)
+
+    def _objects_in(self, level: Level, clip: Optional[QRect]) -> list[Union[LevelObject, EnemyObject]]:
+        """
+        Finds the objects and enemies, which could be drawn into an area, through the spatial index of the level.
+
+        The objects are found by where they were last rendered, so objects, which changed, need to be rendered first.
+
+        Parameters
+        ----------
+        level : Level
+            The level to find the objects of.
+        clip : Optional[QRect]
+            The area in pixels, by default every object of the level is returned.
+
+        Returns
+        -------
+        list[Union[LevelObject, EnemyObject]]
+            The objects and enemies, which could be drawn into the area, ordered from back to front.
+        """
+        if clip is None:
+            return level.get_all_objects()
+
+        left = clip.left() // self.block_length - DRAWN_OUTSIDE_OF_RECT
+        right = clip.right() // self.block_length + DRAWN_OUTSIDE_OF_RECT
+        bottom = clip.bottom() // self.block_length + DRAWN_OUTSIDE_OF_RECT
+
+        # objects can render more blocks below their rect, than it covers, so everything above the area is included
+        found_objects = level.spatial_index.near(QRect(QPoint(left, -DRAWN_OUTSIDE_OF_RECT), QPoint(right, bottom)))
+        found_ids = set(map(id, found_objects))
+
+        # special backgrounds fill everything to the right of and below them, no matter how far away they are
+        special_backgrounds = [
+            level_object
+            for level_object in level.objects
+            if id(level_object) not in found_ids and _is_special_background(level_object)
+        ]
+
+        if not special_backgrounds:
+            return found_objects
+
+        return sorted(found_objects + special_backgrounds, key=level.spatial_index.order_of)
+
+    def _visible_columns(self, level: Level, clip: Optional[QRect]) -> range:
+        if clip is None:
+            return range(level.width)
+
+        return range(max(0, clip.left() // self.block_length), min(level.width, clip.right() // self.block_length + 1))
+
+    def _visible_rows(self, level: Level, clip: Optional[QRect]) -> range:
+        if clip is None:
+            return range(level.height)
+
+        return range(max(0, clip.top() // self.block_length), min(level.height, clip.bottom() // self.block_length + 1))
+
+    def _draw_background(self, painter: QPainter, level: Level, clip: Optional[QRect]):
         painter.save()
 
+        palette_group = get_palette_group_colors(level.object_set_number, level.header.object_palette_index)
+
         if level.object_set_number == CLOUDY_OBJECT_SET:
-            bg_color = NESPalette[
-                MutablePaletteGroup.from_tileset(level.object_set_number, level.header.object_palette_index)[3][2]
-            ]
+            bg_color = NESPalette[palette_group[3][2]]
         else:
-            bg_color = MutablePaletteGroup.from_tileset(
-                level.object_set_number, level.header.object_palette_index
-            ).background_color
+            bg_color = NESPalette[palette_group[0][0]]
 
-        painter.fillRect(level.get_rect(self.block_length), bg_color)
+        level_rect = level.get_rect(self.block_length)
+
+        painter.fillRect(level_rect if clip is None else level_rect.intersected(clip), bg_color)
 
         painter.restore()
 
-    def _draw_dungeon_default_graphics(self, painter: QPainter, level: Level):
-        # draw_background
-        bg_block = _block_from_index(140, level)
+    def _draw_dungeon_default_graphics(self, painter: QPainter, level: Level, clip: Optional[QRect]):
+        block_atlas = get_block_atlas_for_level(level)
 
-        for x, y in product(range(level.width), range(level.height)):
-            bg_block.draw(painter, x * self.block_length, y * self.block_length, self.block_length)
+        columns = self._visible_columns(level, clip)
+        rows = self._visible_rows(level, clip)
 
-        # draw ceiling
-        ceiling_block = _block_from_index(139, level)
+        # draw_background
+        for x, y in product(columns, rows):
+            block_atlas.draw(painter, 140, x * self.block_length, y * self.block_length, self.block_length)
 
-        for x in range(level.width):
-            ceiling_block.draw(painter, x * self.block_length, 0, self.block_length)
+        # draw ceiling
+        if 0 in rows:
+            for x in columns:
+                block_atlas.draw(painter, 139, x * self.block_length, 0, self.block_length)
 
         # draw floor
-        upper_floor_blocks = [_block_from_index(20, level), _block_from_index(21, level)]
-        lower_floor_blocks = [_block_from_index(22, level), _block_from_index(23, level)]
+        upper_floor_blocks = [20, 21]
+        lower_floor_blocks = [22, 23]
 
         upper_y = (GROUND - 2) * self.block_length
         lower_y = (GROUND - 1) * self.block_length
 
-        for block_x in range(level.width):
+        for block_x in columns:
             pixel_x = block_x * self.block_length
 
-            upper_floor_blocks[block_x % 2].draw(painter, pixel_x, upper_y, self.block_length)
-            lower_floor_blocks[block_x % 2].draw(painter, pixel_x, lower_y, self.block_length)
+            block_atlas.draw(painter, upper_floor_blocks[block_x % 2], pixel_x, upper_y, self.block_length)
+            block_atlas.draw(painter, lower_floor_blocks[block_x % 2], pixel_x, lower_y, self.block_length)
 
-    def _draw_desert_default_graphics(self, painter: QPainter, level: Level):
+    def _draw_desert_default_graphics(self, painter: QPainter, level: Level, clip: Optional[QRect]):
         floor_level = (GROUND - 1) * self.block_length
         floor_block_index = 86
 
-        floor_block = _block_from_index(floor_block_index, level)
+        block_atlas = get_block_atlas_for_level(level)
 
-        for x in range(level.width):
-            floor_block.draw(painter, x * self.block_length, floor_level, self.block_length)
+        for x in self._visible_columns(level, clip):
+            block_atlas.draw(painter, floor_block_index, x * self.block_length, floor_level, self.block_length)
 
-    def _draw_ice_default_graphics(self, painter: QPainter, level: Level):
-        bg_block = _block_from_index(0x80, level)
+    def _draw_ice_default_graphics(self, painter: QPainter, level: Level, clip: Optional[QRect]):
+        block_atlas = get_block_atlas_for_level(level)
 
-        for x, y in product(range(level.width), range(level.height)):
-            bg_block.draw(painter, x * self.block_length, y * self.block_length, self.block_length)
+        for x, y in product(self._visible_columns(level, clip), self._visible_rows(level, clip)):
+            block_atlas.draw(painter, 0x80, x * self.block_length, y * self.block_length, self.block_length)
 
-    def _draw_default_graphics(self, painter: QPainter, level: Level):
-        bg_block = _block_from_index(TILESET_BACKGROUND_BLOCKS[level.object_set_number], level)
+    def _draw_default_graphics(self, painter: QPainter, level: Level, clip: Optional[QRect]):
+        block_atlas = get_block_atlas_for_level(level)
+        bg_block_index = TILESET_BACKGROUND_BLOCKS[level.object_set_number]
 
-        for x, y in product(range(level.width), range(level.height)):
-            bg_block.draw(painter, x * self.block_length, y * self.block_length, self.block_length)
+        for x, y in product(self._visible_columns(level, clip), self._visible_rows(level, clip)):
+            block_atlas.draw(painter, bg_block_index, x * self.block_length, y * self.block_length, self.block_length)
 
-    def _draw_objects(self, painter: QPainter, level: Level):
-        bg_palette_group = tuple(
-            tuple(c for c in pal)
-            for pal in MutablePaletteGroup.from_tileset(level.object_set_number, level.header.object_palette_index)
-        )
-        spr_palette_group = tuple(
-            tuple(c for c in pal)
-            for pal in MutablePaletteGroup.from_tileset(level.object_set_number, 8 + level.header.enemy_palette_index)
-        )
+    def _draw_objects(self, painter: QPainter, level: Level, clip: Optional[QRect]):
+        bg_palette_group = get_palette_group_colors(level.object_set_number, level.header.object_palette_index)
+        spr_palette_group = get_palette_group_colors(level.object_set_number, 8 + level.header.enemy_palette_index)
+
+        block_atlas = get_block_atlas_for_level(level)
 
-        blocks = get_blocks(level)
+        # the palettes do not change the layout of the objects, so they only need to be updated once they changed
         for level_object in level.objects:
-            level_object.palette_group = bg_palette_group
+            if level_object.palette_group != bg_palette_group:
+                level_object.palette_group = bg_palette_group
         for enemy in level.enemies:
-            enemy.palette_group = spr_palette_group
-
-        for level_object in level.get_all_objects():
+            if enemy.palette_group != spr_palette_group:
+                enemy.palette_group = spr_palette_group
 
+        for level_object in self._objects_in(level, clip):
+            # only renders the objects, which changed since the last time they were drawn
             level_object.render()
 
-            if level_object.name.lower() in SPECIAL_BACKGROUND_OBJECTS and isinstance(level_object, LevelObject):
+            is_special_background = _is_special_background(level_object)
+
+            # the selection outline is drawn one pixel past the rect of the object
+            if not is_special_background and not self._is_visible(
+                level_object.drawn_rect(self.block_length).adjusted(0, 0, 1, 1), clip
+            ):
+                continue
+
+            if is_special_background:
                 width = LEVEL_MAX_LENGTH
                 height = GROUND - level_object.position.y
 
@@ -258,27 +425,41 @@ class LevelDrawer:
                     x = level_object.position.x + index % width
                     y = level_object.position.y + index // width
 
-                    level_object._draw_block(painter, block_index, x, y, self.block_length, False, blocks=blocks)
+                    level_object._draw_block(
+                        painter, block_index, x, y, self.block_length, False, block_atlas=block_atlas
+                    )
             else:
                 if isinstance(level_object, LevelObject):
-                    level_object.draw(painter, self.block_length, self.transparency, blocks=blocks)
+                    level_object.draw(painter, self.block_length, self.transparency, block_atlas=block_atlas)
                 else:
                     level_object.draw(painter, self.block_length, self.transparency)
 
             if level_object.selected:
-                painter.save()
+                self._draw_outline(painter, level_object.get_rect(self.block_length), QColor(0x00, 0x00, 0x00, 0x80))
 
-                pen = QPen(QColor(0x00, 0x00, 0x00, 0x80))
-                pen.setWidth(1)
-                painter.setPen(pen)
-                painter.drawRect(level_object.get_rect(self.block_length))
+    @staticmethod
+    def _draw_outline(painter: QPainter, rect: QRect, color: QColor):
+        # same pixels as a stroked rect with a pen of width 1, but stroked lines are rasterized differently, when
+        # they are partially outside of the device, which made them depend on where the level was drawn to
+        x, y, width, height = rect.getRect()
 
-                painter.restore()
+        painter.fillRect(QRect(x, y, width + 1, 1), color)
+        painter.fillRect(QRect(x, y + height, width + 1, 1), color)
+        painter.fillRect(QRect(x, y + 1, 1, height - 1), color)
+        painter.fillRect(QRect(x + width, y + 1, 1, height - 1), color)
 
-    def _draw_overlays(self, painter: QPainter, level: Level):
+    def _draw_overlays(self, painter: QPainter, level: Level, clip: Optional[QRect]):
         painter.save()
 
-        for level_object in level.get_all_objects():
+        for level_object in self._objects_in(level, clip):
+            # overlays are drawn at most a block away from the object
+            overlay_area = level_object.get_rect(self.block_length).adjusted(
+                -self.block_length, -self.block_length, self.block_length, self.block_length
+            )
+
+            if not self._is_visible(overlay_area, clip):
+                continue
+
             name = level_object.name.lower()
 
             # only handle this specific enemy item for now
@@ -434,10 +615,13 @@ class LevelDrawer:
         else:
             return False
 
-    def _draw_expansions(self, painter: QPainter, level: Level):
+    def _draw_expansions(self, painter: QPainter, level: Level, clip: Optional[QRect]):
         for level_object in level.get_all_objects():
+            if not self._is_visible(level_object.get_rect(self.block_length).adjusted(0, 0, 1, 1), clip):
+                continue
+
             if level_object.selected:
-                painter.drawRect(level_object.get_rect(self.block_length))
+                self._draw_outline(painter, level_object.get_rect(self.block_length), painter.pen().color())
 
             if self.draw_expansions:
                 painter.save()
@@ -478,15 +662,17 @@ class LevelDrawer:
 
             painter.drawRect(jump.get_rect(self.block_length, level.is_vertical))
 
-    def _draw_grid(self, painter: QPainter, level: Level):
+    def _draw_grid(self, painter: QPainter, level: Level, clip: Optional[QRect]):
         panel_width, panel_height = level.get_rect(self.block_length).size().toTuple()
 
         painter.setPen(self.grid_pen)
 
         for x in range(0, panel_width, self.block_length):
-            painter.drawLine(x, 0, x, panel_height)
+            if clip is None or clip.left() <= x <= clip.right():
+                painter.drawLine(x, 0, x, panel_height)
         for y in range(0, panel_height, self.block_length):
-            painter.drawLine(0, y, panel_width, y)
+            if clip is None or clip.top() <= y <= clip.bottom():
+                painter.drawLine(0, y, panel_width, y)
 
         painter.setPen(self.screen_pen)
 
@@ -1,8 +1,7 @@
-from bisect import bisect_right
 from typing import List, Optional, Tuple, Union
 from warnings import warn
 
-from PySide6.QtCore import QMimeData, QPoint, QSize, Signal, SignalInstance
+from PySide6.QtCore import QMimeData, QPoint, QRect, QSize, Signal, SignalInstance
 from PySide6.QtGui import (
     QDragEnterEvent,
     QDragMoveEvent,
@@ -29,11 +28,11 @@ from foundry.game.gfx.objects.util import (
     increment_type,
     resize_level_object,
 )
-from foundry.game.level.Level import Level
 from foundry.game.level.LevelRef import LevelRef
 from foundry.game.level.WorldMap import WorldMap
 from foundry.gui.ContextMenu import ContextMenu
 from foundry.gui.LevelDrawer import LevelDrawer
+from foundry.gui.ScreenCache import ScreenCache
 from foundry.gui.SelectionSquare import SelectionSquare
 from foundry.gui.settings import RESIZE_LEFT_CLICK, RESIZE_RIGHT_CLICK, SETTINGS
 
@@ -75,6 +74,7 @@ class LevelView(QWidget):
         self.context_menu = context_menu
 
         self.level_drawer = LevelDrawer()
+        self.screen_cache = ScreenCache(self.level_drawer)
 
         self.draw_grid = SETTINGS["draw_grid"]
         self.draw_jumps = SETTINGS["draw_jumps"]
@@ -330,6 +330,7 @@ class LevelView(QWidget):
         else:
             decrement_type(obj)
         obj.selected = True
+        self.level_ref.level.notify_object_listeners([obj])
 
     def sizeHint(self) -> QSize:
         if not self.level_ref:
@@ -339,10 +340,37 @@ class LevelView(QWidget):
 
             return QSize(width * self.block_length, height * self.block_length)
 
-    def update(self):
+    def update(self, *args):
         self.resize(self.sizeHint())
 
-        super(LevelView, self).update()
+        super(LevelView, self).update(*args)
+
+    def _object_area(self, obj: Optional[Union[LevelObject, EnemyObject]]) -> QRect:
+        """
+        The area of the view, which needs to be repainted, when an object changes.
+
+        Parameters
+        ----------
+        obj : Optional[Union[LevelObject, EnemyObject]]
+            The object that changed or None, if there is no object.
+
+        Returns
+        -------
+        QRect
+            The area in pixels the object is drawn into, including its overlays and selection outline.
+        """
+        if obj is None:
+            return QRect()
+
+        self.level_drawer.block_length = self.block_length
+
+        return self.level_drawer.object_area(obj)
+
+    def _selection_square_area(self) -> QRect:
+        if not self.selection_square.should_draw:
+            return QRect()
+
+        return self.selection_square.get_rect().normalized().adjusted(-1, -1, 2, 2)
 
     def _on_right_mouse_button_down(self, event: QMouseEvent):
         if self.mouse_mode == MODE_DRAG:
@@ -421,7 +449,8 @@ class LevelView(QWidget):
         self.setCursor(Qt.ArrowCursor)
 
     def _stop_resize(self):
-        self.level_ref.save_level_state()
+        # resizing the same objects again and again is undone at once
+        self.level_ref.save_level_state(("resize", *map(id, self.get_selected_objects())))
         self.resizing_happened = False
         self.mouse_mode = MODE_FREE
         self.setCursor(Qt.ArrowCursor)
@@ -506,7 +535,8 @@ class LevelView(QWidget):
 
     def _stop_drag(self):
         if self.dragging_happened:
-            self.level_ref.save_level_state()
+            # moving the same objects again and again is undone at once
+            self.level_ref.save_level_state(("move", *map(id, self.get_selected_objects())))
 
         self.dragging_happened = False
 
@@ -557,21 +587,30 @@ class LevelView(QWidget):
         if not self.selection_square.is_active():
             return
 
+        changed_area = self._selection_square_area()
+
         self.selection_square.set_current_end(position)
 
+        changed_area = changed_area.united(self._selection_square_area())
+
         sel_rect = self.selection_square.get_adjusted_rect(self.block_length, self.block_length)
 
-        touched_objects = [obj for obj in self.level_ref.level.get_all_objects() if sel_rect.intersects(obj.get_rect())]
+        touched_objects = self.level_ref.level.get_objects_intersecting(sel_rect)
 
         if touched_objects != self.level_ref.selected_objects:
+            for obj in set(touched_objects).symmetric_difference(self.level_ref.selected_objects):
+                changed_area = changed_area.united(self._object_area(obj))
+
             self._set_selected_objects(touched_objects)
 
-        self.update()
+        self.update(changed_area)
 
     def _stop_selection_square(self):
+        changed_area = self._selection_square_area()
+
         self.selection_square.stop()
 
-        self.update()
+        self.update(changed_area)
 
     def select_all(self):
         self.select_objects(self.level_ref.level.get_all_objects())
@@ -649,15 +688,9 @@ class LevelView(QWidget):
         if self.level_ref is None:
             raise ValueError("Level is None")
 
-        enemies_end = self.level_ref.level.enemies_end
-
-        levels_by_enemy_offset = sorted(Level.offsets, key=lambda level: level.enemy_pointer)
-
-        level_index = bisect_right([level.enemy_pointer for level in levels_by_enemy_offset], enemies_end) - 1
-
-        found_level = levels_by_enemy_offset[level_index]
+        found_level = self.level_ref.level.level_overwritten_by_enemies()
 
-        if found_level.enemy_pointer == self.level_ref.level.enemy_offset:
+        if found_level is None:
             return ""
         else:
             return (
@@ -668,18 +701,9 @@ class LevelView(QWidget):
         if self.level_ref is None:
             raise ValueError("Level is None")
 
-        end_of_level_objects = self.level_ref.level.objects_end
+        found_level = self.level_ref.level.level_overwritten_by_objects()
 
-        level_index = (
-            bisect_right(
-                [level.generator_pointer - Level.HEADER_LENGTH for level in Level.sorted_offsets], end_of_level_objects
-            )
-            - 1
-        )
-
-        found_level = Level.sorted_offsets[level_index]
-
-        if found_level.generator_pointer == self.level_ref.level.object_offset:
+        if found_level is None:
             return ""
         else:
             return (
@@ -732,10 +756,12 @@ class LevelView(QWidget):
         self.level_ref.level.add_enemy(enemy_index, level_x, level_y, index)
 
     def replace_object(self, obj: LevelObject, domain: int, obj_index: int, length: Optional[int]):
+        index_in_level = self.level_ref.level.index_of(obj)
+
         self.remove_object(obj)
 
         new_obj = self.level_ref.level.add_object(
-            domain, obj_index, obj.position.x, obj.position.y, length, obj.index_in_level
+            domain, obj_index, obj.position.x, obj.position.y, length, index_in_level
         )
         new_obj.selected = obj.selected
 
@@ -755,6 +781,7 @@ class LevelView(QWidget):
 
     def remove_jump(self, index: int):
         del self.level_ref.level.jumps[index]
+        self.level_ref.level.jumps_changed.emit()
 
         self.update()
 
@@ -804,14 +831,18 @@ class LevelView(QWidget):
 
         level_object.position = Point(x, y)
 
+        changed_area = self._object_area(self.currently_dragged_object).united(self._object_area(level_object))
+
         self.currently_dragged_object = level_object
 
-        self.repaint()
+        self.repaint(changed_area)
 
     def dragLeaveEvent(self, event):
+        changed_area = self._object_area(self.currently_dragged_object)
+
         self.currently_dragged_object = None
 
-        self.repaint()
+        self.repaint(changed_area)
 
     @undoable
     def dropEvent(self, event):
@@ -852,7 +883,7 @@ class LevelView(QWidget):
 
         self.level_drawer.block_length = self.block_length
 
-        self.level_drawer.draw(painter, self.level_ref.level)
+        self.screen_cache.draw(painter, self.level_ref.level, event.rect())
 
         self.selection_square.draw(painter)
 
@@ -1,3 +1,5 @@
+import operator
+
 from PySide6.QtCore import QSize
 from PySide6.QtGui import QMouseEvent, Qt
 from PySide6.QtWidgets import QListWidget, QScrollBar, QSizePolicy, QWidget
@@ -25,6 +27,7 @@ class ObjectList(QListWidget):
         self.context_menu = context_menu
 
         self.labels = []
+        self._level_objects = []
         self._on_selection_changed_ongoing = False
         self.itemSelectionChanged.connect(self.on_selection_changed)
 
@@ -106,6 +109,13 @@ class ObjectList(QListWidget):
 
             self.blockSignals(False)
 
+        elif not all(map(operator.is_, level_objects, self._level_objects)):
+            # same names, but different objects, for example after an undo, so the items have to point to the new ones
+            for index, level_object in enumerate(level_objects):
+                self.item(index).setData(Qt.UserRole, level_object)
+
+        self._level_objects = level_objects
+
         has_changes = False
         for index, level_object in enumerate(level_objects):
             if level_object.selected and index not in currently_selected:
@@ -233,7 +233,7 @@ class BlockArray(QWidget):
                 block_index,
                 tuple(tuple(c for c in pal) for pal in self.level_object.palette_group),
                 self.level_object.graphics_set,
-                bytes(self.level_object.tsa_data),
+                self.level_object.tsa_data,
             )
             self.layout().addWidget(BlockArea(block))
 
@@ -20,7 +20,7 @@ from foundry.core.palette import NESPalette
 from foundry.core.palette.PaletteGroup import MutablePaletteGroup
 from foundry.core.point.Point import Point
 from foundry.game.gfx.drawable import MASK_COLOR
-from foundry.game.gfx.drawable.Tile import Tile
+from foundry.game.gfx.drawable.Tile import Tile, get_tile
 from foundry.gui.CustomChildWindow import CustomChildWindow
 
 
@@ -176,7 +176,7 @@ class PatternViewerView(QWidget):
         painter.drawRect(QRect(QPoint(0, 0), self.size()))
 
         for i in range(self.PATTERNS):
-            tile = Tile(
+            tile = get_tile(
                 i, tuple(tuple(c for c in pal) for pal in self.palette_group), self.palette_index, self.graphics_set
             )
 
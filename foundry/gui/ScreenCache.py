@@ -0,0 +1,262 @@
+from collections import OrderedDict
+from typing import Optional, Union
+
+from PySide6.QtCore import QRect
+from PySide6.QtGui import QPainter, QPixmap, Qt
+
+from foundry.core.palette.PaletteGroup import get_palette_group_colors
+from foundry.game.File import ROM
+from foundry.game.gfx.objects.EnemyItem import EnemyObject
+from foundry.game.gfx.objects.LevelObject import (
+    SCREEN_HEIGHT,
+    SCREEN_WIDTH,
+    LevelObject,
+)
+from foundry.game.level.Level import Level
+from foundry.gui.LevelDrawer import LevelDrawer, get_block_atlas_for_level
+from foundry.gui.settings import SETTINGS
+
+_Variant = tuple[int, bool, bool, bool, bool, bool]
+_Key = tuple[_Variant, int]
+
+
+class ScreenCache:
+    """
+    A cache of the content of a level, drawn screen by screen, so painting the level only requires copying the
+    screens, which are visible, as long as nothing on them changed.
+
+    Every screen is cached once per zoom level and combination of view options, which affect the content of the level.
+    The level reports the objects, which changed, see :meth:`Level.add_object_listener`, so before drawing only the
+    screens touched by the old and new areas of those objects are drawn again. Everything is drawn again, if the
+    header, the jumps or the graphics and palettes of the ROM changed, which the level and :attr:`ROM.changes` report.
+
+    Attributes
+    ----------
+    drawer: LevelDrawer
+        The drawer used to draw the screens and everything, which is drawn on top of them.
+    byte_budget: int
+        The amount of bytes the cached screens are allowed to take up, before the least recently used ones are
+        discarded.
+    """
+
+    def __init__(self, drawer: LevelDrawer, byte_budget: Optional[int] = None):
+        self.drawer = drawer
+        self.byte_budget = SETTINGS["screen_cache_budget"] if byte_budget is None else byte_budget
+
+        self._screens: OrderedDict[_Key, QPixmap] = OrderedDict()
+        self._size_in_bytes = 0
+
+        self._level: Optional[Level] = None
+        self._level_state: tuple = ()
+        self._level_state_outdated = True
+
+        # keeping the objects themselves makes sure, that their ids can not be reused by new objects
+        self._object_screens: dict[int, tuple[Union[LevelObject, EnemyObject], range]] = {}
+        self._changed_objects: dict[int, Union[LevelObject, EnemyObject]] = {}
+
+        ROM.changes.subscribe(self._rom_changed)
+
+    @property
+    def size_in_bytes(self) -> int:
+        """
+        The amount of bytes taken up by the cached screens.
+        """
+        return self._size_in_bytes
+
+    def __len__(self) -> int:
+        return len(self._screens)
+
+    def clear(self):
+        """
+        Discards every cached screen.
+        """
+        self._screens.clear()
+        self._size_in_bytes = 0
+
+    def draw(self, painter: QPainter, level: Level, clip: Optional[QRect] = None):
+        """
+        Draws the level, like :meth:`LevelDrawer.draw`, but reuses the screens drawn before.
+
+        Parameters
+        ----------
+        painter : QPainter
+            The painter to draw the level with.
+        level : Level
+            The level to draw.
+        clip : Optional[QRect], optional
+            The area in pixels, which needs to be drawn, by default the whole level is drawn.
+        """
+        self._invalidate_changes(level)
+
+        variant = self._variant()
+
+        painter.save()
+
+        if clip is not None:
+            painter.setClipRect(clip, Qt.IntersectClip)
+
+        for screen in range(self._screen_count(level)):
+            screen_rect = self._screen_rect(level, screen)
+
+            if clip is not None and not screen_rect.intersects(clip):
+                continue
+
+            pixmap = self._get_screen(level, variant, screen, screen_rect)
+
+            if pixmap is None:
+                self.drawer.draw_content(painter, level, screen_rect if clip is None else screen_rect.intersected(clip))
+            else:
+                painter.drawPixmap(screen_rect.topLeft(), pixmap)
+
+        painter.restore()
+
+        self.drawer.draw_decorations(painter, level, clip)
+
+    def _variant(self) -> _Variant:
+        return (
+            self.drawer.block_length,
+            self.drawer.transparency,
+            self.drawer.draw_expansions,
+            self.drawer.draw_jumps_on_objects,
+            self.drawer.draw_items_in_blocks,
+            self.drawer.draw_invisible_items,
+        )
+
+    @staticmethod
+    def _screen_count(level: Level) -> int:
+        if level.is_vertical:
+            return -(-level.height // SCREEN_HEIGHT)
+        else:
+            return -(-level.width // SCREEN_WIDTH)
+
+    def _screen_rect(self, level: Level, screen: int) -> QRect:
+        if level.is_vertical:
+            screen_rect = QRect(0, screen * SCREEN_HEIGHT, level.width, SCREEN_HEIGHT)
+        else:
+            screen_rect = QRect(screen * SCREEN_WIDTH, 0, SCREEN_WIDTH, level.height)
+
+        screen_rect = screen_rect.intersected(level.get_rect())
+
+        return QRect(screen_rect.topLeft() * self.drawer.block_length, screen_rect.size() * self.drawer.block_length)
+
+    def _screens_in_area(self, level: Level, area: QRect) -> range:
+        if level.is_vertical:
+            start, end, screen_length = area.top(), area.bottom(), SCREEN_HEIGHT * self.drawer.block_length
+        else:
+            start, end, screen_length = area.left(), area.right(), SCREEN_WIDTH * self.drawer.block_length
+
+        return range(max(0, start // screen_length), max(0, end // screen_length + 1))
+
+    def _get_screen(self, level: Level, variant: _Variant, screen: int, screen_rect: QRect) -> Optional[QPixmap]:
+        key = variant, screen
+
+        if key in self._screens:
+            self._screens.move_to_end(key)
+
+            return self._screens[key]
+
+        size_in_bytes = screen_rect.width() * screen_rect.height() * QPixmap.defaultDepth() // 8
+
+        if size_in_bytes > self.byte_budget:
+            # would not fit anyway, so it is drawn directly
+            return None
+
+        pixmap = QPixmap(screen_rect.size())
+
+        painter = QPainter(pixmap)
+        painter.translate(-screen_rect.topLeft())
+        self.drawer.draw_content(painter, level, screen_rect)
+        painter.end()
+
+        self._screens[key] = pixmap
+        self._size_in_bytes += self._pixmap_size_in_bytes(pixmap)
+
+        while self._size_in_bytes > self.byte_budget:
+            _, discarded_pixmap = self._screens.popitem(last=False)
+            self._size_in_bytes -= self._pixmap_size_in_bytes(discarded_pixmap)
+
+        return pixmap
+
+    @staticmethod
+    def _pixmap_size_in_bytes(pixmap: QPixmap) -> int:
+        return pixmap.width() * pixmap.height() * pixmap.depth() // 8
+
+    def _invalidate_changes(self, level: Level):
+        if level is not self._level:
+            self._follow_level(level)
+
+        if self._level_state_outdated:
+            self._level_state_outdated = False
+
+            level_state = self._level_state_of(level)
+
+            if level_state != self._level_state:
+                # the palettes, graphics, header or jumps changed, which can affect every screen
+                self.clear()
+
+                self._level_state = level_state
+                self._changed_objects.clear()
+                self._object_screens = {
+                    id(level_object): (level_object, self._screens_of(level, level_object))
+                    for level_object in level.get_all_objects()
+                }
+
+                return
+
+        changed_screens: set[int] = set()
+
+        for level_object in self._changed_objects.values():
+            _, old_screens = self._object_screens.pop(id(level_object), (level_object, range(0)))
+            changed_screens.update(old_screens)
+
+            # removed objects are not part of the level anymore
+            if level_object in level.spatial_index:
+                new_screens = self._screens_of(level, level_object)
+
+                self._object_screens[id(level_object)] = level_object, new_screens
+                changed_screens.update(new_screens)
+
+        self._changed_objects.clear()
+
+        if not changed_screens:
+            return
+
+        for key in [key for key in self._screens if key[1] in changed_screens]:
+            self._size_in_bytes -= self._pixmap_size_in_bytes(self._screens.pop(key))
+
+    def _follow_level(self, level: Level):
+        if self._level is not None:
+            self._level.remove_object_listener(self._object_changed)
+            self._level.data_changed.disconnect(self._level_changed)
+            self._level.jumps_changed.disconnect(self._level_changed)
+
+        self._level = level
+        self._level.add_object_listener(self._object_changed)
+        self._level.data_changed.connect(self._level_changed)
+        self._level.jumps_changed.connect(self._level_changed)
+
+        self._level_state = ()
+        self._level_state_outdated = True
+
+    def _level_changed(self):
+        # the header or the jumps could have changed, which is checked before the next draw
+        self._level_state_outdated = True
+
+    def _rom_changed(self, *_):
+        self._level_state_outdated = True
+
+    def _object_changed(self, level_object: Union[LevelObject, EnemyObject]):
+        self._changed_objects[id(level_object)] = level_object
+
+    def _screens_of(self, level: Level, level_object: Union[LevelObject, EnemyObject]) -> range:
+        return self._screens_in_area(level, self.drawer.object_area(level_object))
+
+    def _level_state_of(self, level: Level) -> tuple:
+        return (
+            level.object_set_number,
+            bytes(level.header_bytes),
+            tuple(jump.to_bytes() for jump in level.jumps),
+            get_block_atlas_for_level(level),
+            get_palette_group_colors(level.object_set_number, 8 + level.header.enemy_palette_index),
+            ROM.changes.version_of(*ROM.graphics_range()),
+        )
@@ -1,14 +1,14 @@
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
 from PySide6.QtCore import QEvent, QRect, Qt, Signal, SignalInstance
 from PySide6.QtGui import QCursor, QFocusEvent
 from PySide6.QtWidgets import QLabel, QVBoxLayout, QWidget
 
+from foundry.core.warnings.LevelWarnings import LevelWarnings
 from foundry.game.gfx.objects.LevelObject import LevelObject
 from foundry.game.level.LevelRef import LevelRef
 from foundry.gui.LevelView import LevelView
 from foundry.gui.ObjectList import ObjectList
-from foundry.gui.util import clear_layout
 
 
 class WarningList(QWidget):
@@ -27,35 +27,51 @@ class WarningList(QWidget):
         self.setWindowFlag(Qt.Popup)
         self.layout().setContentsMargins(5, 5, 5, 5)
 
-        self._enemy_dict = {}
+        self._level_warnings: Optional[LevelWarnings] = None
+        self._labels: List[WarningLabel] = []
 
         self.warnings: List[Tuple[str, List[LevelObject]]] = []
 
     def _update_warnings(self):
-        self.warnings.clear()
+        if self._level_warnings is None or self._level_warnings.level is not self.level_ref.level:
+            if self._level_warnings is not None:
+                self._level_warnings.close()
 
-        level = self.level_ref.level
+            self._level_warnings = LevelWarnings(self.level_ref.level)
 
-        for index, obj in enumerate(level.objects + level.enemies + level.jumps):
-            for warning in obj.definition.get_warnings():
-                if warning.check_object(obj, level=level, index=index):
-                    self.warnings.append((warning.get_message(obj), [obj]))
+        self._level_warnings.update()
+
+        if self._level_warnings.warnings != self.warnings:
+            self.warnings = self._level_warnings.warnings
+
+            self.update()
 
-        self.update()
         self.warnings_updated.emit(bool(self.warnings))
 
     def update(self):
         self.hide()
 
-        clear_layout(self.layout())
+        # reuse the labels of the last warnings, so only the labels of new or removed warnings are created or deleted
+        for index, (warning_message, related_objects) in enumerate(self.warnings):
+            if index < len(self._labels):
+                label = self._labels[index]
+
+                if label.text() != warning_message:
+                    label.setText(warning_message)
+
+                label.related_objects = related_objects
+            else:
+                label = WarningLabel(warning_message, related_objects)
+                label.hovered.connect(self._focus_objects)
 
-        for warning in self.warnings:
-            warning_message, related_objects = warning
+                self.layout().addWidget(label)
+                self._labels.append(label)
 
-            label = WarningLabel(warning_message, related_objects)
-            label.hovered.connect(self._focus_objects)
+        for label in self._labels[len(self.warnings) :]:
+            self.layout().removeWidget(label)
+            label.deleteLater()
 
-            self.layout().addWidget(label)
+        del self._labels[len(self.warnings) :]
 
         super(WarningList, self).update()
 
@@ -57,6 +57,8 @@ SETTINGS["draw_autoscroll"] = False
 SETTINGS["block_transparency"] = True
 SETTINGS["object_scroll_enabled"] = False
 SETTINGS["object_tooltip_enabled"] = True
+SETTINGS["screen_cache_budget"] = 64 * 1024 * 1024  # bytes
+SETTINGS["undo_memory_budget"] = 16 * 1024 * 1024  # bytes
 
 
 def load_settings():
@@ -0,0 +1,238 @@
+"""
+Renders every level of a ROM into PNG files, without opening the editor.
+
+The levels are spread over a pool of processes, each of which loads the ROM once and only ever reads from it. By
+default only the blocks of the levels are drawn, using :mod:`foundry.game.level.rasterize`, which does not need a
+``QApplication``. With overlays the levels are drawn by :class:`~foundry.gui.LevelDrawer.LevelDrawer` instead, just
+like in the editor, including the enemies and the overlays of the objects.
+"""
+
+import os
+import re
+import sys
+import time
+from argparse import ArgumentParser, BooleanOptionalAction
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from pathlib import Path
+from typing import Iterator, Optional, Sequence
+
+import numpy as np
+from attr import attrs
+
+from foundry.game.File import ROM
+from foundry.game.level.Level import Level
+from foundry.game.level.util import Level as LevelMeta
+from foundry.game.level.util import get_world_levels
+from foundry.smb3parse.objects.object_set import WORLD_MAP_OBJECT_SET
+
+_application = None
+
+
+@attrs(slots=True, auto_attribs=True, frozen=True)
+class RenderOptions:
+    """
+    How the levels are rendered.
+
+    Attributes
+    ----------
+    zoom: int
+        How many pixels of the image each pixel of the level takes up in each direction.
+    transparency: bool
+        If the transparent pixels of the objects should show the blocks behind them.
+    overlays: bool
+        If the enemies and the overlays of the objects should be drawn as well.
+    """
+
+    zoom: int = 1
+    transparency: bool = False
+    overlays: bool = False
+
+
+@attrs(slots=True, auto_attribs=True, frozen=True)
+class RenderResult:
+    """
+    The outcome of rendering a single level.
+
+    Attributes
+    ----------
+    name: str
+        The name of the level.
+    path: Path
+        The file the image of the level was written to.
+    load_time: float
+        The seconds it took to load the level from the ROM.
+    render_time: float
+        The seconds it took to draw the level and write its image.
+    error: Optional[str]
+        What went wrong, if the level could not be rendered.
+    """
+
+    name: str
+    path: Path
+    load_time: float = 0.0
+    render_time: float = 0.0
+    error: Optional[str] = None
+
+
+def _file_name(index: int, level: LevelMeta) -> str:
+    name = re.sub(r"[^\w\-]+", "_", level.display_information.name or "Unspecified").strip("_")
+
+    return f"{index:03d}_{name}.png"
+
+
+def _initialize_worker(rom_path: str, options: RenderOptions):
+    global _application
+
+    ROM.load_from_file(rom_path)
+
+    if options.overlays:
+        # the overlays are drawn by Qt, which needs an application to draw text and load images, but no display
+        os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+        from PySide6.QtGui import QGuiApplication
+
+        _application = QGuiApplication.instance() or QGuiApplication(["foundry"])
+
+
+def _draw_with_overlays(level: Level, path: Path, options: RenderOptions):
+    from PySide6.QtGui import QImage, QPainter
+
+    from foundry.gui.LevelDrawer import LevelDrawer
+
+    drawer = LevelDrawer()
+    drawer.block_length *= options.zoom
+    drawer.transparency = options.transparency
+
+    image = QImage(level.get_rect(drawer.block_length).size(), QImage.Format_RGB888)
+
+    painter = QPainter(image)
+    drawer.draw(painter, level)
+    painter.end()
+
+    image.save(str(path))
+
+
+def _draw_blocks(level: Level, path: Path, options: RenderOptions):
+    from PySide6.QtGui import QImage
+
+    from foundry.game.level.rasterize import rasterize_level
+
+    pixels = rasterize_level(level, transparent=options.transparency)
+
+    if options.zoom != 1:
+        pixels = np.ascontiguousarray(pixels.repeat(options.zoom, axis=0).repeat(options.zoom, axis=1))
+
+    height, width = pixels.shape[:2]
+
+    QImage(pixels.data, width, height, 3 * width, QImage.Format_RGB888).save(str(path))
+
+
+def _render_level(level: LevelMeta, path: Path, options: RenderOptions) -> RenderResult:
+    name = level.display_information.name or ""
+
+    start = time.perf_counter()
+
+    try:
+        loaded_level = Level.from_meta(level)
+
+        loaded = time.perf_counter()
+
+        if options.overlays:
+            _draw_with_overlays(loaded_level, path, options)
+        else:
+            _draw_blocks(loaded_level, path, options)
+    except Exception as e:
+        return RenderResult(name, path, time.perf_counter() - start, error=f"{type(e).__name__}: {e}")
+
+    return RenderResult(name, path, loaded - start, time.perf_counter() - loaded)
+
+
+def render_levels(
+    rom_path: str,
+    output_dir: Path,
+    levels: Sequence[LevelMeta],
+    options: RenderOptions = RenderOptions(),
+    workers: Optional[int] = None,
+) -> Iterator[RenderResult]:
+    """
+    Renders levels of a ROM into PNG files, spread over a pool of processes.
+
+    Parameters
+    ----------
+    rom_path : str
+        The path to the ROM, which every process loads by itself.
+    output_dir : Path
+        The directory the images are written to, it is created, if it does not exist.
+    levels : Sequence[LevelMeta]
+        The levels to render, world maps are skipped.
+    options : RenderOptions, optional
+        How the levels are rendered, by default only their blocks are drawn, without zoom or transparency.
+    workers : Optional[int], optional
+        The amount of processes to render with, by default one for every processor.
+
+    Returns
+    -------
+    Iterator[RenderResult]
+        The result of every level, in the order the levels were given, as soon as it is done.
+    """
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    levels_and_paths = [
+        (level, output_dir / _file_name(index, level))
+        for index, level in enumerate(levels)
+        if level.tileset != WORLD_MAP_OBJECT_SET
+    ]
+
+    with ProcessPoolExecutor(workers, initializer=_initialize_worker, initargs=(rom_path, options)) as executor:
+        yield from executor.map(
+            _render_level,
+            [level for level, _ in levels_and_paths],
+            [path for _, path in levels_and_paths],
+            repeat(options),
+        )
+
+
+def start(arguments: Optional[Sequence[str]] = None) -> int:
+    parser = ArgumentParser(prog="foundry render-all", description="Renders every level of a ROM into PNG files.")
+    parser.add_argument("path", type=str, help="The path to the ROM")
+    parser.add_argument("--output", type=Path, help="The directory to write the images to", default=Path("levels"))
+    parser.add_argument("--zoom", type=int, help="The size of each pixel of the levels", default=1)
+    parser.add_argument(
+        "--transparency", default=False, action=BooleanOptionalAction, help="Draw the objects with transparency"
+    )
+    parser.add_argument(
+        "--overlays", default=False, action=BooleanOptionalAction, help="Draw the enemies and the object overlays"
+    )
+    parser.add_argument("--world", type=int, help="Only render the levels of this world", default=None)
+    parser.add_argument("--workers", type=int, help="The amount of processes to render with", default=None)
+
+    args = parser.parse_args(arguments)
+
+    if args.zoom < 1:
+        parser.error("--zoom has to be at least 1")
+
+    levels = Level.offsets if args.world is None else get_world_levels(args.world, Level.offsets)
+    options = RenderOptions(args.zoom, args.transparency, args.overlays)
+
+    start_time = time.perf_counter()
+    rendered = failed = 0
+
+    for result in render_levels(args.path, args.output, levels, options, args.workers):
+        if result.error is None:
+            rendered += 1
+            print(
+                f"{result.path.name}: loaded in {result.load_time * 1000:.1f} ms, "
+                f"drawn and saved in {result.render_time * 1000:.1f} ms"
+            )
+        else:
+            failed += 1
+            print(f"{result.path.name}: failed after {result.load_time * 1000:.1f} ms, {result.error}", file=sys.stderr)
+
+    print(f"Rendered {rendered} levels in {time.perf_counter() - start_time:.2f} s, {failed} failed.")
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(start())
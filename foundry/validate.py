@@ -0,0 +1,273 @@
+"""
+Checks every level of a ROM for warnings and for data, which overlaps other levels, without opening the editor.
+
+Every level is checked for the warnings of the definitions of its objects, enemies and jumps, like the warning list
+of the editor does for the open level, and for object and enemy data, which would overwrite the data of another level,
+like the editor does before saving. The levels are spread over a pool of processes, each of which loads the ROM once
+and only ever reads from it.
+
+The results can be written as JSON or as a JUnit report, with a test case for every level, so CI systems can show
+them. Levels with overlapping data or which could not be loaded make the check fail, levels with warnings only do so,
+if the check is strict.
+"""
+
+import json
+import sys
+import time
+from argparse import ArgumentParser, BooleanOptionalAction
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Iterator, Optional, Sequence
+from xml.etree import ElementTree
+
+from attr import asdict, attrs
+
+from foundry.core.warnings.util import get_level_warnings
+from foundry.game.File import ROM
+from foundry.game.level.Level import Level
+from foundry.game.level.util import Level as LevelMeta
+from foundry.game.level.util import get_world_levels
+from foundry.smb3parse.objects.object_set import WORLD_MAP_OBJECT_SET
+
+REPORT_FORMATS = ["json", "junit"]
+
+
+@attrs(slots=True, auto_attribs=True, frozen=True)
+class LevelReport:
+    """
+    The outcome of checking a single level.
+
+    Attributes
+    ----------
+    name: str
+        The name of the level, including the world it is in.
+    object_offset: int
+        The position of the header of the level in the ROM.
+    enemy_offset: int
+        The position of the enemy data of the level in the ROM.
+    warnings: list[str]
+        The messages of the warnings of the objects, enemies and jumps of the level.
+    problems: list[str]
+        What would break, if the level was saved as it is.
+    error: Optional[str]
+        What went wrong, if the level could not be loaded.
+    time: float
+        The seconds it took to check the level.
+    """
+
+    name: str
+    object_offset: int
+    enemy_offset: int
+    warnings: list[str]
+    problems: list[str]
+    error: Optional[str] = None
+    time: float = 0.0
+
+    def failed(self, strict: bool = False) -> bool:
+        """
+        Whether the level did not pass the check.
+
+        Parameters
+        ----------
+        strict : bool, optional
+            If warnings should fail the level as well, by default False.
+
+        Returns
+        -------
+        bool
+            If the level had problems, could not be loaded or, if strict, had warnings.
+        """
+        return bool(self.problems or self.error is not None or (strict and self.warnings))
+
+
+def _level_name(level: LevelMeta) -> str:
+    name = level.display_information.name or "Unspecified"
+
+    if not level.display_information.locations:
+        return name
+
+    return f"World {level.display_information.locations[0].world} - {name}"
+
+
+def _initialize_worker(rom_path: str):
+    ROM.load_from_file(rom_path)
+
+
+def _save_problems(level: Level) -> list[str]:
+    # the same checks LevelView.level_safe_to_save runs, before the level is saved
+    problems = []
+
+    if level.too_many_level_objects():
+        problems.append("Too many level objects.")
+
+    if (overwritten_level := level.level_overwritten_by_objects()) is not None:
+        problems.append(f"The objects overwrite the data of '{_level_name(overwritten_level)}'.")
+
+    if level.too_many_enemies_or_items():
+        problems.append("Too many enemies or items.")
+
+    if (overwritten_level := level.level_overwritten_by_enemies()) is not None:
+        problems.append(f"The enemies and items overwrite the data of '{_level_name(overwritten_level)}'.")
+
+    return problems
+
+
+def _validate_level(level: LevelMeta) -> LevelReport:
+    start = time.perf_counter()
+
+    name = _level_name(level)
+    object_offset = level.generator_pointer - Level.HEADER_LENGTH
+
+    try:
+        loaded_level = Level.from_meta(level)
+
+        warnings = [message for message, _ in get_level_warnings(loaded_level)]
+        problems = _save_problems(loaded_level)
+    except Exception as e:
+        return LevelReport(
+            name, object_offset, level.enemy_pointer, [], [], f"{type(e).__name__}: {e}", time.perf_counter() - start
+        )
+
+    return LevelReport(name, object_offset, level.enemy_pointer, warnings, problems, time=time.perf_counter() - start)
+
+
+def validate_levels(rom_path: str, levels: Sequence[LevelMeta], workers: Optional[int] = None) -> Iterator[LevelReport]:
+    """
+    Checks levels of a ROM, spread over a pool of processes.
+
+    Parameters
+    ----------
+    rom_path : str
+        The path to the ROM, which every process loads by itself.
+    levels : Sequence[LevelMeta]
+        The levels to check, world maps are skipped and levels listed more than once are only checked once.
+    workers : Optional[int], optional
+        The amount of processes to check with, by default one for every processor.
+
+    Returns
+    -------
+    Iterator[LevelReport]
+        The report of every level, in the order the levels were given, as soon as it is done.
+    """
+    unique_levels: dict[tuple[int, int, int], LevelMeta] = {}
+
+    for level in levels:
+        if level.tileset != WORLD_MAP_OBJECT_SET:
+            unique_levels.setdefault((level.generator_pointer, level.enemy_pointer, level.tileset), level)
+
+    with ProcessPoolExecutor(workers, initializer=_initialize_worker, initargs=(rom_path,)) as executor:
+        yield from executor.map(_validate_level, unique_levels.values())
+
+
+def to_json(reports: Sequence[LevelReport], strict: bool = False) -> str:
+    """
+    Writes the reports of levels as JSON.
+
+    Parameters
+    ----------
+    reports : Sequence[LevelReport]
+        The reports to write.
+    strict : bool, optional
+        If levels with warnings count as failed, by default False.
+
+    Returns
+    -------
+    str
+        An object with a summary and the reports of every level.
+    """
+    return json.dumps(
+        {
+            "summary": {
+                "levels": len(reports),
+                "failed": sum(report.failed(strict) for report in reports),
+                "warnings": sum(len(report.warnings) for report in reports),
+                "problems": sum(len(report.problems) for report in reports),
+                "errors": sum(report.error is not None for report in reports),
+            },
+            "levels": [asdict(report) for report in reports],
+        },
+        indent=2,
+    )
+
+
+def to_junit(reports: Sequence[LevelReport], strict: bool = False) -> str:
+    """
+    Writes the reports of levels as a JUnit report, with a test case for every level.
+
+    Parameters
+    ----------
+    reports : Sequence[LevelReport]
+        The reports to write.
+    strict : bool, optional
+        If the warnings of levels count as failures, otherwise they are only written as output, by default False.
+
+    Returns
+    -------
+    str
+        The XML of the JUnit report.
+    """
+    suite = ElementTree.Element(
+        "testsuite",
+        name="foundry.validate",
+        tests=str(len(reports)),
+        failures=str(sum(report.failed(strict) and report.error is None for report in reports)),
+        errors=str(sum(report.error is not None for report in reports)),
+        time=f"{sum(report.time for report in reports):.3f}",
+    )
+
+    for report in reports:
+        case = ElementTree.SubElement(
+            suite, "testcase", classname="levels", name=f"{report.name} ({report.object_offset:#x})"
+        )
+        case.set("time", f"{report.time:.3f}")
+
+        if report.error is not None:
+            ElementTree.SubElement(case, "error", message=report.error)
+            continue
+
+        failures = report.problems + (report.warnings if strict else [])
+
+        if failures:
+            ElementTree.SubElement(case, "failure", message=failures[0]).text = "\n".join(failures)
+
+        if report.warnings and not strict:
+            ElementTree.SubElement(case, "system-out").text = "\n".join(report.warnings)
+
+    return ElementTree.tostring(suite, encoding="unicode", xml_declaration=True)
+
+
+def start(arguments: Optional[Sequence[str]] = None) -> int:
+    parser = ArgumentParser(prog="foundry validate", description="Checks every level of a ROM for problems.")
+    parser.add_argument("path", type=str, help="The path to the ROM")
+    parser.add_argument("--format", choices=REPORT_FORMATS, help="The format of the report", default="json")
+    parser.add_argument("--output", type=Path, help="The file to write the report to, instead of the console")
+    parser.add_argument("--strict", default=False, action=BooleanOptionalAction, help="Let warnings fail the check")
+    parser.add_argument("--world", type=int, help="Only check the levels of this world", default=None)
+    parser.add_argument("--workers", type=int, help="The amount of processes to check with", default=None)
+
+    args = parser.parse_args(arguments)
+
+    levels = Level.offsets if args.world is None else get_world_levels(args.world, Level.offsets)
+
+    start_time = time.perf_counter()
+
+    reports = list(validate_levels(args.path, levels, args.workers))
+
+    output = to_junit(reports, args.strict) if args.format == "junit" else to_json(reports, args.strict)
+
+    if args.output is None:
+        print(output)
+    else:
+        args.output.write_text(output)
+
+    failed = sum(report.failed(args.strict) for report in reports)
+
+    print(
+        f"Checked {len(reports)} levels in {time.perf_counter() - start_time:.2f} s, {failed} failed.", file=sys.stderr
+    )
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(start())
@@ -0,0 +1,78 @@
+from attr import attrs
+from hypothesis import given
+from hypothesis.strategies import binary
+
+from foundry.core.graphics_page import CHR_ROM_SEGMENT_SIZE
+from foundry.core.graphics_page.GraphicsPage import GraphicsPage
+from foundry.core.graphics_set.GraphicsSet import (
+    PATTERN_PIXEL_COUNT,
+    PATTERN_SIZE,
+    GraphicsSet,
+    decode_graphics_set,
+    mirror_pattern,
+)
+from foundry.game.File import ROM, INESHeader
+
+
+@attrs(slots=True, auto_attribs=True, frozen=True, eq=True, hash=True)
+class BytesGraphicsPage:
+    index: int
+    data: bytes
+
+    def __bytes__(self) -> bytes:
+        return self.data
+
+
+def decode_pixel_by_pixel(data: bytes) -> bytes:
+    indexes = bytearray()
+    for start in range(0, len(data) - PATTERN_SIZE + 1, PATTERN_SIZE):
+        for pixel in range(PATTERN_PIXEL_COUNT):
+            row, column = divmod(pixel, 8)
+            low_bit = (data[start + row] >> (7 - column)) & 1
+            high_bit = (data[start + 8 + row] >> (7 - column)) & 1
+            indexes.append((high_bit << 1) | low_bit)
+    return bytes(indexes)
+
+
+@given(binary(min_size=PATTERN_SIZE, max_size=8 * PATTERN_SIZE))
+def test_decode_graphics_set(data: bytes):
+    graphics_set = GraphicsSet((BytesGraphicsPage(0, data),))
+    assert decode_pixel_by_pixel(data) == decode_graphics_set(graphics_set)
+
+
+def test_decode_graphics_set_multiple_pages():
+    first, second = bytes(range(PATTERN_SIZE)), bytes(range(0xFF, 0xFF - PATTERN_SIZE, -1))
+    graphics_set = GraphicsSet((BytesGraphicsPage(0, first), BytesGraphicsPage(1, second)))
+    assert decode_pixel_by_pixel(first + second) == decode_graphics_set(graphics_set)
+
+
+@given(binary(min_size=PATTERN_SIZE, max_size=PATTERN_SIZE))
+def test_mirror_pattern(data: bytes):
+    pattern = decode_pixel_by_pixel(data)
+    mirrored = mirror_pattern(pattern)
+    for row in range(8):
+        assert pattern[row * 8 : (row + 1) * 8] == mirrored[row * 8 : (row + 1) * 8][::-1]
+    assert mirror_pattern(mirrored) == pattern
+
+
+def test_graphics_set_buffer_invalidated_by_graphics_write(monkeypatch):
+    # GIVEN a ROM with a single program bank and a graphics set read from it
+    header = INESHeader(1, 1, 4, False, False)
+    monkeypatch.setattr(ROM, "rom_data", bytearray(INESHeader.INES_HEADER_SIZE + header.program_size + 0x2000))
+    monkeypatch.setattr(ROM, "header", header, raising=False)
+    graphics_set = GraphicsSet((GraphicsPage(0), GraphicsPage(1)))
+    buffer = graphics_set.buffer
+
+    # WHEN the program data is written to
+    ROM().bulk_write(bytearray([1]), INESHeader.INES_HEADER_SIZE)
+
+    # THEN the same buffer is reused
+    assert graphics_set.buffer.obj is buffer.obj
+    assert buffer.readonly
+
+    # WHEN the graphical data of the second page is written to
+    ROM().bulk_write(bytearray([0xFF]), graphics_set.pages[1].offset)
+
+    # THEN the buffer and its decoded patterns reflect the write
+    assert graphics_set.buffer[CHR_ROM_SEGMENT_SIZE] == 0xFF
+    assert decode_graphics_set(graphics_set)[CHR_ROM_SEGMENT_SIZE * 4] == 1
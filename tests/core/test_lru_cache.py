@@ -0,0 +1,85 @@
+from hypothesis import given
+from hypothesis.strategies import integers, lists
+
+from foundry.core.LRUCache import LRUCache, get_cache_statistics, invalidate_caches
+
+
+def test_get_and_put():
+    cache = LRUCache("test", 10)
+
+    assert cache.get(1) is None
+
+    cache.put(1, "a")
+
+    assert "a" == cache.get(1)
+    assert 1 == cache.statistics.hits
+    assert 1 == cache.statistics.misses
+
+
+def test_least_recently_used_is_evicted():
+    cache = LRUCache("test", 3)
+    for key in range(3):
+        cache.put(key, key)
+
+    cache.get(0)
+    cache.put(3, 3)
+
+    assert 1 not in cache
+    assert 0 in cache and 2 in cache and 3 in cache
+    assert 1 == cache.statistics.evictions
+
+
+def test_byte_budget():
+    cache = LRUCache("test", 10, len)
+
+    cache.put(1, "abcdef")
+    cache.put(2, "abcdef")
+
+    assert 1 not in cache
+    assert 6 == cache.size
+
+    # values larger than the whole budget are still kept
+    cache.put(3, "a" * 20)
+
+    assert 3 in cache
+    assert 1 == len(cache)
+
+
+def test_invalidate():
+    cache = LRUCache("test", 10)
+    cache.put(1, "a", ("tileset 3", "palette 0"))
+    cache.put(2, "b", ("tileset 3", "palette 1"))
+    cache.put(3, "c", ("tileset 4", "palette 1"))
+
+    assert 2 == cache.invalidate("tileset 3")
+    assert 1 not in cache and 2 not in cache and 3 in cache
+
+    assert 1 == cache.invalidate("palette 1")
+    assert 0 == len(cache)
+    assert 0 == cache.invalidate("tileset 3")
+    assert 3 == cache.statistics.invalidations
+
+
+def test_invalidate_caches():
+    first_cache, second_cache = LRUCache("first", 10), LRUCache("second", 10)
+    first_cache.put(1, "a", ("tileset 3",))
+    second_cache.put(1, "a", ("tileset 3",))
+    second_cache.put(2, "b", ("tileset 4",))
+
+    assert 2 == invalidate_caches("tileset 3")
+    assert 0 == len(first_cache)
+    assert 1 == len(second_cache)
+    assert 1 == get_cache_statistics()["second"].entries
+
+
+@given(lists(integers(0, 20)), integers(1, 10))
+def test_stays_inside_budget(keys: list[int], max_size: int):
+    cache = LRUCache("test", max_size)
+
+    for key in keys:
+        if cache.get(key) is None:
+            cache.put(key, key, (key % 3,))
+
+    assert len(cache) <= max_size
+    assert cache.size == len(cache)
+    assert len(keys) == cache.statistics.hits + cache.statistics.misses
@@ -1,6 +1,10 @@
 from hypothesis import given
 
-from foundry.core.warnings.EnemyCompatibilityWarning import EnemyCompatibilityWarning
+from foundry.core.warnings.EnemyCompatibilityWarning import (
+    EnemyCompatibilityWarning,
+    find_incompatibilities,
+    find_incompatible_enemies,
+)
 from tests.core.warnings.conftest import object_like
 
 
@@ -11,3 +15,31 @@ def test_initalization():
 @given(object_like())
 def test_get_message(object_like):
     assert isinstance(EnemyCompatibilityWarning().get_message(object_like), str)
+
+
+class _Enemy:
+    def __init__(self, *pages: int):
+        self.definition = self
+
+        self.pages = list(pages)
+
+
+def test_find_incompatible_enemies():
+    # GIVEN enemies with pages, which do and do not conflict with the enemies before them
+    enemies = [
+        _Enemy(0, 0),
+        _Enemy(0, 0, 0x4F, 0),
+        _Enemy(0, 0, 0x4F, 0x12),
+        _Enemy(0, 0, 0x3C),
+        _Enemy(0, 0, 0x4F, 0x13),
+        _Enemy(0, 0, 0x3C, 0x12),
+    ]
+
+    # WHEN the enemies are checked at once
+    incompatible_enemies = find_incompatible_enemies(enemies)  # type: ignore
+
+    # THEN every enemy is checked against the enemies before it
+    assert incompatible_enemies == [False, False, False, True, True, False]
+    assert incompatible_enemies == [
+        any(find_incompatibilities(enemies[: index + 1])) for index in range(len(enemies))  # type: ignore
+    ]
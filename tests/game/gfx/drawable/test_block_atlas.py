@@ -0,0 +1,108 @@
+import pytest
+from PySide6.QtGui import QImage, QPainter
+
+from foundry.core.graphics_set.GraphicsSet import PATTERN_SIZE, GraphicsSet
+from foundry.core.palette.PaletteGroup import (
+    MutablePaletteGroup,
+    get_palette_group_colors,
+)
+from foundry.core.palette.util import get_internal_palette_offset
+from foundry.game.File import ROM
+from foundry.game.gfx.drawable.Block import Block
+from foundry.game.gfx.drawable.BlockAtlas import (
+    BLOCK_COUNT,
+    BLOCKS_PER_ROW,
+    get_block_atlas,
+)
+from foundry.smb3parse.objects.object_set import PLAINS_OBJECT_SET
+
+
+def _draw_blocks(draw, block_length: int) -> bytes:
+    image = QImage(block_length * BLOCKS_PER_ROW, block_length * BLOCK_COUNT // BLOCKS_PER_ROW, QImage.Format_RGB888)
+    image.fill(0)
+
+    painter = QPainter(image)
+    for block_index in range(BLOCK_COUNT):
+        row, column = divmod(block_index, BLOCKS_PER_ROW)
+        draw(painter, block_index, column * block_length, row * block_length)
+    painter.end()
+
+    return bytes(image.constBits())
+
+
+@pytest.mark.parametrize("block_length", [8, 16, 32])
+@pytest.mark.parametrize("selected", [False, True])
+@pytest.mark.parametrize("transparent", [False, True])
+def test_atlas_matches_blocks(block_length: int, selected: bool, transparent: bool, qtbot):
+    # GIVEN the blocks of a tileset and the atlas of the same tileset
+    palette_group = tuple(tuple(pal) for pal in MutablePaletteGroup.from_tileset(PLAINS_OBJECT_SET, 0))
+    graphics_set = GraphicsSet.from_tileset(PLAINS_OBJECT_SET)
+    tsa_data = bytes(ROM.get_tsa_data(PLAINS_OBJECT_SET))
+
+    block_atlas = get_block_atlas(palette_group, graphics_set, tsa_data)
+
+    # WHEN every block is drawn by itself and from the atlas
+    def draw_block(painter: QPainter, block_index: int, x: int, y: int):
+        block = Block(block_index, palette_group, graphics_set, tsa_data)
+        block.draw(painter, x, y, block_length, selected, transparent)
+
+    def draw_from_atlas(painter: QPainter, block_index: int, x: int, y: int):
+        block_atlas.draw(painter, block_index, x, y, block_length, selected, transparent)
+
+    # THEN both are drawn exactly the same
+    assert _draw_blocks(draw_block, block_length) == _draw_blocks(draw_from_atlas, block_length)
+
+
+def test_atlas_follows_palette_edits(qtbot):
+    # GIVEN the atlas of a tileset, colored by the palette group in the ROM
+    graphics_set = GraphicsSet.from_tileset(PLAINS_OBJECT_SET)
+    tsa_data = ROM.get_tsa_table(PLAINS_OBJECT_SET)
+
+    palette_group = get_palette_group_colors(PLAINS_OBJECT_SET, 0)
+    block_atlas = get_block_atlas(palette_group, graphics_set, tsa_data)
+
+    # WHEN a color of the palette group is changed in the ROM
+    color_offset = get_internal_palette_offset(PLAINS_OBJECT_SET) + 1
+    ROM().write(color_offset, bytes([(palette_group[0][1] + 1) % 0x40]))
+
+    edited_palette_group = get_palette_group_colors(PLAINS_OBJECT_SET, 0)
+    edited_block_atlas = get_block_atlas(edited_palette_group, graphics_set, tsa_data)
+
+    # THEN the palette group is read again and its atlas is colored like the blocks themselves
+    assert edited_palette_group[0][1] == (palette_group[0][1] + 1) % 0x40
+    assert edited_palette_group == tuple(tuple(pal) for pal in MutablePaletteGroup.from_tileset(PLAINS_OBJECT_SET, 0))
+    assert edited_block_atlas is not block_atlas
+
+    def draw_block(painter: QPainter, block_index: int, x: int, y: int):
+        Block(block_index, edited_palette_group, graphics_set, tsa_data).draw(painter, x, y, Block.WIDTH)
+
+    def draw_from_atlas(painter: QPainter, block_index: int, x: int, y: int):
+        edited_block_atlas.draw(painter, block_index, x, y, Block.WIDTH)
+
+    assert _draw_blocks(draw_block, Block.WIDTH) == _draw_blocks(draw_from_atlas, Block.WIDTH)
+
+
+def test_atlas_follows_graphics_edits(qtbot):
+    # GIVEN the atlas of a tileset
+    palette_group = get_palette_group_colors(PLAINS_OBJECT_SET, 0)
+    graphics_set = GraphicsSet.from_tileset(PLAINS_OBJECT_SET)
+    tsa_data = ROM.get_tsa_table(PLAINS_OBJECT_SET)
+
+    block_atlas = get_block_atlas(palette_group, graphics_set, tsa_data)
+
+    # WHEN the first pattern of the graphics set is inverted in the ROM
+    page = graphics_set.pages[0]
+    ROM().write(page.offset, bytes(0xFF - byte for byte in bytes(page)[:PATTERN_SIZE]))
+
+    edited_block_atlas = get_block_atlas(palette_group, graphics_set, tsa_data)
+
+    # THEN the atlas is made again and is drawn like the blocks themselves
+    assert edited_block_atlas is not block_atlas
+
+    def draw_block(painter: QPainter, block_index: int, x: int, y: int):
+        Block(block_index, palette_group, graphics_set, tsa_data).draw(painter, x, y, Block.WIDTH)
+
+    def draw_from_atlas(painter: QPainter, block_index: int, x: int, y: int):
+        edited_block_atlas.draw(painter, block_index, x, y, Block.WIDTH)
+
+    assert _draw_blocks(draw_block, Block.WIDTH) == _draw_blocks(draw_from_atlas, Block.WIDTH)
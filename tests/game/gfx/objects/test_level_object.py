@@ -155,6 +155,34 @@ def test_change_attribute_to_bytes(attribute, increase):
     assert cloud_object.to_bytes() != initial_bytes
 
 
+def test_render_only_when_changed():
+    # GIVEN a platform, which extends to the ground, above an earlier block
+    objects = []
+    object_factory = LevelObjectFactory(1, 1, 0, objects, False)
+
+    block = object_factory.from_properties(0x00, 0x00, 1, 20, None, 0)
+    platform = object_factory.from_properties(0x00, 0x12, 0, 10, None, 1)
+    objects.extend([block, platform])
+
+    platform.render()
+    rendered_blocks = platform.rendered_blocks
+
+    # WHEN nothing the platform depends on changed
+    platform.render()
+
+    # THEN the platform was not rendered again
+    assert platform.rendered_blocks is rendered_blocks
+    assert platform.get_rect().height() == 10
+
+    # WHEN the block the platform stands on is moved
+    block.position = Point(1, 15)
+    platform.render()
+
+    # THEN the platform was rendered again
+    assert platform.rendered_blocks is not rendered_blocks
+    assert platform.get_rect().height() == 5
+
+
 def gen_object_factories():
     rom_path = Path(__file__).parent.parent.parent.parent.resolve() / "artifacts"
 
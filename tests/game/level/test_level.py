@@ -1,9 +1,12 @@
+import operator
+
 import pytest
 
+from foundry.core.point.Point import Point
 from foundry.game.gfx.objects.EnemyItem import EnemyObject
 from foundry.game.gfx.objects.Jump import Jump
 from foundry.game.gfx.objects.LevelObject import LevelObject
-from foundry.game.level.Level import LEVEL_DEFAULT_HEIGHT
+from foundry.game.level.Level import LEVEL_DEFAULT_HEIGHT, Level
 
 
 @pytest.mark.parametrize(
@@ -77,7 +80,8 @@ def test_level_insert_in_vertical_level(level):
     # GIVEN a vertical level without objects
     level.is_vertical = True
 
-    level.objects.clear()
+    for level_object in level.objects.copy():
+        level.remove_object(level_object)
     level.enemies.clear()
     level.jumps.clear()
 
@@ -94,3 +98,141 @@ def test_level_insert_in_vertical_level(level):
     assert added_object.obj_index == object_index
     assert added_object.rendered_position.x == x
     assert added_object.rendered_position.y == y
+
+
+def test_moving_object_renders_objects_above(level):
+    # GIVEN a level with a platform, which extends to the ground, above an earlier block
+    for level_object in level.objects.copy():
+        level.remove_object(level_object)
+
+    block = level.add_object(0x00, 0x00, 1, 20, None)
+    platform = level.add_object(0x00, 0x12, 0, 10, None)
+
+    platform.render()
+
+    assert platform.get_rect().height() == 10
+
+    # WHEN the block is moved up, without rendering the platform explicitly
+    block.position = Point(1, 15)
+
+    # THEN the platform was rendered again and now stands on the block
+    assert platform.get_rect().height() == 5
+
+
+def test_object_indices_are_kept_up_to_date(level):
+    # GIVEN a level
+    pass
+
+    # WHEN objects are added, removed and moved to the fore- and background
+    level.add_object(0x00, 0x00, 5, 5, None, 0)
+    level.remove_object(level.objects[3])
+    level.bring_to_foreground([level.objects[0]])
+    level.bring_to_background([level.objects[-1]])
+
+    # THEN every object knows its index in the level
+    assert [obj.index_in_level for obj in level.objects] == list(range(len(level.objects)))
+
+
+def test_objects_with_the_same_content_are_distinct(level):
+    # GIVEN a level with two objects with the same content
+    level.add_object(0x00, 0x00, 5, 5, None, 0)
+    level.add_object(0x00, 0x00, 5, 5, None, 1)
+
+    first_object, second_object = level.objects[0:2]
+
+    # THEN they are not equal, but have the same content
+    assert first_object != second_object
+    assert first_object.has_same_content_as(second_object)
+    assert len({first_object, second_object}) == 2
+
+    # WHEN the second one is removed
+    level.remove_object(second_object)
+
+    # THEN exactly that object is gone and the first one is still in the level
+    assert first_object in level.objects
+    assert not any(obj is second_object for obj in level.objects)
+
+
+def test_level_object_geometry_follows_its_bytes(level):
+    # GIVEN a horizontally expanding object in a level, whose size was already looked up
+    level_object = level.add_object(0x00, 0x10, 5, 5, None, 0)
+    old_width = level_object.rendered_size.width
+
+    # WHEN its length and position are changed
+    level_object.length += 2
+    level_object.position = Point(7, 6)
+
+    # THEN its size and position are up to date
+    assert level_object.rendered_size.width == old_width + 2
+    assert level_object.rendered_position == Point(7, 6)
+    assert level_object.get_rect().getRect() == (7, 6, old_width + 2, level_object.rendered_size.height)
+
+    # WHEN its bytes are replaced
+    level_object.data = bytearray([0x05, 0x03, 0x00])
+
+    # THEN it is a different object now
+    assert level_object.obj_index == 0x00
+    assert level_object.rendered_position == Point(3, 5)
+
+
+def test_header_changes_keep_the_objects(level):
+    # GIVEN a level and its objects and enemies
+    objects = level.objects.copy()
+    enemies = level.enemies.copy()
+    object_factory = level.object_factory
+
+    # WHEN the palettes and the graphics set of the level are changed
+    level.object_palette_index = (level.object_palette_index + 1) % 8
+    level.enemy_palette_index = (level.enemy_palette_index + 1) % 4
+    level.graphic_set = (level.graphic_set + 1) % 32
+
+    # THEN the objects are kept and now use the new palette groups and graphics set
+    assert all(map(operator.is_, level.objects, objects)) and len(level.objects) == len(objects)
+    assert all(map(operator.is_, level.enemies, enemies)) and len(level.enemies) == len(enemies)
+
+    for level_object in level.objects:
+        assert level_object.palette_group == level.object_factory.palette_group
+        assert level_object.graphics_set is level.object_factory.graphics_set
+
+    for enemy in level.enemies:
+        assert enemy.palette_group == level.enemy_item_factory.palette_group
+
+    # WHEN the graphics set and the palette are changed back
+    level.graphic_set = (level.graphic_set - 1) % 32
+    level.object_palette_index = (level.object_palette_index - 1) % 8
+
+    # THEN the factory from before is used again
+    assert level.object_factory is object_factory
+
+
+def test_enemies_render_with_new_palette(level):
+    # GIVEN a level with enemies, which reports the objects that were rendered anew
+    level.add_enemy(0x72, 5, 5)
+
+    rendered_objects = []
+    level.add_object_listener(rendered_objects.append)
+
+    # WHEN the palette of the enemies is changed
+    level.enemy_palette_index = (level.enemy_palette_index + 1) % 4
+
+    # THEN every enemy was rendered with the new palette group
+    assert all(any(obj is enemy for obj in rendered_objects) for enemy in level.enemies)
+
+    for enemy in level.enemies:
+        assert enemy.palette_group == tuple(map(tuple, level.enemy_item_factory.palette_group))
+
+
+def test_level_overwritten_by_objects(level):
+    # GIVEN a level as it was loaded from the ROM
+    assert level.level_overwritten_by_objects() is None
+    assert level.level_overwritten_by_enemies() is None
+
+    # WHEN a lot more objects are added, than fit into the space of the level
+    for _ in range(100):
+        level.add_object(0x00, 0x10, 5, 5, None)
+
+    # THEN the level after it would be overwritten
+    overwritten_level = level.level_overwritten_by_objects()
+
+    assert overwritten_level is not None
+    assert overwritten_level.generator_pointer - Level.HEADER_LENGTH > level.header_offset
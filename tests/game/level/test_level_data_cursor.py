@@ -0,0 +1,48 @@
+from foundry.game.level.LevelDataCursor import LevelDataCursor
+from foundry.game.ObjectSet import ObjectSet
+from foundry.smb3parse.objects.object_set import PLAINS_OBJECT_SET
+
+three_byte_object = bytearray([0x0A, 0x05, 0x10])
+four_byte_object = bytearray([0x0A, 0x06, 0xC0, 0x03])
+
+
+def test_object_records():
+    # GIVEN some unrelated bytes, followed by a 3 byte and a 4 byte object, the delimiter and an enemy
+    data = bytearray([0x12, 0x34]) + three_byte_object + four_byte_object + bytearray([0xFF, 0x01, 0x02, 0x03])
+
+    with LevelDataCursor(data, offset=2) as cursor:
+        # WHEN the object records are read, starting after the unrelated bytes
+        records = list(cursor.object_records(ObjectSet(PLAINS_OBJECT_SET)))
+
+        # THEN both objects were read and the cursor stopped right after the delimiter
+        assert records == [three_byte_object, four_byte_object]
+        assert cursor.offset == 2 + 3 + 4 + 1
+
+
+def test_enemy_records():
+    # GIVEN two enemies, followed by the delimiter and some unrelated bytes
+    data = bytearray([0x01, 0x02, 0x03, 0x04, 0x05, 0x06, 0xFF, 0x07])
+
+    with LevelDataCursor(data) as cursor:
+        # WHEN the enemy records are read
+        records = list(cursor.enemy_records())
+
+        # THEN both enemies were read and the cursor stopped right after the delimiter
+        assert records == [bytearray([0x01, 0x02, 0x03]), bytearray([0x04, 0x05, 0x06])]
+        assert cursor.offset == 7
+
+
+def test_records_are_copies():
+    # GIVEN some data with an object in it
+    data = three_byte_object + bytearray([0xFF])
+
+    # WHEN the record of the object is read and changed, after the cursor is done
+    with LevelDataCursor(data) as cursor:
+        record = next(cursor.object_records(ObjectSet(PLAINS_OBJECT_SET)))
+
+    record[0] = 0x00
+
+    # THEN the data was not changed and can be resized again
+    assert data[0] == three_byte_object[0]
+
+    data.extend(bytearray(3))
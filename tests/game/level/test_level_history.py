@@ -0,0 +1,122 @@
+import operator
+
+from foundry.game.level.LevelHistory import LevelDelta, LevelHistory, LevelState
+from foundry.game.level.LevelRef import LevelRef
+
+
+def _state(*objects: bytes, header: bytes = bytes(9), enemies: tuple[bytes, ...] = ()) -> LevelState:
+    return LevelState(0x1000, header, objects, (), 0x2000, enemies)
+
+
+def test_undo_redo():
+    # GIVEN a history with two actions
+    first = _state(b"\x00\x01\x02", b"\x03\x04\x05")
+    second = _state(b"\x00\x01\x02", b"\x03\x04\x06", enemies=(b"\x72\x01\x01",))
+    third = _state(b"\x03\x04\x06", header=bytes(range(9)))
+
+    history = LevelHistory(first)
+    history.do(second)
+    history.do(third)
+
+    # WHEN both actions are undone and redone again
+    # THEN every state is restored in order
+    assert history.undo() == second
+    assert history.undo() == first
+    assert not history.can_undo
+
+    assert history.redo() == second
+    assert history.redo() == third
+    assert not history.can_redo
+
+
+def test_only_changes_are_kept():
+    # GIVEN a state with a lot of objects
+    objects = tuple(bytes([index % 0x1F, index, 0x10]) for index in range(0x100))
+
+    old_state = _state(*objects)
+    new_state = _state(*objects[:0x80], b"\x00\x00\x11", *objects[0x81:])
+
+    # WHEN a single object changed
+    delta = LevelDelta.between(old_state, new_state)
+
+    # THEN only that object is part of the difference
+    assert len(delta.objects) == 1
+    assert delta.objects[0].old_records == (objects[0x80],)
+    assert delta.apply(old_state) == new_state
+    assert delta.revert(new_state) == old_state
+
+
+def test_actions_with_the_same_key_are_merged():
+    # GIVEN a history
+    history = LevelHistory(_state(b"\x00\x00\x10"))
+
+    # WHEN the same object is moved twice in a row and then something else happens
+    history.do(_state(b"\x00\x01\x10"), merge_key=("move", 1))
+    history.do(_state(b"\x00\x02\x10"), merge_key=("move", 1))
+    history.do(_state(b"\x00\x02\x11"))
+
+    # THEN both moves are undone together
+    assert len(history.undo_stack) == 2
+
+    history.undo()
+
+    assert history.undo() == _state(b"\x00\x00\x10")
+
+
+def test_actions_without_changes_are_not_merged_into():
+    # GIVEN a history with an action
+    history = LevelHistory(_state(b"\x00\x00\x10"))
+    history.do(_state(b"\x00\x00\x11"))
+
+    # WHEN an object is dropped where it was and then moved with the same key
+    history.do(_state(b"\x00\x00\x11"), merge_key=("move", 1))
+    history.do(_state(b"\x00\x01\x11"), merge_key=("move", 1))
+
+    # THEN the move is undone on its own, without the action before it
+    assert len(history.undo_stack) == 2
+    assert history.undo() == _state(b"\x00\x00\x11")
+
+
+def test_oldest_actions_are_forgotten():
+    # GIVEN a history with a budget, which only fits a few actions
+    history = LevelHistory(_state(b"\x00\x00\x00"), max_size=400)
+
+    # WHEN more actions are done, than fit into the budget
+    for index in range(1, 20):
+        history.do(_state(bytes([0, index, 0])))
+
+    # THEN only the most recent actions are kept
+    assert history.size <= 400
+    assert 1 <= len(history.undo_stack) < 19
+
+    while history.can_undo:
+        state = history.undo()
+
+    assert state == _state(bytes([0, 19 - len(history.redo_stack), 0]))
+
+
+def test_undo_keeps_unchanged_objects(level, qtbot):
+    # GIVEN a level with a history
+    level_ref = LevelRef()
+    level_ref.level = level
+
+    original_data = level.to_bytes()
+    objects = level.objects.copy()
+
+    # WHEN an object is moved and the move is undone
+    moved_object = level.objects[0]
+    moved_object.move_by(1, 0)
+
+    level_ref.save_level_state()
+    level_ref.undo()
+
+    # THEN the level is as it was, without any of its objects being created anew
+    assert level.to_bytes() == original_data
+    assert all(map(operator.is_, level.objects, objects)) and len(level.objects) == len(objects)
+
+    # WHEN the move is redone
+    level_ref.redo()
+
+    # THEN the object is moved again
+    assert level.objects[0] is moved_object
+    assert level.to_bytes() != original_data
@@ -0,0 +1,42 @@
+from foundry.core.point.Point import Point
+from foundry.core.warnings.LevelWarnings import LevelWarnings
+from foundry.core.warnings.util import get_level_warnings
+
+
+def test_level_warnings_follow_changes(level):
+    # GIVEN the warnings of a level
+    level_warnings = LevelWarnings(level)
+    level_warnings.update()
+
+    # WHEN objects and enemies are moved outside of the level and removed
+    level.objects[0].position = Point(level.width + 5, 0)
+    level.enemies[0].position = Point(level.width + 5, 0)
+    del level.objects[-1]
+
+    changed = level_warnings.update()
+
+    # THEN the warnings are the same, as if the level was checked from scratch
+    assert changed
+    assert level_warnings.warnings == get_level_warnings(level)
+    assert any(level.enemies[0] in objects for _, objects in level_warnings.warnings)
+
+
+def test_level_warnings_only_check_changed_objects(level, monkeypatch):
+    # GIVEN the warnings of a level
+    level_warnings = LevelWarnings(level)
+    level_warnings.update()
+
+    checked_objects = []
+    check = level_warnings._check
+
+    monkeypatch.setattr(level_warnings, "_check", lambda obj: checked_objects.append(obj) or check(obj))
+
+    # WHEN an enemy is moved
+    enemy = level.enemies[0]
+    enemy.move_by(1, 0)
+
+    level_warnings.update()
+
+    # THEN only the enemy and the jumps, which do not report their changes, are checked again
+    assert checked_objects == [enemy] + level.jumps
+    assert level_warnings.warnings == get_level_warnings(level)
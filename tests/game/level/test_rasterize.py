@@ -0,0 +1,78 @@
+import numpy as np
+import pytest
+from PySide6.QtGui import QImage, QPainter
+
+from foundry.core.graphics_set.GraphicsSet import GraphicsSet
+from foundry.core.palette import get_nes_colors
+from foundry.game.File import ROM
+from foundry.game.level.rasterize import rasterize_level, rasterize_level_data
+from foundry.gui.LevelDrawer import LevelDrawer
+
+
+def _draw_with_qt(level, transparency: bool, monkeypatch) -> np.ndarray:
+    drawer = LevelDrawer()
+    drawer.transparency = transparency
+
+    # only the blocks are compared, so leave out everything drawn on top of them
+    monkeypatch.setattr(drawer, "_draw_overlays", lambda *_: None)
+
+    image = QImage(level.width * 16, level.height * 16, QImage.Format_RGB888)
+
+    painter = QPainter(image)
+    drawer.draw_content(painter, level)
+    painter.end()
+
+    rows = np.frombuffer(bytes(image.constBits()), dtype=np.uint8).reshape(image.height(), image.bytesPerLine())
+
+    return rows[:, : image.width() * 3].reshape(image.height(), image.width(), 3)
+
+
+@pytest.mark.parametrize("transparency", [False, True])
+def test_rasterize_level_matches_level_drawer(level, transparency, monkeypatch):
+    # GIVEN a level without enemies, since they are not drawn by the rasterizer
+    level.enemies.clear()
+
+    # WHEN the level is drawn by Qt and by the rasterizer
+    drawn_with_qt = _draw_with_qt(level, transparency, monkeypatch)
+    rasterized = rasterize_level(level, transparent=transparency)
+
+    # THEN both images are the same
+    assert rasterized.shape == drawn_with_qt.shape
+    assert np.array_equal(rasterized, drawn_with_qt)
+
+
+def test_rasterize_level_indexed(level):
+    # GIVEN a level
+
+    # WHEN it is rasterized into colors and into indexes of the NES colors
+    rasterized = rasterize_level(level)
+    indexed = rasterize_level(level, indexed=True)
+
+    # THEN the indexes point to the colors of the pixels
+    assert indexed.shape == rasterized.shape[:2]
+    assert np.array_equal(np.array(get_nes_colors(), dtype=np.uint8)[indexed], rasterized)
+
+
+def test_rasterize_level_data(level):
+    # GIVEN the header and object data of a level
+    (_, level_data), _ = level.to_bytes()
+
+    # WHEN the data is rasterized on its own
+    rasterized = rasterize_level_data(level.object_set_number, level_data)
+
+    # THEN it looks the same as the level it came from
+    assert np.array_equal(rasterized, rasterize_level(level))
+
+
+def test_rasterize_level_follows_graphics_edits(level):
+    # GIVEN a rasterized level
+    rasterized = rasterize_level(level, indexed=True)
+
+    # WHEN the graphics of its tileset are inverted in the ROM
+    graphics_set = GraphicsSet.from_tileset(level.header.graphic_set_index)
+
+    for page in graphics_set.pages:
+        ROM().write(page.offset, bytes(0xFF - byte for byte in bytes(page)))
+
+    # THEN the level is rasterized with the new graphics
+    assert not np.array_equal(rasterize_level(level, indexed=True), rasterized)
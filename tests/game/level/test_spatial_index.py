@@ -0,0 +1,74 @@
+from PySide6.QtCore import QRect
+
+
+def _objects_at(level, x, y):
+    return [obj for obj in level.get_all_objects() if (x, y) in obj]
+
+
+def _objects_intersecting(level, rect):
+    return [obj for obj in level.get_all_objects() if rect.intersects(obj.get_rect())]
+
+
+def test_point_and_area_queries(level):
+    # GIVEN a level
+    pass
+
+    # WHEN its objects are looked up through the spatial index
+    # THEN the same objects are found, as when checking every object
+    for x in range(0, level.width, 3):
+        for y in range(level.height):
+            assert level.spatial_index.at(x, y) == _objects_at(level, x, y)
+
+    for rect in [QRect(0, 0, 20, 10), QRect(30, 15, 50, 12), QRect(100, 20, -10, -5), QRect(5, 5, 0, 0)]:
+        assert level.get_objects_intersecting(rect) == _objects_intersecting(level, rect)
+
+
+def test_moved_object_is_found(level):
+    # GIVEN a level and one of its objects
+    level_object = level.objects[-1]
+    old_position = level_object.position
+
+    level.spatial_index  # make sure it is indexed at its old position
+
+    # WHEN the object is moved far away
+    level_object.move_by(40, 0)
+    level_object.render()
+
+    # THEN it is found at its new position and no longer at its old one
+    assert level_object in level.spatial_index.at(level_object.position.x, level_object.position.y)
+    assert level_object not in level.spatial_index.at(old_position.x, old_position.y)
+
+
+def test_removed_and_reordered_objects(level):
+    # GIVEN a level with the first object at a known position
+    level_object = level.objects[0]
+    position = level_object.position.x, level_object.position.y
+
+    assert level_object in level.spatial_index.at(*position)
+
+    # WHEN the object is brought to the foreground
+    level.bring_to_foreground([level_object])
+
+    # THEN the index returns it in its new order
+    assert level.spatial_index.at(*position) == _objects_at(level, *position)
+
+    # WHEN the object is removed from the level
+    level.remove_object(level_object)
+
+    # THEN it is not found anymore
+    assert level_object not in level.spatial_index.at(*position)
+    assert level_object not in level.spatial_index
+
+
+def test_added_objects_are_found(level):
+    # GIVEN a level
+    position = 3, 5
+
+    # WHEN an object and an enemy are added
+    level_object = level.add_object(0x00, 0x00, *position, None, 0)
+    enemy = level.add_enemy(0x72, *position)
+
+    # THEN both are found in the order of the level
+    assert level.spatial_index.at(*position) == _objects_at(level, *position)
+    assert level.spatial_index.at(*position)[0] is level_object
+    assert level.spatial_index.at(*position)[-1] is enemy
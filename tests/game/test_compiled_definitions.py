@@ -0,0 +1,51 @@
+from foundry.game.EnemyDefinitions import (
+    get_compiled_enemy_definitions,
+    get_enemy_metadata,
+)
+from foundry.game.ObjectDefinitions import (
+    EndType,
+    GeneratorType,
+    get_compiled_object_definitions,
+    get_object_metadata,
+)
+
+
+def test_compiled_object_definitions():
+    # GIVEN the parsed object definitions
+    tilesets = get_object_metadata().__root__
+
+    # WHEN they are compiled
+    compiled_tilesets = get_compiled_object_definitions()
+
+    # THEN every definition can be looked up by the same indices and describes the same object
+    assert len(compiled_tilesets) == len(tilesets)
+
+    for tileset, compiled_tileset in zip(tilesets, compiled_tilesets):
+        assert len(compiled_tileset) == len(tileset.__root__)
+
+        for definition, compiled in zip(tileset.__root__, compiled_tileset):
+            assert compiled.description == definition.description
+            assert compiled.blocks == definition.blocks
+            assert (compiled.bmp_width, compiled.bmp_height) == (definition.bmp_width, definition.bmp_height)
+            assert compiled.orientation == GeneratorType(definition.orientation)
+            assert compiled.ending == EndType(definition.ending)
+            assert compiled.is_4byte == definition.is_4byte
+            assert compiled.get_warnings() == definition.get_warnings()
+
+
+def test_compiled_enemy_definitions():
+    # GIVEN the parsed enemy definitions
+    definitions = get_enemy_metadata().__root__
+
+    # WHEN they are compiled
+    compiled_definitions = get_compiled_enemy_definitions()
+
+    # THEN every definition describes the same enemy, including what is derived from it
+    assert len(compiled_definitions) == len(definitions)
+
+    for definition, compiled in zip(definitions, compiled_definitions):
+        assert compiled.description == definition.description
+        assert [sprite.index for sprite in compiled.sprites] == [sprite.index for sprite in definition.sprites]
+        assert compiled.suggested_icon_width == definition.suggested_icon_width
+        assert compiled.suggested_icon_x_offset == definition.suggested_icon_x_offset
+        assert compiled.get_warnings() == definition.get_warnings()
@@ -0,0 +1,69 @@
+import pydantic.main
+from pydantic import BaseModel
+from pydantic.main import validate_model
+
+from foundry.game.Definitions import load_definitions
+
+
+class Numbers(BaseModel):
+    __root__: list[int]
+
+
+def test_definitions_are_cached(tmp_path, monkeypatch):
+    # GIVEN a JSON file, an empty cache directory and a model, which counts how often it is validated
+    source = tmp_path / "numbers.json"
+    source.write_text("[1, 2, 3]")
+
+    cache_dir = tmp_path / "cache"
+    cache_dir.mkdir()
+
+    validations = []
+
+    def counting_validate_model(*args, **kwargs):
+        validations.append(args[0])
+
+        return validate_model(*args, **kwargs)
+
+    monkeypatch.setattr(pydantic.main, "validate_model", counting_validate_model)
+
+    # WHEN the file is loaded
+    numbers = load_definitions(source, Numbers, cache_dir)
+
+    # THEN it was validated and cached
+    assert numbers.__root__ == [1, 2, 3]
+    assert validations == [Numbers]
+    assert (cache_dir / "numbers.pickle").exists()
+
+    # WHEN it is loaded again
+    validations.clear()
+
+    # THEN the same model is loaded from the cache, without validating it again
+    assert load_definitions(source, Numbers, cache_dir) == numbers
+    assert validations == []
+
+
+def test_changed_definitions_are_parsed_again(tmp_path):
+    # GIVEN a JSON file, which was loaded and cached before
+    source = tmp_path / "numbers.json"
+    source.write_text("[1, 2, 3]")
+
+    load_definitions(source, Numbers, tmp_path)
+
+    # WHEN the file changes
+    source.write_text("[4, 5]")
+
+    # THEN the changed file is parsed, instead of loading the outdated cache
+    assert load_definitions(source, Numbers, tmp_path).__root__ == [4, 5]
+
+
+def test_broken_cache_is_replaced(tmp_path):
+    # GIVEN a JSON file and a broken cache file for it
+    source = tmp_path / "numbers.json"
+    source.write_text("[1, 2, 3]")
+
+    (tmp_path / "numbers.pickle").write_bytes(b"not a pickle")
+
+    # WHEN the file is loaded
+    # THEN it is parsed and the cache is usable again
+    assert load_definitions(source, Numbers, tmp_path).__root__ == [1, 2, 3]
+    assert load_definitions(source, Numbers, tmp_path).__root__ == [1, 2, 3]
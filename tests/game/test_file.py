@@ -2,7 +2,13 @@ from hypothesis import given
 from hypothesis.strategies import booleans, builds, integers
 from pytest import fixture, raises
 
-from foundry.game.File import ROM, INESHeader, InvalidINESHeader
+from foundry.game.File import (
+    CHANGE_CHUNK_SIZE,
+    ROM,
+    INESHeader,
+    InvalidINESHeader,
+    RomChanges,
+)
 
 
 @fixture
@@ -215,3 +221,60 @@ def test_bulk_write_global_program_bank(rom_singleton: ROM):
 def test_bulk_write_end(rom_singleton: ROM):
     rom_singleton.bulk_write(bytearray([0] * 0x10), 0x3FFFF)
     assert bytes([0] * 0x10) == rom_singleton.bulk_read(0x10, 0x3FFFF)
+
+
+def test_rom_changes_version_of_written_range():
+    changes = RomChanges()
+    changes.reset(0x1000)
+    version = changes.version_of(0, 0x1000)
+
+    changes.record(0x200, 0x10)
+
+    assert version < changes.version_of(0x200, 0x10)
+    assert version < changes.version_of(0, 0x1000)
+    assert version == changes.version_of(0x200 + CHANGE_CHUNK_SIZE, 0x10)
+
+
+def test_rom_changes_subscription():
+    changes = RomChanges()
+    writes = []
+    subscription = changes.subscribe(lambda position, count: writes.append((position, count)), 0x100, 0x100)
+
+    changes.record(0x80, 0x10)
+    changes.record(0x1F0, 0x20)
+    changes.reset(0x1000)
+    changes.unsubscribe(subscription)
+    changes.record(0x100, 0x10)
+
+    assert [(0x1F0, 0x20), (0, 0x1000)] == writes
+
+
+def test_bulk_write_changes_version(rom_singleton: ROM):
+    version = ROM.changes.version_of(0x2010, 0x10)
+    writes = []
+    subscription = ROM.changes.subscribe(lambda position, count: writes.append((position, count)), 0x2010, 0x10)
+
+    rom_singleton.bulk_write(bytearray([0] * 0x10), 0x2010)
+    ROM.changes.unsubscribe(subscription)
+
+    assert version < ROM.changes.version_of(0x2010, 0x10)
+    assert [(0x2010, 0x10)] == writes
+
+
+def test_tsa_table_is_shared(rom_singleton: ROM):
+    tsa_table = ROM.get_tsa_table(1)
+
+    assert tsa_table is ROM.get_tsa_table(1)
+    assert bytes(ROM.get_tsa_data(1)) == tsa_table
+
+
+def test_write_tsa_data_updates_tsa_table(rom_singleton: ROM):
+    tsa_table = ROM.get_tsa_table(1)
+    other_tsa_table = ROM.get_tsa_table(2)
+    tsa_data = bytearray(tsa_table)
+    tsa_data[0] ^= 0xFF
+
+    ROM.write_tsa_data(1, tsa_data)
+
+    assert bytes(tsa_data) == ROM.get_tsa_table(1)
+    assert other_tsa_table is ROM.get_tsa_table(2)
@@ -1,6 +1,6 @@
 import pytest
-from PySide6.QtCore import QPoint
-from PySide6.QtGui import Qt, QWheelEvent
+from PySide6.QtCore import QPoint, QRect
+from PySide6.QtGui import QImage, QPainter, Qt, QWheelEvent
 
 from foundry.game.gfx.objects.LevelObject import LevelObject
 from foundry.gui.HeaderEditor import HeaderEditor
@@ -111,3 +111,27 @@ def test_wheel_event(scroll_amount, coordinates, wheel_delta, type_change, main_
     new_type = level_view.object_at(*coordinates).type
 
     assert new_type == original_type + type_change, (original_type, new_type)
+
+
+def _draw_level(level_view: LevelView, clip=None) -> QImage:
+    image = QImage(level_view.size(), QImage.Format_RGB888)
+    image.fill(Qt.magenta)
+
+    painter = QPainter(image)
+    level_view.level_drawer.draw(painter, level_view.level_ref.level, clip)
+    painter.end()
+
+    return image
+
+
+@pytest.mark.parametrize("clip", [QRect(0, 0, 16, 16), QRect(200, 300, 150, 90), QRect(517, 11, 33, 500)])
+def test_draw_clipped(level_view, clip):
+    # GIVEN a level view and its level drawn in full
+    level_view.level_drawer.draw_grid = True
+    full_image = _draw_level(level_view)
+
+    # WHEN only a part of the level is drawn
+    clipped_image = _draw_level(level_view, clip)
+
+    # THEN that part is identical to the full drawing
+    assert clipped_image.copy(clip) == full_image.copy(clip)
@@ -0,0 +1,104 @@
+from PySide6.QtCore import QRect
+from PySide6.QtGui import QImage, QPainter, QPixmap, Qt
+
+from foundry.game.gfx.objects.LevelObject import SCREEN_WIDTH
+from foundry.gui.LevelDrawer import LevelDrawer
+from foundry.gui.ScreenCache import ScreenCache
+
+
+def _draw(draw_function, level, clip=None) -> QImage:
+    image = QImage(level.width * 16, level.height * 16, QImage.Format_ARGB32_Premultiplied)
+    image.fill(Qt.magenta)
+
+    painter = QPainter(image)
+    draw_function(painter, level, clip)
+    painter.end()
+
+    return image
+
+
+def test_draw_like_level_drawer(level):
+    # GIVEN a screen cache and a level drawer
+    drawer = LevelDrawer()
+    drawer.draw_grid = True
+    cache = ScreenCache(drawer)
+
+    # WHEN the level is drawn by both, partially and as a whole
+    for clip in [None, QRect(100, 50, 300, 200), None]:
+        # THEN the results are identical
+        assert _draw(cache.draw, level, clip) == _draw(drawer.draw, level, clip)
+
+
+def test_only_changed_screens_are_discarded(level):
+    # GIVEN a screen cache, which has every screen of the level cached
+    drawer = LevelDrawer()
+    cache = ScreenCache(drawer)
+
+    _draw(cache.draw, level)
+    screen_count = len(cache)
+
+    # WHEN an object is added in the middle of the last screen and only the first screen is drawn
+    level.add_object(0, 0x00, level.width - SCREEN_WIDTH // 2, 10, None)
+    _draw(cache.draw, level, QRect(0, 0, SCREEN_WIDTH * drawer.block_length, 1))
+
+    # THEN only the last screen was discarded
+    assert len(cache) == screen_count - 1
+
+    # THEN drawing the level still works as expected
+    assert _draw(cache.draw, level) == _draw(drawer.draw, level)
+
+
+def test_object_added_in_front_only_discards_its_screen(level):
+    # GIVEN a screen cache, which has every screen of the level cached
+    drawer = LevelDrawer()
+    cache = ScreenCache(drawer)
+
+    _draw(cache.draw, level)
+    screen_count = len(cache)
+
+    # WHEN an object is added as the first object of the level, in the middle of the last screen
+    level.add_object(0, 0x00, level.width - SCREEN_WIDTH // 2, 10, None, 0)
+    _draw(cache.draw, level, QRect(0, 0, SCREEN_WIDTH * drawer.block_length, 1))
+
+    # THEN only the last screen was discarded, even though every other object moved back by one
+    assert len(cache) == screen_count - 1
+
+    # THEN drawing the level still works as expected
+    assert _draw(cache.draw, level) == _draw(drawer.draw, level)
+
+
+def test_header_change_discards_every_screen(level):
+    # GIVEN a screen cache, which has every screen of the level cached
+    drawer = LevelDrawer()
+    cache = ScreenCache(drawer)
+
+    _draw(cache.draw, level)
+
+    # WHEN the palette of the objects is changed in the header and only the first screen is drawn
+    level.object_palette_index = (level.object_palette_index + 1) % 4
+    _draw(cache.draw, level, QRect(0, 0, SCREEN_WIDTH * drawer.block_length, 1))
+
+    # THEN every other screen was discarded
+    assert len(cache) == 1
+
+    # THEN drawing the level still works as expected
+    assert _draw(cache.draw, level) == _draw(drawer.draw, level)
+
+
+def test_byte_budget(level):
+    # GIVEN a screen cache, that fits only two screens
+    drawer = LevelDrawer()
+    screen_size_in_bytes = (
+        SCREEN_WIDTH * drawer.block_length * level.height * drawer.block_length * QPixmap.defaultDepth() // 8
+    )
+    cache = ScreenCache(drawer, 2 * screen_size_in_bytes)
+
+    # WHEN the whole level is drawn
+    image = _draw(cache.draw, level)
+
+    # THEN the least recently used screens were discarded
+    assert len(cache) == 2
+    assert cache.size_in_bytes <= cache.byte_budget
+
+    # THEN the level was drawn completely nonetheless
+    assert image == _draw(drawer.draw, level)
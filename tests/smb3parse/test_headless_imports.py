@@ -0,0 +1,54 @@
+import subprocess
+import sys
+
+import pytest
+
+
+@pytest.mark.parametrize(
+    "module",
+    [
+        "foundry.smb3parse.levels.world_map",
+        "foundry.game.File",
+        "foundry.game.ObjectSet",
+        "foundry.game.EnemyDefinitions",
+        "foundry.game.level.LevelDataCursor",
+        "foundry.core.palette.PaletteGroup",
+        "foundry.game.gfx.objects.BlockGenerator",
+        "foundry.game.level.rasterize",
+    ],
+)
+def test_parsing_does_not_import_qt(module):
+    # GIVEN a module of the parsing layer
+    # WHEN it is imported in a fresh interpreter and the definitions are loaded
+    code = (
+        f"import sys, {module}\n"
+        "from foundry.game.ObjectDefinitions import get_compiled_object_definitions\n"
+        "get_compiled_object_definitions()\n"
+        "print(any(name.startswith('PySide6') for name in sys.modules))"
+    )
+
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+
+    # THEN Qt was not imported
+    assert result.stdout.strip() == "False"
+
+
+@pytest.mark.parametrize("command", ["render-all", "validate"])
+def test_commands_do_not_import_the_editor(command):
+    # GIVEN a command of foundry, which works without the editor
+    # WHEN it is run in a fresh interpreter
+    code = (
+        "import sys\n"
+        f"sys.argv = ['foundry', '{command}', '--help']\n"
+        "from foundry.cli import start\n"
+        "try:\n"
+        "    start()\n"
+        "except SystemExit:\n"
+        "    pass\n"
+        "print(any(name.startswith(('PySide6.QtWidgets', 'foundry.gui')) for name in sys.modules))"
+    )
+
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+
+    # THEN neither the widgets of Qt nor the editor were imported
+    assert result.stdout.strip().splitlines()[-1] == "False"
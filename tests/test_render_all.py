@@ -0,0 +1,27 @@
+from foundry.game.File import ROM
+from foundry.game.level.Level import Level
+from foundry.game.level.util import get_world_levels
+from foundry.render_all import RenderOptions, render_levels
+
+
+def test_render_levels(rom_singleton, tmp_path):
+    # GIVEN the first levels of world 1
+    levels = get_world_levels(1, Level.offsets)[:2]
+
+    # WHEN they are rendered with a zoom
+    results = list(render_levels(ROM.path, tmp_path, levels, RenderOptions(zoom=2), workers=1))
+
+    # THEN an image was written for every level
+    assert [result.error for result in results] == [None, None]
+    assert all(result.path.exists() for result in results)
+
+
+def test_render_levels_skips_world_maps(rom_singleton, tmp_path):
+    # GIVEN the world maps
+    world_maps = get_world_levels(0, Level.offsets)
+
+    # WHEN they are rendered
+    results = list(render_levels(ROM.path, tmp_path, world_maps, workers=1))
+
+    # THEN nothing was rendered
+    assert results == []
@@ -0,0 +1,64 @@
+import json
+from xml.etree import ElementTree
+
+from foundry.game.File import ROM
+from foundry.game.level.Level import Level
+from foundry.game.level.util import get_world_levels
+from foundry.validate import (
+    LevelReport,
+    _save_problems,
+    to_json,
+    to_junit,
+    validate_levels,
+)
+
+clean_report = LevelReport("World 1 - Level 1", 0x1FB92, 0xC538, [], [])
+warned_report = LevelReport("World 1 - Level 2", 0x20F3A, 0xC6BB, ["Something is wrong"], [])
+broken_report = LevelReport("World 1 - Level 3", 0x1A587, 0xC1A0, [], ["The objects overwrite the data of 'X'."])
+
+
+def test_validate_levels(rom_singleton):
+    # GIVEN the levels of world 1 of the unchanged game
+    levels = get_world_levels(1, Level.offsets)
+
+    # WHEN they are validated
+    reports = list(validate_levels(ROM.path, levels, workers=1))
+
+    # THEN every level could be loaded and none overwrites another
+    assert reports
+    assert not any(report.failed() for report in reports)
+
+
+def test_to_json():
+    # GIVEN reports of a clean level, a level with warnings and a level with problems
+    reports = [clean_report, warned_report, broken_report]
+
+    # WHEN they are written as JSON
+    summary = json.loads(to_json(reports))["summary"]
+
+    # THEN only the level with problems failed
+    assert summary == {"levels": 3, "failed": 1, "warnings": 1, "problems": 1, "errors": 0}
+
+
+def test_to_junit_strict():
+    # GIVEN reports of a clean level, a level with warnings and a level with problems
+    reports = [clean_report, warned_report, broken_report]
+
+    # WHEN they are written as a strict JUnit report
+    suite = ElementTree.fromstring(to_junit(reports, strict=True))
+
+    # THEN the warnings failed their level as well
+    assert suite.get("tests") == "3"
+    assert suite.get("failures") == "2"
+    assert [case.find("failure") is not None for case in suite.iter("testcase")] == [False, True, True]
+
+
+def test_too_many_objects_are_a_problem(level):
+    # GIVEN a level, which has more objects than fit into the space it has in the ROM
+    level.object_size_on_disk = level.current_object_size() - 1
+
+    # WHEN it is checked for problems
+    problems = _save_problems(level)
+
+    # THEN it is not safe to save
+    assert "Too many level objects." in problems